@@ -9,16 +9,29 @@ This agent can operate in two modes:
 
 import os
 import sys
+import json
+import random
 import asyncio
 import signal
 import socket
 import subprocess
+import time
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import httpx
 import structlog
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 # Add parent directory to path for shared imports
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -32,6 +45,104 @@ from shared.crypto import setup_ssl_context, get_local_ip
 
 from firewalld_manager import FirewalldManager
 
+# How often the cached local IP address is re-resolved (DHCP changes)
+IP_REFRESH_INTERVAL = 300
+
+# Maps config.yaml sections to AgentConfig fields: field -> (yaml key, default)
+_CONFIG_SCHEMA = {
+    'server': {
+        'server_url': ('url', 'https://localhost:8000'),
+        'mode': ('mode', 'pull'),
+        'poll_interval': ('poll_interval', 30),
+    },
+    'agent': {
+        'agent_id': ('agent_id', None),
+        'hostname': ('hostname', None),
+        'listen_host': ('listen_host', '0.0.0.0'),
+        'listen_port': ('listen_port', 9000),
+    },
+    'security': {
+        'ssl_cert_path': ('ssl_cert_path', './certs/agent.crt'),
+        'ssl_key_path': ('ssl_key_path', './certs/agent.key'),
+        'ca_cert_path': ('ca_cert_path', './certs/ca.crt'),
+    },
+    'timeouts': {
+        'connection_timeout': ('connection_timeout', 10),
+        'max_retries': ('max_retries', 3),
+        'retry_delay': ('retry_delay', 5),
+    },
+    'firewalld': {
+        'firewalld_reload_timeout': ('reload_timeout', 30),
+    },
+    'logging': {
+        'log_level': ('log_level', 'INFO'),
+        'log_file': ('log_file', '/var/log/firewalld-agent.log'),
+    },
+}
+
+# Command types that change firewalld state and must not run concurrently.
+# reload takes the lock itself once its debounce window has passed.
+_MUTATING_COMMANDS = frozenset({"apply_configuration", "add_rule", "remove_rule"})
+
+# Largest request body the push-mode API will accept
+MAX_PUSH_BODY_SIZE = 1_000_000
+
+# Reload requests arriving within this many seconds share a single reload
+RELOAD_DEBOUNCE = 0.1
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _atomic_write(path: str, data: str, mode: int = 0o644) -> None:
+    """Write a file via a synced temporary file so readers never see a partial write."""
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        os.write(fd, data.encode("utf-8"))
+        os.fsync(fd)
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp_path)
+        raise
+    os.close(fd)
+    os.replace(tmp_path, path)
+
+
+if msgspec is not None:
+    class AgentCommandStruct(msgspec.Struct):
+        """Pushed command decoded straight from JSON, without pydantic."""
+        command_id: str
+        agent_id: str
+        command_type: str
+        parameters: Dict[str, Any]
+        timeout: int = 30
+
+
+def _decode_command(body: bytes) -> Any:
+    """
+    Decode a pushed command body.
+    
+    Uses msgspec when it is installed, otherwise pydantic's JSON parser.
+    Both raise a ValueError subclass on malformed or invalid input.
+    """
+    if msgspec is not None:
+        return msgspec.json.decode(body, type=AgentCommandStruct)
+    return AgentCommand.model_validate_json(body)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class FirewalldAgent:
     """Main agent class for firewalld management."""
@@ -41,9 +152,44 @@ class FirewalldAgent:
         self.config = self._load_config()
         self.logger = get_logger("tuxsec_agent")
         self.firewalld = FirewalldManager()
-        self.running = False
+        self._stop = asyncio.Event()
+        self._backoff = 1.0
+        # Set once the server turns out not to have the combined poll endpoint
+        self._legacy_poll = False
         self.agent_id = self._get_agent_id()
         self.ssl_context = None
+        self._tls_files_present = False
+        self._handlers = {
+            "apply_configuration": self._handle_apply,
+            "get_status": self._handle_status,
+            "reload": self._handle_reload,
+            "add_rule": self._handle_add_rule,
+            "remove_rule": self._handle_remove_rule,
+        }
+        self._fwd_mut_lock = asyncio.Lock()
+        self._pending_reload: Optional[asyncio.Future] = None
+        self._http: Optional[httpx.AsyncClient] = None
+        
+        # Host facts are constant for the life of the process; the IP address
+        # is re-resolved periodically in case the lease changes.
+        self._hostname = socket.gethostname()
+        self._ip = get_local_ip()
+        self._ip_resolved_at = time.monotonic()
+        self._os_info = self._get_os_info()
+        self._fwd_version = "unknown"  # filled in by start()
+        
+        # Everything in the heartbeat except last_seen is static, so skip
+        # building and validating an AgentInfo model on every poll.
+        self._heartbeat_template = {
+            "agent_id": self.agent_id,
+            "hostname": self._hostname,
+            "ip_address": self._ip,
+            "mode": self.config.mode,
+            "status": AgentStatus.ONLINE.value,
+            "version": "1.0.0",
+            "operating_system": self._os_info,
+            "firewalld_version": self._fwd_version,
+        }
         
         # Setup logging
         setup_logging(
@@ -58,48 +204,15 @@ class FirewalldAgent:
         """Load agent configuration."""
         yaml_config = load_yaml_config(self.config_path)
         
-        # Flatten nested configuration
+        # Flatten nested configuration. Sections missing from the file are
+        # skipped so AgentConfig's own defaults and environment apply.
         config_dict = {}
-        
-        # Server section
-        if 'server' in yaml_config:
-            server = yaml_config['server']
-            config_dict['server_url'] = server.get('url', 'https://localhost:8000')
-            config_dict['mode'] = server.get('mode', 'pull')
-            config_dict['poll_interval'] = server.get('poll_interval', 30)
-        
-        # Agent section
-        if 'agent' in yaml_config:
-            agent = yaml_config['agent']
-            config_dict['agent_id'] = agent.get('agent_id')
-            config_dict['hostname'] = agent.get('hostname')
-            config_dict['listen_host'] = agent.get('listen_host', '0.0.0.0')
-            config_dict['listen_port'] = agent.get('listen_port', 9000)
-        
-        # Security section
-        if 'security' in yaml_config:
-            security = yaml_config['security']
-            config_dict['ssl_cert_path'] = security.get('ssl_cert_path', './certs/agent.crt')
-            config_dict['ssl_key_path'] = security.get('ssl_key_path', './certs/agent.key')
-            config_dict['ca_cert_path'] = security.get('ca_cert_path', './certs/ca.crt')
-        
-        # Timeouts section
-        if 'timeouts' in yaml_config:
-            timeouts = yaml_config['timeouts']
-            config_dict['connection_timeout'] = timeouts.get('connection_timeout', 10)
-            config_dict['max_retries'] = timeouts.get('max_retries', 3)
-            config_dict['retry_delay'] = timeouts.get('retry_delay', 5)
-        
-        # Firewalld section
-        if 'firewalld' in yaml_config:
-            firewalld = yaml_config['firewalld']
-            config_dict['firewalld_reload_timeout'] = firewalld.get('reload_timeout', 30)
-        
-        # Logging section
-        if 'logging' in yaml_config:
-            logging = yaml_config['logging']
-            config_dict['log_level'] = logging.get('log_level', 'INFO')
-            config_dict['log_file'] = logging.get('log_file', '/var/log/firewalld-agent.log')
+        for section_name, fields in _CONFIG_SCHEMA.items():
+            section = yaml_config.get(section_name)
+            if section is None:
+                continue
+            for key, (yaml_key, default) in fields.items():
+                config_dict[key] = section.get(yaml_key, default)
         
         return AgentConfig(**config_dict)
     
@@ -113,9 +226,8 @@ class FirewalldAgent:
         try:
             # Get MAC address of first network interface
             import uuid
-            mac = ':'.join(['{:02x}'.format((uuid.getnode() >> elements) & 0xff) 
-                           for elements in range(0,2*6,2)][::-1])
-            agent_id = f"{hostname}-{mac.replace(':', '')[:8]}"
+            mac_hex = uuid.getnode().to_bytes(6, 'big').hex()
+            agent_id = f"{hostname}-{mac_hex[:8]}"
         except:
             agent_id = f"{hostname}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
         
@@ -123,11 +235,16 @@ class FirewalldAgent:
     
     def _setup_ssl(self) -> None:
         """Setup SSL context for secure communication."""
-        if os.path.exists(self.config.ssl_cert_path) and os.path.exists(self.config.ssl_key_path):
+        cert_ok = os.path.isfile(self.config.ssl_cert_path)
+        key_ok = os.path.isfile(self.config.ssl_key_path)
+        ca_ok = os.path.isfile(self.config.ca_cert_path)
+        self._tls_files_present = cert_ok and key_ok
+        
+        if self._tls_files_present:
             self.ssl_context = setup_ssl_context(
                 self.config.ssl_cert_path,
                 self.config.ssl_key_path,
-                self.config.ca_cert_path if os.path.exists(self.config.ca_cert_path) else None
+                self.config.ca_cert_path if ca_ok else None
             )
             self.logger.info("SSL context configured")
         else:
@@ -137,35 +254,35 @@ class FirewalldAgent:
         """Register this agent with the central server."""
         try:
             registration_data = {
-                "hostname": socket.gethostname(),
-                "ip_address": get_local_ip(),
+                "hostname": self._hostname,
+                "ip_address": self._get_ip_address(),
                 "mode": self.config.mode,
                 "agent_id": self.agent_id
             }
             
-            async with httpx.AsyncClient(verify=False, timeout=self.config.connection_timeout) as client:
-                response = await client.post(
-                    f"{self.config.server_url}/api/agents/register",
-                    json=registration_data
-                )
+            response = await self._http.post(
+                "/api/agents/register",
+                content=_json_dumps(registration_data),
+                headers=_JSON_HEADERS
+            )
+            
+            if response.status_code == 200:
+                result = _json_loads(response.content)
+                self.logger.info("Successfully registered with server", 
+                               agent_id=self.agent_id,
+                               server_response=result)
+                
+                # Save any certificates or configuration returned by server
+                if "certificate" in result.get("data", {}):
+                    await self._save_certificate(result["data"]["certificate"])
+                
+                return True
+            else:
+                self.logger.error("Failed to register with server",
+                                status_code=response.status_code,
+                                response=response.text)
+                return False
                 
-                if response.status_code == 200:
-                    result = response.json()
-                    self.logger.info("Successfully registered with server", 
-                                   agent_id=self.agent_id,
-                                   server_response=result)
-                    
-                    # Save any certificates or configuration returned by server
-                    if "certificate" in result.get("data", {}):
-                        await self._save_certificate(result["data"]["certificate"])
-                    
-                    return True
-                else:
-                    self.logger.error("Failed to register with server",
-                                    status_code=response.status_code,
-                                    response=response.text)
-                    return False
-                    
         except Exception as e:
             self.logger.error("Error registering with server", error=str(e))
             return False
@@ -175,44 +292,62 @@ class FirewalldAgent:
         cert_dir = os.path.dirname(self.config.ssl_cert_path)
         os.makedirs(cert_dir, exist_ok=True)
         
+        writes = []
         if "certificate" in cert_data:
-            with open(self.config.ssl_cert_path, 'w') as f:
-                f.write(cert_data["certificate"])
-        
+            writes.append((self.config.ssl_cert_path, cert_data["certificate"], 0o644))
         if "private_key" in cert_data:
-            with open(self.config.ssl_key_path, 'w') as f:
-                f.write(cert_data["private_key"])
-            os.chmod(self.config.ssl_key_path, 0o600)
-        
+            writes.append((self.config.ssl_key_path, cert_data["private_key"], 0o600))
         if "ca_certificate" in cert_data:
-            with open(self.config.ca_cert_path, 'w') as f:
-                f.write(cert_data["ca_certificate"])
+            writes.append((self.config.ca_cert_path, cert_data["ca_certificate"], 0o644))
+        
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(None, _atomic_write, path, data, mode)
+            for path, data, mode in writes
+        ))
         
         self.logger.info("Certificates saved successfully")
     
+    def _get_ip_address(self) -> str:
+        """Return the local IP address, re-resolving it every few minutes."""
+        now = time.monotonic()
+        if now - self._ip_resolved_at >= IP_REFRESH_INTERVAL:
+            self._ip = get_local_ip()
+            self._ip_resolved_at = now
+            self._heartbeat_template["ip_address"] = self._ip
+        return self._ip
+    
+    def _heartbeat_payload(self) -> bytes:
+        """Serialize the heartbeat from the static template."""
+        self._get_ip_address()
+        payload = {**self._heartbeat_template, "last_seen": datetime.now().isoformat()}
+        return _json_dumps(payload)
+    
+    def _build_agent_info(self, mode: Optional[AgentMode] = None) -> AgentInfo:
+        """Build the heartbeat payload for this agent."""
+        return AgentInfo(
+            agent_id=self.agent_id,
+            hostname=self._hostname,
+            ip_address=self._get_ip_address(),
+            mode=mode or AgentMode(self.config.mode),
+            status=AgentStatus.ONLINE,
+            last_seen=datetime.now(),
+            version="1.0.0",
+            operating_system=self._os_info,
+            firewalld_version=self._fwd_version
+        )
+    
     async def send_heartbeat(self) -> bool:
         """Send heartbeat to server."""
         try:
-            agent_info = AgentInfo(
-                agent_id=self.agent_id,
-                hostname=socket.gethostname(),
-                ip_address=get_local_ip(),
-                mode=AgentMode(self.config.mode),
-                status=AgentStatus.ONLINE,
-                last_seen=datetime.now(),
-                version="1.0.0",
-                operating_system=self._get_os_info(),
-                firewalld_version=self.firewalld.get_version()
+            response = await self._http.post(
+                f"/api/agents/{self.agent_id}/heartbeat",
+                content=self._heartbeat_payload(),
+                headers=_JSON_HEADERS
             )
             
-            async with httpx.AsyncClient(verify=False, timeout=self.config.connection_timeout) as client:
-                response = await client.post(
-                    f"{self.config.server_url}/api/agents/{self.agent_id}/heartbeat",
-                    json=agent_info.model_dump(mode='json')
-                )
-                
-                return response.status_code == 200
-                
+            return response.status_code == 200
+            
         except Exception as e:
             self.logger.error("Error sending heartbeat", error=str(e))
             return False
@@ -228,63 +363,84 @@ class FirewalldAgent:
     async def check_for_commands(self) -> List[AgentCommand]:
         """Check for pending commands from the server."""
         try:
-            async with httpx.AsyncClient(verify=False, timeout=self.config.connection_timeout) as client:
-                response = await client.post(
-                    f"{self.config.server_url}/api/agents/{self.agent_id}/checkin"
-                )
+            response = await self._http.post(f"/api/agents/{self.agent_id}/checkin")
+            
+            if response.status_code == 200:
+                data = _json_loads(response.content)
+                commands = []
+                for cmd_data in data.get("commands", []):
+                    commands.append(AgentCommand(**cmd_data))
+                return commands
+            else:
+                return []
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    commands = []
-                    for cmd_data in data.get("commands", []):
-                        commands.append(AgentCommand(**cmd_data))
-                    return commands
-                else:
-                    return []
-                    
         except Exception as e:
             self.logger.error("Error checking for commands", error=str(e))
             return []
     
+    async def poll(self) -> List[AgentCommand]:
+        """
+        Send a heartbeat and fetch pending commands in a single request.
+        
+        Transport errors and 5xx responses are raised rather than treated
+        as "no commands", so pull_mode_loop backs off while the server is
+        unreachable. Servers without the poll endpoint get the separate
+        heartbeat and check-in requests instead, from then on.
+        """
+        if self._legacy_poll:
+            return await self._poll_legacy()
+        
+        response = await self._http.post(
+            f"/api/agents/{self.agent_id}/poll",
+            content=self._heartbeat_payload(),
+            headers=_JSON_HEADERS
+        )
+        
+        if response.status_code in (404, 405):
+            self.logger.warning("Server has no poll endpoint, using heartbeat and check-in requests")
+            self._legacy_poll = True
+            return await self._poll_legacy()
+        return self._commands_from(response)
+    
+    async def _poll_legacy(self) -> List[AgentCommand]:
+        """Heartbeat and command check-in as two requests, for servers without /poll."""
+        await self.send_heartbeat()
+        response = await self._http.post(f"/api/agents/{self.agent_id}/checkin")
+        return self._commands_from(response)
+    
+    def _commands_from(self, response: httpx.Response) -> List[AgentCommand]:
+        """Parse the commands in a poll or check-in response; raises on 5xx."""
+        if response.status_code >= 500:
+            response.raise_for_status()
+        if response.status_code != 200:
+            self.logger.error("Poll rejected by server",
+                            status_code=response.status_code)
+            return []
+        
+        data = _json_loads(response.content)
+        return [AgentCommand(**cmd_data) for cmd_data in data.get("commands", [])]
+    
     async def execute_command(self, command: AgentCommand) -> CommandResult:
         """Execute a command and return the result."""
-        self.logger.info("Executing command", 
-                        command_id=command.command_id,
-                        command_type=command.command_type)
+        self.logger.debug("Executing command", 
+                         command_id=command.command_id,
+                         command_type=command.command_type)
+        
+        handler = self._handlers.get(command.command_type)
+        if handler is None:
+            return CommandResult(
+                command_id=command.command_id,
+                agent_id=self.agent_id,
+                success=False,
+                error=f"Unknown command type: {command.command_type}"
+            )
         
         try:
-            result_data = None
-            
-            if command.command_type == "apply_configuration":
-                config = FirewallConfiguration(**command.parameters)
-                success = await self.firewalld.apply_configuration(config)
-                result_data = {"applied": success}
-                
-            elif command.command_type == "get_status":
-                result_data = await self.firewalld.get_status()
-                success = True
-                
-            elif command.command_type == "reload":
-                success = await self.firewalld.reload()
-                result_data = {"reloaded": success}
-                
-            elif command.command_type == "add_rule":
-                zone = command.parameters.get("zone")
-                rule_type = command.parameters.get("rule_type")
-                rule_data = command.parameters.get("rule_data")
-                success = await self.firewalld.add_rule(zone, rule_type, rule_data)
-                result_data = {"rule_added": success}
-                
-            elif command.command_type == "remove_rule":
-                zone = command.parameters.get("zone")
-                rule_type = command.parameters.get("rule_type")
-                rule_data = command.parameters.get("rule_data")
-                success = await self.firewalld.remove_rule(zone, rule_type, rule_data)
-                result_data = {"rule_removed": success}
-                
+            if command.command_type in _MUTATING_COMMANDS:
+                async with self._fwd_mut_lock:
+                    result_data, success = await handler(command.parameters)
             else:
-                success = False
-                result_data = {"error": f"Unknown command type: {command.command_type}"}
+                result_data, success = await handler(command.parameters)
             
             return CommandResult(
                 command_id=command.command_id,
@@ -305,86 +461,167 @@ class FirewalldAgent:
                 error=str(e)
             )
     
+    async def _handle_apply(self, parameters: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """Apply a complete firewall configuration."""
+        config = FirewallConfiguration(**parameters)
+        success = await self.firewalld.apply_configuration(config)
+        return {"applied": success}, success
+    
+    async def _handle_status(self, parameters: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """Return the current firewall status."""
+        return await self.firewalld.get_status(), True
+    
+    async def _handle_reload(self, parameters: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """Reload firewalld."""
+        success = await self._coalesced_reload()
+        return {"reloaded": success}, success
+    
+    async def _coalesced_reload(self) -> bool:
+        """Reload firewalld, sharing one reload among requests that arrive together."""
+        if self._pending_reload is None:
+            self._pending_reload = asyncio.ensure_future(self._debounced_reload())
+        # Shield so one cancelled caller does not cancel the reload for the rest
+        return await asyncio.shield(self._pending_reload)
+    
+    async def _debounced_reload(self) -> bool:
+        await asyncio.sleep(RELOAD_DEBOUNCE)
+        # Anything requested from here on needs a reload of its own
+        self._pending_reload = None
+        async with self._fwd_mut_lock:
+            return await self.firewalld.reload()
+    
+    async def _handle_add_rule(self, parameters: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """Add a single rule to a zone."""
+        success = await self.firewalld.add_rule(
+            parameters.get("zone"), parameters.get("rule_type"), parameters.get("rule_data")
+        )
+        return {"rule_added": success}, success
+    
+    async def _handle_remove_rule(self, parameters: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """Remove a single rule from a zone."""
+        success = await self.firewalld.remove_rule(
+            parameters.get("zone"), parameters.get("rule_type"), parameters.get("rule_data")
+        )
+        return {"rule_removed": success}, success
+    
     async def send_command_result(self, result: CommandResult) -> bool:
         """Send command result back to server."""
         try:
-            async with httpx.AsyncClient(verify=False, timeout=self.config.connection_timeout) as client:
-                response = await client.post(
-                    f"{self.config.server_url}/api/commands/{result.command_id}/result",
-                    json=result.model_dump(mode='json')
-                )
-                
-                return response.status_code == 200
-                
+            response = await self._http.post(
+                f"/api/commands/{result.command_id}/result",
+                content=_json_dumps(result.model_dump(mode='json')),
+                headers=_JSON_HEADERS
+            )
+            
+            return response.status_code == 200
+            
         except Exception as e:
             self.logger.error("Error sending command result", error=str(e))
             return False
     
     async def pull_mode_loop(self) -> None:
         """Main loop for pull mode operation."""
-        self.logger.info("Starting pull mode loop")
+        self.logger.debug("Starting pull mode loop")
         
         # Initial registration
         if not await self.register_with_server():
             self.logger.error("Failed to register with server, exiting")
             return
         
-        while self.running:
+        while not self._stop.is_set():
             try:
-                # Send heartbeat
-                await self.send_heartbeat()
+                # Heartbeat and command check-in share one round trip
+                commands = await self.poll()
+                
+                # Execute commands in order; firewalld changes must not interleave
+                results = [await self.execute_command(command) for command in commands]
                 
-                # Check for commands
-                commands = await self.check_for_commands()
+                # Result uploads are independent and can overlap
+                if results:
+                    await asyncio.gather(
+                        *(self.send_command_result(result) for result in results),
+                        return_exceptions=True
+                    )
                 
-                # Execute commands
-                for command in commands:
-                    result = await self.execute_command(command)
-                    await self.send_command_result(result)
+                self._backoff = 1.0
                 
                 # Wait before next poll
-                await asyncio.sleep(self.config.poll_interval)
+                await self._wait_for_stop(self.config.poll_interval)
                 
             except Exception as e:
                 self.logger.error("Error in pull mode loop", error=str(e))
-                await asyncio.sleep(5)  # Short delay before retry
+                # Exponential backoff with jitter so a fleet of agents does not
+                # retry in lockstep while the server is down
+                delay = min(self._backoff, self.config.poll_interval) * (0.5 + random.random())
+                self._backoff = min(self._backoff * 2, self.config.poll_interval)
+                await self._wait_for_stop(delay)
+    
+    async def _wait_for_stop(self, timeout: float) -> None:
+        """Sleep for up to timeout seconds, returning early on stop()."""
+        try:
+            await asyncio.wait_for(self._stop.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
     
     async def start_push_mode_server(self) -> None:
         """Start server for push mode operation."""
-        from fastapi import FastAPI, HTTPException
-        from fastapi.responses import JSONResponse
+        from fastapi import FastAPI, HTTPException, Request
+        from fastapi.responses import JSONResponse, Response, StreamingResponse
         import uvicorn
         
         app = FastAPI(title="Firewalld Agent", version="1.0.0")
         
+        @app.middleware("http")
+        async def limit_body_size(request: Request, call_next):
+            content_length = request.headers.get("content-length")
+            if content_length is not None:
+                try:
+                    too_large = int(content_length) > MAX_PUSH_BODY_SIZE
+                except ValueError:
+                    return JSONResponse({"error": "invalid content-length"}, status_code=400)
+                if too_large:
+                    return JSONResponse({"error": "payload too large"}, status_code=413)
+            return await call_next(request)
+        
         @app.post("/api/commands")
-        async def receive_command(command: AgentCommand):
+        async def receive_command(request: Request):
+            try:
+                command = _decode_command(await request.body())
+            except ValueError as e:
+                raise HTTPException(status_code=422, detail=str(e))
+            
             try:
                 result = await self.execute_command(command)
-                return result.model_dump(mode='json')
+                return Response(
+                    content=_json_dumps(result.model_dump(mode='json')),
+                    media_type="application/json"
+                )
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
         
         @app.get("/api/status")
-        async def get_status():
+        async def get_status(request: Request):
+            agent_info = self._build_agent_info(mode=AgentMode.PUSH)
+            
+            if "application/x-ndjson" in request.headers.get("accept", ""):
+                # One line per part so large zone sets are never held in memory
+                async def stream_status():
+                    yield _json_dumps({"agent_info": agent_info.model_dump(mode='json')}) + b"\n"
+                    async for part in self.firewalld.iter_status():
+                        yield _json_dumps(part) + b"\n"
+                
+                return StreamingResponse(stream_status(), media_type="application/x-ndjson")
+            
             try:
                 status = await self.firewalld.get_status()
-                agent_info = AgentInfo(
-                    agent_id=self.agent_id,
-                    hostname=socket.gethostname(),
-                    ip_address=get_local_ip(),
-                    mode=AgentMode.PUSH,
-                    status=AgentStatus.ONLINE,
-                    last_seen=datetime.now(),
-                    version="1.0.0",
-                    operating_system=self._get_os_info(),
-                    firewalld_version=self.firewalld.get_version()
-                )
                 
-                return {
-                    "agent_info": agent_info.model_dump(mode='json'),
-                    "firewall_status": status
-                }
+                return Response(
+                    content=_json_dumps({
+                        "agent_info": agent_info.model_dump(mode='json'),
+                        "firewall_status": status
+                    }),
+                    media_type="application/json"
+                )
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
         
@@ -400,8 +637,8 @@ class FirewalldAgent:
             app,
             host=self.config.listen_host,
             port=self.config.listen_port,
-            ssl_keyfile=self.config.ssl_key_path if os.path.exists(self.config.ssl_key_path) else None,
-            ssl_certfile=self.config.ssl_cert_path if os.path.exists(self.config.ssl_cert_path) else None,
+            ssl_keyfile=self.config.ssl_key_path if self._tls_files_present else None,
+            ssl_certfile=self.config.ssl_cert_path if self._tls_files_present else None,
             log_level="info"
         )
         
@@ -410,32 +647,53 @@ class FirewalldAgent:
     
     async def start(self) -> None:
         """Start the agent."""
-        self.running = True
+        self._stop.clear()
         self._setup_ssl()
         
         # Check firewalld availability
-        if not self.firewalld.is_available():
+        if not await self.firewalld.is_available():
             self.logger.error("Firewalld is not available on this system")
             return
         
-        if self.config.mode == "pull":
-            await self.pull_mode_loop()
-        elif self.config.mode == "push":
-            await self.start_push_mode_server()
-        else:
-            self.logger.error("Invalid mode specified", mode=self.config.mode)
+        self._fwd_version = await self.firewalld.get_version()
+        self._heartbeat_template["firewalld_version"] = self._fwd_version
+        
+        # One client for the lifetime of the agent so connections are reused.
+        # Idle connections must outlive poll_interval, otherwise every poll
+        # re-handshakes anyway.
+        keepalive_expiry = float(max(self.config.poll_interval * 1.5, 75))
+        self._http = httpx.AsyncClient(
+            base_url=self.config.server_url,
+            verify=self.ssl_context or False,
+            timeout=self.config.connection_timeout,
+            limits=httpx.Limits(
+                max_keepalive_connections=4,
+                max_connections=8,
+                keepalive_expiry=keepalive_expiry
+            )
+        )
+        
+        try:
+            if self.config.mode == "pull":
+                await self.pull_mode_loop()
+            elif self.config.mode == "push":
+                await self.start_push_mode_server()
+            else:
+                self.logger.error("Invalid mode specified", mode=self.config.mode)
+        finally:
+            await self.aclose()
     
     def stop(self) -> None:
         """Stop the agent."""
         self.logger.info("Stopping agent")
-        self.running = False
-
-
-def signal_handler(agent: FirewalldAgent):
-    """Handle shutdown signals."""
-    def handler(signum, frame):
-        agent.stop()
-    return handler
+        self._stop.set()
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and the firewalld connection."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        await self.firewalld.close()
 
 
 async def main():
@@ -449,9 +707,10 @@ async def main():
     
     agent = FirewalldAgent(args.config)
     
-    # Setup signal handlers
-    signal.signal(signal.SIGINT, signal_handler(agent))
-    signal.signal(signal.SIGTERM, signal_handler(agent))
+    # Setup signal handlers inside the event loop
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, agent.stop)
     
     try:
         await agent.start()
@@ -463,4 +722,10 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(main())
\ No newline at end of file
@@ -2,69 +2,305 @@
 Firewalld Manager - Handles all firewalld operations.
 """
 
+import os
 import asyncio
-import subprocess
-import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional, Any, Union
+import tempfile
+import time
+from typing import Dict, List, Optional, Any, Union, Sequence, Tuple, AsyncIterator, Iterator
 import re
 import structlog
 
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+try:
+    from dbus_next import BusType
+    from dbus_next.aio import MessageBus
+    from dbus_next.errors import DBusError
+except ImportError:
+    MessageBus = None
+
 from shared.models import (
     FirewallConfiguration, FirewallZoneConfig, FirewallZone,
     PortRule, ServiceRule, RichRule, ForwardPortRule,
     SourceRule, DestinationRule, MasqueradeRule, FirewallAction, RuleFamily
 )
 
+_LOG = structlog.get_logger("firewalld_manager")
+
+# Upper bound on firewall-cmd processes running at the same time
+MAX_CONCURRENT_COMMANDS = 16
+
+# How long an is_available() answer is reused, in seconds
+AVAILABILITY_TTL = 5.0
+
+# Where firewalld reads permanent zone definitions from
+FIREWALLD_ZONES_DIR = "/etc/firewalld/zones"
+
+# Firewalld's stock zone definitions, used for zones not overridden above
+FIREWALLD_DEFAULT_ZONES_DIR = "/usr/lib/firewalld/zones"
+
+_MAC_RE = re.compile(r'^[0-9A-Fa-f]{2}(:[0-9A-Fa-f]{2}){5}$')
+# port=PORT:proto=PROTOCOL[:toport=PORT][:toaddr=ADDRESS]
+_FWD_RE = re.compile(
+    r'port=(?P<port>[^:\s]+):proto=(?P<protocol>[^:\s]+)'
+    r'(?::toport=(?P<to_port>[^:\s]*))?(?::toaddr=(?P<to_addr>\S*))?$'
+)
+
+# "port/protocol" tokens in --list-ports / --list-source-ports output
+_PORT_PROTO_RE = re.compile(r'([^\s/]+)/(\S+)')
+
+# One match per `firewall-cmd --info-zone` line: either "  key: values" or a
+# tab-indented continuation entry of the preceding multi-line field
+_INFO_ZONE_RE = re.compile(
+    r'^(?:\t(?P<item>.*\S.*)| *(?P<key>[a-z][a-z -]*):[ \t]*(?P<value>.*))$',
+    re.MULTILINE
+)
+
+def _iter_port_protocols(text: str) -> Iterator[Dict[str, str]]:
+    """Yield {"port", "protocol"} dicts from whitespace-separated port/proto tokens."""
+    for m in _PORT_PROTO_RE.finditer(text):
+        yield {"port": m.group(1), "protocol": m.group(2)}
+
+
+FIREWALLD_BUS_NAME = "org.fedoraproject.FirewallD1"
+FIREWALLD_OBJECT_PATH = "/org/fedoraproject/FirewallD1"
+
+# firewalld errors that firewall-cmd reports as warnings with exit code 0
+_DBUS_WARNING_CODES = frozenset({"ALREADY_ENABLED", "NOT_ENABLED", "ZONE_ALREADY_SET"})
+
+
+def _split_port(value: str) -> Tuple[str, str]:
+    port, _, protocol = value.partition('/')
+    return port, protocol
+
+
+def _split_forward_port(value: str) -> Tuple[str, str, str, str]:
+    m = _FWD_RE.match(value)
+    if not m:
+        return value, "", "", ""
+    port, protocol, to_port, to_addr = m.groups("")
+    return port, protocol, to_port, to_addr
+
+
+# firewall-cmd zone option -> (firewalld zone D-Bus method, argument builder).
+# The zone name is always the first D-Bus argument; a timeout of 0 means
+# the change does not expire.
+_DBUS_ZONE_METHODS = {
+    "add-interface": ("call_add_interface", lambda v: (v,)),
+    "remove-interface": ("call_remove_interface", lambda v: (v,)),
+    "add-source": ("call_add_source", lambda v: (v,)),
+    "remove-source": ("call_remove_source", lambda v: (v,)),
+    "add-service": ("call_add_service", lambda v: (v, 0)),
+    "remove-service": ("call_remove_service", lambda v: (v,)),
+    "add-port": ("call_add_port", lambda v: (*_split_port(v), 0)),
+    "remove-port": ("call_remove_port", _split_port),
+    "add-protocol": ("call_add_protocol", lambda v: (v, 0)),
+    "remove-protocol": ("call_remove_protocol", lambda v: (v,)),
+    "add-source-port": ("call_add_source_port", lambda v: (*_split_port(v), 0)),
+    "remove-source-port": ("call_remove_source_port", _split_port),
+    "add-icmp-block": ("call_add_icmp_block", lambda v: (v, 0)),
+    "remove-icmp-block": ("call_remove_icmp_block", lambda v: (v,)),
+    "add-forward-port": ("call_add_forward_port", lambda v: (*_split_forward_port(v), 0)),
+    "remove-forward-port": ("call_remove_forward_port", _split_forward_port),
+    "add-rich-rule": ("call_add_rich_rule", lambda v: (v, 0)),
+    "remove-rich-rule": ("call_remove_rich_rule", lambda v: (v,)),
+    "add-masquerade": ("call_add_masquerade", lambda v: (0,)),
+    "remove-masquerade": ("call_remove_masquerade", lambda v: ()),
+}
+
+# Zone entries apply_zone_config replaces with the configured ones. Other
+# entries (interfaces, sources, forward ports, source ports, ICMP blocks)
+# are only ever added, on both the zone-file and the runtime path.
+_PRUNED_ZONE_OPTIONS = frozenset({"service", "port", "protocol", "rich-rule"})
+
+# Zone file elements replaced when a zone configuration is written;
+# masquerade is a flag, so it is always set to the configured value
+_PRUNED_ZONE_TAGS = frozenset(
+    {"rule" if option == "rich-rule" else option for option in _PRUNED_ZONE_OPTIONS} | {"masquerade"}
+)
+
+# FirewallAction values as written in a zone file's target attribute
+_ZONE_TARGETS = {
+    FirewallAction.ACCEPT: "ACCEPT",
+    FirewallAction.REJECT: "%%REJECT%%",
+    FirewallAction.DROP: "DROP",
+}
+
+
+def diff_rules(current: Sequence[str], target: Sequence[str]) -> Tuple[List[str], List[str]]:
+    """
+    Compare the entries a zone has with the entries it should have.
+    
+    Returns (adds, removes). Both keep the order of their input so the
+    resulting firewall-cmd calls are deterministic.
+    """
+    current_set = set(current)
+    target_set = set(target)
+    adds = [item for item in dict.fromkeys(target) if item not in current_set]
+    removes = [item for item in dict.fromkeys(current) if item not in target_set]
+    return adds, removes
+
 
 class FirewalldManager:
     """Manages firewalld configuration through firewall-cmd."""
     
-    def __init__(self):
-        self.logger = structlog.get_logger("firewalld_manager")
+    def __init__(self, zones_dir: str = FIREWALLD_ZONES_DIR,
+                 default_zones_dir: str = FIREWALLD_DEFAULT_ZONES_DIR):
+        self.zones_dir = zones_dir
+        self.default_zones_dir = default_zones_dir
+        self._avail_cache: Optional[Tuple[float, bool]] = None
+        self._version_cache: Optional[str] = None
+        
+        # Direct D-Bus access to firewalld, connected on first use
+        self._bus = None
+        self._dbus_root = None
+        self._dbus_zone = None
+        self._dbus_policies = None
+        self._dbus_failed = False
+        self._dbus_lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_COMMANDS)
     
-    def is_available(self) -> bool:
+    async def is_available(self) -> bool:
         """Check if firewalld is available and running."""
-        try:
-            result = subprocess.run(
-                ["firewall-cmd", "--state"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.returncode == 0 and "running" in result.stdout
-        except Exception:
-            return False
+        now = time.monotonic()
+        if self._avail_cache is not None and now - self._avail_cache[0] < AVAILABILITY_TTL:
+            return self._avail_cache[1]
+        
+        result = await self.run_command(["firewall-cmd", "--state"], timeout=5)
+        available = result["success"] and "running" in result["stdout"]
+        
+        self._avail_cache = (now, available)
+        return available
     
-    def get_version(self) -> str:
+    async def get_version(self) -> str:
         """Get firewalld version."""
+        if self._version_cache is not None:
+            return self._version_cache
+        
+        result = await self.run_command(["firewall-cmd", "--version"], timeout=5)
+        if result["success"]:
+            # Only cache real answers so a transient failure is retried
+            self._version_cache = result["stdout"]
+            return self._version_cache
+        return "unknown"
+    
+    async def _connect_dbus(self) -> bool:
+        """Connect to firewalld's D-Bus API; False means use firewall-cmd."""
+        if self._dbus_zone is not None:
+            return True
+        if MessageBus is None or self._dbus_failed:
+            return False
+        
+        async with self._dbus_lock:
+            if self._dbus_zone is not None:
+                return True
+            try:
+                bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+                introspection = await bus.introspect(FIREWALLD_BUS_NAME, FIREWALLD_OBJECT_PATH)
+                proxy = bus.get_proxy_object(FIREWALLD_BUS_NAME, FIREWALLD_OBJECT_PATH, introspection)
+                self._dbus_root = proxy.get_interface(FIREWALLD_BUS_NAME)
+                self._dbus_zone = proxy.get_interface(f"{FIREWALLD_BUS_NAME}.zone")
+                self._dbus_policies = proxy.get_interface(f"{FIREWALLD_BUS_NAME}.policies")
+                self._bus = bus
+            except Exception as e:
+                _LOG.warning("firewalld D-Bus API unavailable, using firewall-cmd",
+                             error=str(e))
+                self._dbus_failed = True
+                return False
+        
+        return True
+    
+    def _drop_dbus(self) -> None:
+        """Forget a broken D-Bus connection so the next call reconnects."""
+        if self._bus is not None:
+            self._bus.disconnect()
+        self._bus = self._dbus_root = self._dbus_zone = self._dbus_policies = None
+    
+    async def _dbus_call(self, method: Any, *args: Any) -> Optional[Dict[str, Any]]:
+        """
+        Call a firewalld D-Bus method, returning a run_command-style result.
+        
+        Returns None when the connection itself failed, so the caller can
+        fall back to firewall-cmd.
+        """
         try:
-            result = subprocess.run(
-                ["firewall-cmd", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5
+            await method(*args)
+        except DBusError as e:
+            code = (e.text or "").split(':', 1)[0].strip()
+            if code in _DBUS_WARNING_CODES:
+                return {"returncode": 0, "stdout": "", "stderr": e.text, "success": True}
+            _LOG.error("Firewall D-Bus call failed", error=e.text)
+            return {"returncode": 1, "stdout": "", "stderr": e.text, "success": False}
+        except Exception as e:
+            _LOG.warning("firewalld D-Bus connection failed", error=str(e))
+            self._drop_dbus()
+            return None
+        
+        return {"returncode": 0, "stdout": "", "stderr": "", "success": True}
+    
+    async def _dbus_get(self, method_name: str, *args: Any, interface: str = "root") -> Any:
+        """
+        Read a value from firewalld over D-Bus.
+        
+        Returns None if D-Bus is unavailable or the call failed (e.g. the
+        method does not exist on this firewalld version).
+        """
+        if not await self._connect_dbus():
+            return None
+        
+        try:
+            return await getattr(getattr(self, f"_dbus_{interface}"), method_name)(*args)
+        except DBusError as e:
+            _LOG.debug("firewalld D-Bus query failed", method=method_name, error=e.text)
+        except Exception as e:
+            _LOG.warning("firewalld D-Bus connection failed", error=str(e))
+            self._drop_dbus()
+        return None
+    
+    async def _change_zone(self, zone: str, option: str, value: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Apply one runtime change to a zone, e.g. option="add-service".
+        
+        Goes straight to firewalld over D-Bus when possible and falls back
+        to running firewall-cmd.
+        """
+        if await self._connect_dbus():
+            method_name, build_args = _DBUS_ZONE_METHODS[option]
+            result = await self._dbus_call(
+                getattr(self._dbus_zone, method_name), zone, *build_args(value)
             )
-            if result.returncode == 0:
-                return result.stdout.strip()
-            return "unknown"
-        except Exception:
-            return "unknown"
+            if result is not None:
+                return result
+        
+        command = ["firewall-cmd", "--zone", zone, f"--{option}"]
+        if value is not None:
+            command.append(value)
+        return await self.run_command(command)
+    
+    async def close(self) -> None:
+        """Release the D-Bus connection, if any."""
+        if self._bus is not None:
+            self._drop_dbus()
     
     async def run_command(self, command: List[str], timeout: int = 10) -> Dict[str, Any]:
         """Run a firewall-cmd command asynchronously."""
         try:
-            self.logger.debug("Running firewall command", command=command)
-            
-            process = await asyncio.create_subprocess_exec(
-                *command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+            _LOG.debug("Running firewall command", command=command)
             
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=timeout
-            )
+            async with self._semaphore:
+                process = await asyncio.create_subprocess_exec(
+                    *command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(),
+                    timeout=timeout
+                )
             
             result = {
                 "returncode": process.returncode,
@@ -74,14 +310,14 @@ class FirewalldManager:
             }
             
             if not result["success"]:
-                self.logger.error("Firewall command failed",
-                                command=command,
-                                stderr=result["stderr"])
+                _LOG.error("Firewall command failed",
+                         command=command,
+                         stderr=result["stderr"])
             
             return result
             
         except asyncio.TimeoutError:
-            self.logger.error("Firewall command timed out", command=command)
+            _LOG.error("Firewall command timed out", command=command)
             return {
                 "returncode": -1,
                 "stdout": "",
@@ -89,9 +325,9 @@ class FirewalldManager:
                 "success": False
             }
         except Exception as e:
-            self.logger.error("Error running firewall command",
-                            command=command,
-                            error=str(e))
+            _LOG.error("Error running firewall command",
+                     command=command,
+                     error=str(e))
             return {
                 "returncode": -1,
                 "stdout": "",
@@ -99,68 +335,239 @@ class FirewalldManager:
                 "success": False
             }
     
+    async def run_command_stream(self, command: List[str], timeout: int = 10) -> AsyncIterator[str]:
+        """
+        Run a firewall-cmd command and yield its stdout line by line.
+        
+        Output is parsed as it arrives instead of being buffered whole. A
+        failed or timed out command simply stops yielding.
+        """
+        _LOG.debug("Streaming firewall command", command=command)
+        
+        async with self._semaphore:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            deadline = asyncio.get_running_loop().time() + timeout
+            try:
+                while True:
+                    remaining = deadline - asyncio.get_running_loop().time()
+                    line = await asyncio.wait_for(process.stdout.readline(), timeout=max(remaining, 0))
+                    if not line:
+                        break
+                    yield line.decode().rstrip('\n')
+                await process.wait()
+            except asyncio.TimeoutError:
+                _LOG.error("Firewall command timed out", command=command)
+            finally:
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+    
     async def get_status(self) -> Dict[str, Any]:
         """Get current firewall status."""
         status = {}
         
-        # Get basic state
-        result = await self.run_command(["firewall-cmd", "--state"])
-        status["running"] = result["success"]
+        async for part in self.iter_status():
+            if "status" in part:
+                status.update(part["status"])
+                if status["running"]:
+                    status["zones"] = {}
+            else:
+                status["zones"][part["zone"]] = part["config"]
         
-        if not status["running"]:
-            return status
+        return status
+    
+    async def iter_status(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield the firewall status piece by piece.
         
-        # Get default zone
-        result = await self.run_command(["firewall-cmd", "--get-default-zone"])
-        if result["success"]:
-            status["default_zone"] = result["stdout"]
+        The first item is {"status": {...}} with the global state, followed by
+        one {"zone": name, "config": {...}} item per zone.
+        """
+        # Read the global state from firewalld directly when D-Bus is
+        # available; a successful answer also means it is running
+        status = await self._dbus_status()
+        if status is not None:
+            status["running"] = True
+        else:
+            status = {}
+            
+            # Get basic state
+            result = await self.run_command(["firewall-cmd", "--state"])
+            status["running"] = result["success"]
+            
+            if not status["running"]:
+                yield {"status": status}
+                return
+            
+            status.update(await self._query_status())
         
-        # Get all zones
-        result = await self.run_command(["firewall-cmd", "--get-zones"])
-        if result["success"]:
-            status["available_zones"] = result["stdout"].split()
+        yield {"status": status}
         
-        # Get active zones
-        result = await self.run_command(["firewall-cmd", "--get-active-zones"])
-        if result["success"]:
-            status["active_zones"] = self._parse_active_zones(result["stdout"])
+        # Query all zones concurrently, but hand them out in zone order
+        zones = status.get("available_zones", [])
+        tasks = [asyncio.ensure_future(self.get_zone_config(zone)) for zone in zones]
+        try:
+            for zone, task in zip(zones, tasks):
+                yield {"zone": zone, "config": await task}
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def _dbus_status(self) -> Optional[Dict[str, Any]]:
+        """Global firewall state via D-Bus, or None to fall back to firewall-cmd."""
+        results = await asyncio.gather(
+            self._dbus_get("call_get_default_zone"),
+            self._dbus_get("call_get_zones", interface="zone"),
+            self._dbus_get("call_get_active_zones", interface="zone"),
+            self._dbus_get("call_query_panic_mode"),
+            self._dbus_get("call_query_lockdown", interface="policies"),
+        )
+        if any(result is None for result in results):
+            return None
         
-        # Get panic mode
-        result = await self.run_command(["firewall-cmd", "--query-panic"])
-        status["panic_mode"] = result["success"]
+        default_zone, zones, active_zones, panic, lockdown = results
+        return {
+            "default_zone": default_zone,
+            "available_zones": zones,
+            "active_zones": {
+                zone: bindings.get("interfaces", []) + bindings.get("sources", [])
+                for zone, bindings in active_zones.items()
+            },
+            "panic_mode": panic,
+            "lockdown": lockdown,
+        }
+    
+    async def _query_status(self) -> Dict[str, Any]:
+        """Global firewall state via firewall-cmd."""
+        status = {}
         
-        # Get lockdown mode
-        result = await self.run_command(["firewall-cmd", "--query-lockdown"])
-        status["lockdown"] = result["success"]
+        # The queries are independent of each other
+        r_default, r_zones, active_zones, r_panic, r_lockdown = await asyncio.gather(
+            self.run_command(["firewall-cmd", "--get-default-zone"]),
+            self.run_command(["firewall-cmd", "--get-zones"]),
+            self._parse_active_zones(self.run_command_stream(["firewall-cmd", "--get-active-zones"])),
+            self.run_command(["firewall-cmd", "--query-panic"]),
+            self.run_command(["firewall-cmd", "--query-lockdown"]),
+        )
         
-        # Get zone configurations
-        status["zones"] = {}
-        for zone in status.get("available_zones", []):
-            status["zones"][zone] = await self.get_zone_config(zone)
+        if r_default["success"]:
+            status["default_zone"] = r_default["stdout"]
+        if r_zones["success"]:
+            status["available_zones"] = r_zones["stdout"].split()
+        status["active_zones"] = active_zones
+        status["panic_mode"] = r_panic["success"]
+        status["lockdown"] = r_lockdown["success"]
         
         return status
     
-    def _parse_active_zones(self, output: str) -> Dict[str, List[str]]:
-        """Parse active zones output."""
+    async def _parse_active_zones(self, lines: AsyncIterator[str]) -> Dict[str, List[str]]:
+        """Parse `--get-active-zones` output into zone -> interfaces/sources."""
         active_zones = {}
         current_zone = None
         
-        for line in output.split('\n'):
-            line = line.strip()
-            if not line:
+        async for line in lines:
+            if not line.strip():
                 continue
             
-            if line.endswith(':') or (line and not line.startswith(' ')):
-                current_zone = line.rstrip(':')
+            if not line[0].isspace():
+                # "public" or "public (default)"
+                current_zone = line.split()[0].rstrip(':')
                 active_zones[current_zone] = []
-            elif current_zone and line.startswith(' '):
-                interfaces = line.strip().split()
-                active_zones[current_zone].extend(interfaces)
+            elif current_zone:
+                # "  interfaces: eth0 eth1" / "  sources: 10.0.0.0/8"
+                _, _, values = line.partition(':')
+                active_zones[current_zone].extend(values.split())
         
         return active_zones
     
     async def get_zone_config(self, zone: str) -> Dict[str, Any]:
         """Get configuration for a specific zone."""
+        # Read the zone straight from firewalld when D-Bus is available
+        settings = await self._dbus_get("call_get_zone_settings2", zone, interface="zone")
+        if settings is not None:
+            return self._zone_config_from_settings(zone, settings)
+        
+        # One firewall-cmd run covers the whole zone; fall back to the
+        # individual queries on firewalld versions without --info-zone
+        result = await self.run_command(["firewall-cmd", f"--info-zone={zone}"])
+        if result["success"]:
+            return self._parse_info_zone(zone, result["stdout"])
+        
+        return await self._query_zone_config(zone)
+    
+    @staticmethod
+    def _zone_config_from_settings(zone: str, settings: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert getZoneSettings2's a{sv} dict into a zone config dict."""
+        def get(key: str, default: Any) -> Any:
+            variant = settings.get(key)
+            return default if variant is None else variant.value
+        
+        target = get("target", "default")
+        
+        return {
+            "zone": zone,
+            "target": target if target != "default" else None,
+            "interfaces": get("interfaces", []),
+            "sources": get("sources", []),
+            "services": get("services", []),
+            "ports": [{"port": port, "protocol": protocol}
+                      for port, protocol in get("ports", [])],
+            "protocols": get("protocols", []),
+            "masquerade": get("masquerade", False),
+            "forward_ports": [dict(zip(("port", "protocol", "to_port", "to_addr"), fwd))
+                              for fwd in get("forward_ports", [])],
+            "source_ports": [{"port": port, "protocol": protocol}
+                             for port, protocol in get("source_ports", [])],
+            "icmp_blocks": get("icmp_blocks", []),
+            "rich_rules": get("rich_rules", [])
+        }
+    
+    def _parse_info_zone(self, zone: str, output: str) -> Dict[str, Any]:
+        """Parse `firewall-cmd --info-zone` output into a zone config dict."""
+        fields: Dict[str, List[str]] = {}
+        current: Optional[List[str]] = None
+        
+        # The first line ("<zone> (active)") has no colon and never matches
+        for m in _INFO_ZONE_RE.finditer(output):
+            key = m.group("key")
+            if key is None:
+                # Tab-indented continuation line (rich rules, forward ports)
+                if current is not None:
+                    current.append(m.group("item").strip())
+                continue
+            current = fields[key] = m.group("value").split() if key != "rich rules" else []
+        
+        def port_list(key: str) -> List[Dict[str, str]]:
+            ports = []
+            for port_proto in fields.get(key, []):
+                if '/' in port_proto:
+                    port, protocol = port_proto.split('/', 1)
+                    ports.append({"port": port, "protocol": protocol})
+            return ports
+        
+        target = " ".join(fields.get("target", []))
+        
+        return {
+            "zone": zone,
+            "target": target if target and target != "default" else None,
+            "interfaces": fields.get("interfaces", []),
+            "sources": fields.get("sources", []),
+            "services": fields.get("services", []),
+            "ports": port_list("ports"),
+            "protocols": fields.get("protocols", []),
+            "masquerade": fields.get("masquerade") == ["yes"],
+            "forward_ports": [fp for fp in map(self._parse_forward_port, fields.get("forward-ports", [])) if fp],
+            "source_ports": port_list("source-ports"),
+            "icmp_blocks": fields.get("icmp-blocks", []),
+            "rich_rules": fields.get("rich rules", [])
+        }
+    
+    async def _query_zone_config(self, zone: str) -> Dict[str, Any]:
+        """Get configuration for a zone with one firewall-cmd query per field."""
         config = {
             "zone": zone,
             "target": None,
@@ -176,107 +583,94 @@ class FirewalldManager:
             "rich_rules": []
         }
         
-        # Get target
-        result = await self.run_command(["firewall-cmd", "--zone", zone, "--get-target"])
-        if result["success"] and result["stdout"] != "default":
-            config["target"] = result["stdout"]
-        
-        # Get interfaces
-        result = await self.run_command(["firewall-cmd", "--zone", zone, "--list-interfaces"])
-        if result["success"] and result["stdout"]:
-            config["interfaces"] = result["stdout"].split()
-        
-        # Get sources
-        result = await self.run_command(["firewall-cmd", "--zone", zone, "--list-sources"])
-        if result["success"] and result["stdout"]:
-            config["sources"] = result["stdout"].split()
-        
-        # Get services
-        result = await self.run_command(["firewall-cmd", "--zone", zone, "--list-services"])
-        if result["success"] and result["stdout"]:
-            config["services"] = result["stdout"].split()
-        
-        # Get ports
-        result = await self.run_command(["firewall-cmd", "--zone", zone, "--list-ports"])
-        if result["success"] and result["stdout"]:
-            ports = []
-            for port_proto in result["stdout"].split():
-                if '/' in port_proto:
-                    port, protocol = port_proto.split('/', 1)
-                    ports.append({"port": port, "protocol": protocol})
-            config["ports"] = ports
-        
-        # Get protocols
-        result = await self.run_command(["firewall-cmd", "--zone", zone, "--list-protocols"])
-        if result["success"] and result["stdout"]:
-            config["protocols"] = result["stdout"].split()
-        
-        # Get masquerade
-        result = await self.run_command(["firewall-cmd", "--zone", zone, "--query-masquerade"])
-        config["masquerade"] = result["success"]
-        
-        # Get forward ports
-        result = await self.run_command(["firewall-cmd", "--zone", zone, "--list-forward-ports"])
-        if result["success"] and result["stdout"]:
-            config["forward_ports"] = self._parse_forward_ports(result["stdout"])
-        
-        # Get source ports
-        result = await self.run_command(["firewall-cmd", "--zone", zone, "--list-source-ports"])
-        if result["success"] and result["stdout"]:
-            source_ports = []
-            for port_proto in result["stdout"].split():
-                if '/' in port_proto:
-                    port, protocol = port_proto.split('/', 1)
-                    source_ports.append({"port": port, "protocol": protocol})
-            config["source_ports"] = source_ports
+        def query(option: str) -> Any:
+            return self.run_command(["firewall-cmd", "--zone", zone, option])
+        
+        (r_target, r_if, r_src, r_svc, r_ports, r_proto,
+         r_masq, forward_ports, r_sport, r_icmp, rich_rules) = await asyncio.gather(
+            query("--get-target"),
+            query("--list-interfaces"),
+            query("--list-sources"),
+            query("--list-services"),
+            query("--list-ports"),
+            query("--list-protocols"),
+            query("--query-masquerade"),
+            self._parse_forward_ports(self.run_command_stream(
+                ["firewall-cmd", "--zone", zone, "--list-forward-ports"])),
+            query("--list-source-ports"),
+            query("--list-icmp-blocks"),
+            self._collect_lines(self.run_command_stream(
+                ["firewall-cmd", "--zone", zone, "--list-rich-rules"])),
+        )
+        
+        if r_target["success"] and r_target["stdout"] != "default":
+            config["target"] = r_target["stdout"]
+        
+        if r_if["success"] and r_if["stdout"]:
+            config["interfaces"] = r_if["stdout"].split()
+        
+        if r_src["success"] and r_src["stdout"]:
+            config["sources"] = r_src["stdout"].split()
+        
+        if r_svc["success"] and r_svc["stdout"]:
+            config["services"] = r_svc["stdout"].split()
         
-        # Get ICMP blocks
-        result = await self.run_command(["firewall-cmd", "--zone", zone, "--list-icmp-blocks"])
-        if result["success"] and result["stdout"]:
-            config["icmp_blocks"] = result["stdout"].split()
+        if r_ports["success"] and r_ports["stdout"]:
+            config["ports"] = list(_iter_port_protocols(r_ports["stdout"]))
         
-        # Get rich rules
-        result = await self.run_command(["firewall-cmd", "--zone", zone, "--list-rich-rules"])
-        if result["success"] and result["stdout"]:
-            config["rich_rules"] = result["stdout"].split('\n')
+        if r_proto["success"] and r_proto["stdout"]:
+            config["protocols"] = r_proto["stdout"].split()
+        
+        config["masquerade"] = r_masq["success"]
+        
+        config["forward_ports"] = forward_ports
+        
+        if r_sport["success"] and r_sport["stdout"]:
+            config["source_ports"] = list(_iter_port_protocols(r_sport["stdout"]))
+        
+        if r_icmp["success"] and r_icmp["stdout"]:
+            config["icmp_blocks"] = r_icmp["stdout"].split()
+        
+        config["rich_rules"] = rich_rules
         
         return config
     
-    def _parse_forward_ports(self, output: str) -> List[Dict[str, str]]:
-        """Parse forward ports output."""
+    @staticmethod
+    async def _collect_lines(lines: AsyncIterator[str]) -> List[str]:
+        """Collect the non-empty lines of a command's output."""
+        return [line.strip() async for line in lines if line.strip()]
+    
+    async def _parse_forward_ports(self, lines: AsyncIterator[str]) -> List[Dict[str, str]]:
+        """Parse `--list-forward-ports` output, one rule per line."""
         forward_ports = []
-        for line in output.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Parse format: port=PORT:proto=PROTOCOL[:toport=PORT][:toaddr=ADDRESS]
-            parts = line.split(':')
-            port_rule = {}
-            
-            for part in parts:
-                if '=' in part:
-                    key, value = part.split('=', 1)
-                    if key == "port":
-                        port_rule["port"] = value
-                    elif key == "proto":
-                        port_rule["protocol"] = value
-                    elif key == "toport":
-                        port_rule["to_port"] = value
-                    elif key == "toaddr":
-                        port_rule["to_addr"] = value
-            
+        async for line in lines:
+            port_rule = self._parse_forward_port(line)
             if port_rule:
                 forward_ports.append(port_rule)
-        
         return forward_ports
     
+    def _parse_forward_port(self, line: str) -> Optional[Dict[str, str]]:
+        """Parse a single forward port rule."""
+        m = _FWD_RE.match(line.strip())
+        if not m:
+            return None
+        return {key: value for key, value in m.groupdict().items() if value is not None}
+    
     async def apply_configuration(self, config: FirewallConfiguration) -> bool:
-        """Apply a complete firewall configuration."""
+        """
+        Apply a complete firewall configuration.
+        
+        When zone files can be written, the runtime configuration is saved
+        with --runtime-to-permanent before the zone files are merged and
+        firewalld is reloaded. Runtime-only changes therefore survive the
+        reload, the same way they were kept when every change went through
+        the runtime. The final --runtime-to-permanent then saves panic and
+        lockdown changes.
+        """
         try:
-            self.logger.info("Applying firewall configuration",
-                           agent_id=config.agent_id,
-                           zones_count=len(config.zones))
+            _LOG.info("Applying firewall configuration",
+                    agent_id=config.agent_id,
+                    zones_count=len(config.zones))
             
             # Set default zone
             if config.default_zone:
@@ -286,9 +680,22 @@ class FirewalldManager:
                 if not result["success"]:
                     return False
             
-            # Apply zone configurations
+            # The reload that picks up zone files replaces the runtime
+            # configuration, so save runtime-only changes into it first
+            reload = bool(config.zones) and self._can_write_zone_files()
+            if reload:
+                result = await self.run_command(["firewall-cmd", "--runtime-to-permanent"])
+                if not result["success"]:
+                    return False
+            
+            # Apply zone configurations; zone files are picked up by one
+            # reload at the end rather than one per zone
             for zone_config in config.zones:
-                if not await self.apply_zone_config(zone_config):
+                if not await self.apply_zone_config(zone_config, reload=False):
+                    return False
+            
+            if reload:
+                if not await self.reload():
                     return False
             
             # Set panic mode
@@ -309,11 +716,192 @@ class FirewalldManager:
             return result["success"]
             
         except Exception as e:
-            self.logger.error("Error applying configuration", error=str(e))
+            _LOG.error("Error applying configuration", error=str(e))
             return False
     
-    async def apply_zone_config(self, zone_config: FirewallZoneConfig) -> bool:
-        """Apply configuration for a specific zone."""
+    def _can_write_zone_files(self) -> bool:
+        """Check whether zone files can be written directly."""
+        return os.access(self.zones_dir, os.W_OK)
+    
+    async def apply_zone_config(self, zone_config: FirewallZoneConfig, reload: bool = True) -> bool:
+        """
+        Apply configuration for a specific zone.
+        
+        The configuration is merged into the zone's permanent zone file and
+        takes effect on reload. Without write access to the zones directory
+        the runtime configuration is patched entry by entry instead. Both
+        ways replace the entries in _PRUNED_ZONE_OPTIONS and masquerade, only
+        add the other entries, and keep whatever the model does not cover.
+        """
+        if not self._can_write_zone_files():
+            return await self._apply_zone_config_runtime(zone_config)
+        
+        zone = zone_config.zone.value
+        loop = asyncio.get_running_loop()
+        try:
+            existing = await loop.run_in_executor(None, self._read_zone_file, zone)
+            zone_xml = self._render_zone_xml(zone_config, existing)
+            await loop.run_in_executor(None, self._write_zone_file, zone, zone_xml)
+        except Exception as e:
+            _LOG.error("Error writing zone file", zone=zone, error=str(e))
+            return False
+        
+        if reload:
+            return await self.reload()
+        return True
+    
+    def _read_zone_file(self, zone: str) -> Optional[bytes]:
+        """The zone's permanent definition: the local one, else firewalld's stock one."""
+        for directory in (self.zones_dir, self.default_zones_dir):
+            try:
+                with open(os.path.join(directory, f"{zone}.xml"), 'rb') as f:
+                    return f.read()
+            except FileNotFoundError:
+                continue
+        return None
+    
+    def _write_zone_file(self, zone: str, data: bytes) -> None:
+        """Atomically replace the permanent zone file for a zone."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.zones_dir, prefix=f".{zone}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, os.path.join(self.zones_dir, f"{zone}.xml"))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    
+    def _render_zone_xml(self, zone_config: FirewallZoneConfig, existing: Optional[bytes] = None) -> bytes:
+        """
+        Render a zone configuration in firewalld's zone file format.
+        
+        existing is the zone's current zone file, if any. Its elements in
+        _PRUNED_ZONE_TAGS are replaced by the configured ones; the
+        configured interfaces, sources, forward ports, source ports and
+        ICMP blocks are added to those it has; everything else (short,
+        description, helpers, ...) is kept as it is.
+        """
+        if existing:
+            root = ET.fromstring(existing)
+            for element in list(root):
+                if element.tag in _PRUNED_ZONE_TAGS:
+                    root.remove(element)
+        else:
+            root = ET.Element("zone")
+            ET.SubElement(root, "short").text = zone_config.zone.value
+        if zone_config.target:
+            root.set("target", _ZONE_TARGETS[zone_config.target])
+        
+        # lxml also yields comments here; their tag is not a string
+        kept = {(element.tag, tuple(sorted(element.attrib.items())))
+                for element in root if isinstance(element.tag, str)}
+        
+        def add(tag: str, attrs: Dict[str, str]) -> None:
+            key = (tag, tuple(sorted(attrs.items())))
+            if key not in kept:
+                kept.add(key)
+                ET.SubElement(root, tag, attrs)
+        
+        for interface in zone_config.interfaces:
+            add("interface", {"name": interface})
+        for source in zone_config.sources:
+            # Zone sources are an address, a MAC or "ipset:<name>"
+            if source.startswith("ipset:"):
+                add("source", {"ipset": source[len("ipset:"):]})
+            elif _MAC_RE.match(source):
+                add("source", {"mac": source})
+            else:
+                add("source", {"address": source})
+        for service in zone_config.services:
+            add("service", {"name": service})
+        for port_rule in zone_config.ports:
+            add("port", {"port": port_rule.port, "protocol": port_rule.protocol})
+        for protocol in zone_config.protocols:
+            add("protocol", {"value": protocol})
+        for icmp_block in zone_config.icmp_blocks:
+            add("icmp-block", {"name": icmp_block})
+        if zone_config.masquerade:
+            add("masquerade", {})
+        for forward_port in zone_config.forward_ports:
+            add("forward-port", self._forward_port_attrs(forward_port))
+        for source_port in zone_config.source_ports:
+            add("source-port", {"port": source_port.port, "protocol": source_port.protocol})
+        for rich_rule in zone_config.rich_rules:
+            self._render_rich_rule(root, rich_rule)
+        
+        return ET.tostring(root, encoding="utf-8", xml_declaration=True)
+    
+    @staticmethod
+    def _forward_port_attrs(forward_port: ForwardPortRule) -> Dict[str, str]:
+        """A forward port's attributes as written in a zone file."""
+        attrs = {"port": forward_port.port, "protocol": forward_port.protocol}
+        if forward_port.to_port:
+            attrs["to-port"] = forward_port.to_port
+        if forward_port.to_addr:
+            attrs["to-addr"] = forward_port.to_addr
+        return attrs
+    
+    def _render_forward_port(self, parent: Any, forward_port: ForwardPortRule) -> None:
+        ET.SubElement(parent, "forward-port", self._forward_port_attrs(forward_port))
+    
+    def _render_rich_rule(self, parent: Any, rich_rule: RichRule) -> None:
+        """Render a rich rule as a <rule> element."""
+        rule = ET.SubElement(parent, "rule")
+        if rich_rule.family:
+            rule.set("family", rich_rule.family.value)
+        
+        if rich_rule.source:
+            source = ET.SubElement(rule, "source")
+            for attr in ("address", "mac", "ipset"):
+                value = getattr(rich_rule.source, attr)
+                if value:
+                    source.set(attr, value)
+            if rich_rule.source.invert:
+                source.set("invert", "True")
+        
+        if rich_rule.destination:
+            destination = ET.SubElement(rule, "destination")
+            if rich_rule.destination.address:
+                destination.set("address", rich_rule.destination.address)
+            if rich_rule.destination.invert:
+                destination.set("invert", "True")
+        
+        if rich_rule.service:
+            ET.SubElement(rule, "service", name=rich_rule.service.service)
+        if rich_rule.port:
+            ET.SubElement(rule, "port", port=rich_rule.port.port, protocol=rich_rule.port.protocol)
+        if rich_rule.protocol:
+            ET.SubElement(rule, "protocol", value=rich_rule.protocol)
+        if rich_rule.masquerade and rich_rule.masquerade.enabled:
+            ET.SubElement(rule, "masquerade")
+        if rich_rule.forward_port:
+            self._render_forward_port(rule, rich_rule.forward_port)
+        if rich_rule.source_port:
+            ET.SubElement(rule, "source-port",
+                          port=rich_rule.source_port.port, protocol=rich_rule.source_port.protocol)
+        if rich_rule.icmp_block:
+            ET.SubElement(rule, "icmp-block", name=rich_rule.icmp_block)
+        if rich_rule.icmp_type:
+            ET.SubElement(rule, "icmp-type", name=rich_rule.icmp_type)
+        
+        if rich_rule.log:
+            log = ET.SubElement(rule, "log")
+            if "prefix" in rich_rule.log:
+                log.set("prefix", str(rich_rule.log["prefix"]))
+            if "level" in rich_rule.log:
+                log.set("level", str(rich_rule.log["level"]))
+            if "limit" in rich_rule.log:
+                ET.SubElement(log, "limit", value=str(rich_rule.log["limit"]))
+        if rich_rule.audit:
+            ET.SubElement(rule, "audit")
+        if rich_rule.action:
+            ET.SubElement(rule, rich_rule.action.value)
+    
+    async def _apply_zone_config_runtime(self, zone_config: FirewallZoneConfig) -> bool:
+        """Patch a zone's runtime configuration to match zone_config."""
         zone = zone_config.zone.value
         
         try:
@@ -325,213 +913,154 @@ class FirewalldManager:
                 if not result["success"]:
                     return False
             
-            # Clear existing configuration
-            await self._clear_zone_config(zone)
-            
-            # Add interfaces
-            for interface in zone_config.interfaces:
-                await self.run_command([
-                    "firewall-cmd", "--zone", zone, "--add-interface", interface
-                ])
-            
-            # Add sources
-            for source in zone_config.sources:
-                await self.run_command([
-                    "firewall-cmd", "--zone", zone, "--add-source", source
-                ])
+            current = await self.get_zone_config(zone)
             
-            # Add services
-            for service in zone_config.services:
-                await self.run_command([
-                    "firewall-cmd", "--zone", zone, "--add-service", service
-                ])
+            # (option, current entries, desired entries); only the options in
+            # _PRUNED_ZONE_OPTIONS lose entries missing from zone_config
+            categories = [
+                ("interface", current["interfaces"], zone_config.interfaces),
+                ("source", current["sources"], zone_config.sources),
+                ("service", current["services"], zone_config.services),
+                ("port",
+                 [f"{p['port']}/{p['protocol']}" for p in current["ports"]],
+                 [f"{p.port}/{p.protocol}" for p in zone_config.ports]),
+                ("protocol", current["protocols"], zone_config.protocols),
+                ("forward-port",
+                 [self._format_forward_port(fp.get("port"), fp.get("protocol"),
+                                            fp.get("to_port"), fp.get("to_addr"))
+                  for fp in current["forward_ports"]],
+                 [self._format_forward_port(fp.port, fp.protocol, fp.to_port, fp.to_addr)
+                  for fp in zone_config.forward_ports]),
+                ("source-port",
+                 [f"{p['port']}/{p['protocol']}" for p in current["source_ports"]],
+                 [f"{p.port}/{p.protocol}" for p in zone_config.source_ports]),
+                ("icmp-block", current["icmp_blocks"], zone_config.icmp_blocks),
+                ("rich-rule",
+                 [rule for rule in current["rich_rules"] if rule],
+                 [rule for rule in map(self._build_rich_rule_string, zone_config.rich_rules) if rule]),
+            ]
             
-            # Add ports
-            for port_rule in zone_config.ports:
-                await self.run_command([
-                    "firewall-cmd", "--zone", zone, "--add-port",
-                    f"{port_rule.port}/{port_rule.protocol}"
-                ])
-            
-            # Add protocols
-            for protocol in zone_config.protocols:
-                await self.run_command([
-                    "firewall-cmd", "--zone", zone, "--add-protocol", protocol
-                ])
+            additions = []
+            removals = []
+            for option, current_items, target_items in categories:
+                adds, removes = diff_rules(current_items, target_items)
+                if option in _PRUNED_ZONE_OPTIONS:
+                    removals.extend((f"remove-{option}", item) for item in removes)
+                additions.extend((f"add-{option}", item) for item in adds)
             
             # Set masquerade
-            if zone_config.masquerade:
-                await self.run_command([
-                    "firewall-cmd", "--zone", zone, "--add-masquerade"
-                ])
+            if zone_config.masquerade and not current["masquerade"]:
+                additions.append(("add-masquerade", None))
+            elif current["masquerade"] and not zone_config.masquerade:
+                removals.append(("remove-masquerade", None))
             
-            # Add forward ports
-            for forward_port in zone_config.forward_ports:
-                cmd = [
-                    "firewall-cmd", "--zone", zone, "--add-forward-port",
-                    f"port={forward_port.port}:proto={forward_port.protocol}"
-                ]
-                if forward_port.to_port:
-                    cmd[-1] += f":toport={forward_port.to_port}"
-                if forward_port.to_addr:
-                    cmd[-1] += f":toaddr={forward_port.to_addr}"
-                
-                await self.run_command(cmd)
-            
-            # Add source ports
-            for source_port in zone_config.source_ports:
-                await self.run_command([
-                    "firewall-cmd", "--zone", zone, "--add-source-port",
-                    f"{source_port.port}/{source_port.protocol}"
-                ])
-            
-            # Add ICMP blocks
-            for icmp_block in zone_config.icmp_blocks:
-                await self.run_command([
-                    "firewall-cmd", "--zone", zone, "--add-icmp-block", icmp_block
-                ])
-            
-            # Add rich rules
-            for rich_rule in zone_config.rich_rules:
-                rule_str = self._build_rich_rule_string(rich_rule)
-                if rule_str:
-                    await self.run_command([
-                        "firewall-cmd", "--zone", zone, "--add-rich-rule", rule_str
-                    ])
+            # Removals finish before additions start: a rich rule listed in
+            # firewalld's normalized form may be equivalent to one being added.
+            await asyncio.gather(*(self._change_zone(zone, opt, item) for opt, item in removals))
+            await asyncio.gather(*(self._change_zone(zone, opt, item) for opt, item in additions))
             
             return True
             
         except Exception as e:
-            self.logger.error("Error applying zone configuration",
-                            zone=zone, error=str(e))
+            _LOG.error("Error applying zone configuration",
+                     zone=zone, error=str(e))
             return False
     
-    async def _clear_zone_config(self, zone: str) -> None:
-        """Clear existing configuration for a zone."""
-        # Get current config and remove everything
-        current_config = await self.get_zone_config(zone)
-        
-        # Remove services
-        for service in current_config.get("services", []):
-            await self.run_command([
-                "firewall-cmd", "--zone", zone, "--remove-service", service
-            ])
-        
-        # Remove ports
-        for port in current_config.get("ports", []):
-            await self.run_command([
-                "firewall-cmd", "--zone", zone, "--remove-port",
-                f"{port['port']}/{port['protocol']}"
-            ])
-        
-        # Remove protocols
-        for protocol in current_config.get("protocols", []):
-            await self.run_command([
-                "firewall-cmd", "--zone", zone, "--remove-protocol", protocol
-            ])
-        
-        # Remove masquerade
-        if current_config.get("masquerade"):
-            await self.run_command([
-                "firewall-cmd", "--zone", zone, "--remove-masquerade"
-            ])
-        
-        # Remove rich rules
-        for rule in current_config.get("rich_rules", []):
-            if rule:
-                await self.run_command([
-                    "firewall-cmd", "--zone", zone, "--remove-rich-rule", rule
-                ])
+    @staticmethod
+    def _format_forward_port(port: Any, protocol: Any,
+                             to_port: Any = None, to_addr: Any = None) -> str:
+        """Format a forward port the way firewall-cmd takes and lists it."""
+        value = f"port={port}:proto={protocol}"
+        if to_port:
+            value += f":toport={to_port}"
+        if to_addr:
+            value += f":toaddr={to_addr}"
+        return value
     
     def _build_rich_rule_string(self, rich_rule: RichRule) -> str:
         """Build a rich rule string from RichRule object."""
-        parts = ["rule"]
+        return " ".join(self._rich_rule_fragments(rich_rule))
+    
+    @staticmethod
+    def _rich_rule_fragments(rich_rule: RichRule) -> Iterator[str]:
+        """Yield the space-separated fragments of a rich rule string."""
+        yield "rule"
         
-        # Add family
-        if rich_rule.family:
-            parts.append(f"family={rich_rule.family.value}")
+        family = rich_rule.family
+        if family:
+            yield f"family={family.value}"
         
-        # Add source
-        if rich_rule.source:
-            source_parts = []
-            if rich_rule.source.address:
-                source_parts.append(f"address={rich_rule.source.address}")
-            if rich_rule.source.mac:
-                source_parts.append(f"mac={rich_rule.source.mac}")
-            if rich_rule.source.ipset:
-                source_parts.append(f"ipset={rich_rule.source.ipset}")
-            
-            if source_parts:
-                source_str = f"source {' '.join(source_parts)}"
-                if rich_rule.source.invert:
-                    source_str += " NOT"
-                parts.append(source_str)
+        source = rich_rule.source
+        if source:
+            address, mac, ipset = source.address, source.mac, source.ipset
+            if address or mac or ipset:
+                yield "source"
+                if address:
+                    yield f"address={address}"
+                if mac:
+                    yield f"mac={mac}"
+                if ipset:
+                    yield f"ipset={ipset}"
+                if source.invert:
+                    yield "NOT"
         
-        # Add destination
-        if rich_rule.destination:
-            dest_str = f"destination address={rich_rule.destination.address}"
-            if rich_rule.destination.invert:
-                dest_str += " NOT"
-            parts.append(dest_str)
+        destination = rich_rule.destination
+        if destination:
+            yield f"destination address={destination.address}"
+            if destination.invert:
+                yield "NOT"
         
-        # Add service
-        if rich_rule.service:
-            parts.append(f"service name={rich_rule.service.service}")
+        service = rich_rule.service
+        if service:
+            yield f"service name={service.service}"
         
-        # Add port
-        if rich_rule.port:
-            parts.append(f"port port={rich_rule.port.port} protocol={rich_rule.port.protocol}")
+        port = rich_rule.port
+        if port:
+            yield f"port port={port.port} protocol={port.protocol}"
         
-        # Add protocol
-        if rich_rule.protocol:
-            parts.append(f"protocol value={rich_rule.protocol}")
+        protocol = rich_rule.protocol
+        if protocol:
+            yield f"protocol value={protocol}"
         
-        # Add masquerade
-        if rich_rule.masquerade and rich_rule.masquerade.enabled:
-            parts.append("masquerade")
+        masquerade = rich_rule.masquerade
+        if masquerade and masquerade.enabled:
+            yield "masquerade"
         
-        # Add forward port
-        if rich_rule.forward_port:
-            fp_str = f"forward-port port={rich_rule.forward_port.port} protocol={rich_rule.forward_port.protocol}"
-            if rich_rule.forward_port.to_port:
-                fp_str += f" to-port={rich_rule.forward_port.to_port}"
-            if rich_rule.forward_port.to_addr:
-                fp_str += f" to-addr={rich_rule.forward_port.to_addr}"
-            parts.append(fp_str)
-        
-        # Add action
-        if rich_rule.action:
-            parts.append(rich_rule.action.value)
+        forward_port = rich_rule.forward_port
+        if forward_port:
+            yield f"forward-port port={forward_port.port} protocol={forward_port.protocol}"
+            if forward_port.to_port:
+                yield f"to-port={forward_port.to_port}"
+            if forward_port.to_addr:
+                yield f"to-addr={forward_port.to_addr}"
         
-        # Add log
-        if rich_rule.log:
-            log_parts = ["log"]
-            if "prefix" in rich_rule.log:
-                log_parts.append(f"prefix={rich_rule.log['prefix']}")
-            if "level" in rich_rule.log:
-                log_parts.append(f"level={rich_rule.log['level']}")
-            if "limit" in rich_rule.log:
-                log_parts.append(f"limit value={rich_rule.log['limit']}")
-            parts.append(" ".join(log_parts))
+        action = rich_rule.action
+        if action:
+            yield action.value
         
-        # Add audit
-        if rich_rule.audit:
-            parts.append("audit")
+        log = rich_rule.log
+        if log:
+            yield "log"
+            prefix, level, limit = log.get("prefix"), log.get("level"), log.get("limit")
+            if prefix is not None:
+                yield f"prefix={prefix}"
+            if level is not None:
+                yield f"level={level}"
+            if limit is not None:
+                yield f"limit value={limit}"
         
-        return " ".join(parts)
+        if rich_rule.audit:
+            yield "audit"
     
     async def add_rule(self, zone: str, rule_type: str, rule_data: Dict[str, Any]) -> bool:
         """Add a firewall rule."""
         try:
             if rule_type == "service":
-                result = await self.run_command([
-                    "firewall-cmd", "--zone", zone, "--add-service", rule_data["service"]
-                ])
+                result = await self._change_zone(zone, "add-service", rule_data["service"])
             elif rule_type == "port":
-                result = await self.run_command([
-                    "firewall-cmd", "--zone", zone, "--add-port",
-                    f"{rule_data['port']}/{rule_data['protocol']}"
-                ])
+                result = await self._change_zone(
+                    zone, "add-port", f"{rule_data['port']}/{rule_data['protocol']}"
+                )
             elif rule_type == "rich_rule":
                 rule_str = rule_data.get("rule_string")
                 if not rule_str and "rich_rule" in rule_data:
@@ -539,34 +1068,29 @@ class FirewalldManager:
                     rule_str = self._build_rich_rule_string(rich_rule)
                 
                 if rule_str:
-                    result = await self.run_command([
-                        "firewall-cmd", "--zone", zone, "--add-rich-rule", rule_str
-                    ])
+                    result = await self._change_zone(zone, "add-rich-rule", rule_str)
                 else:
                     return False
             else:
-                self.logger.error("Unknown rule type", rule_type=rule_type)
+                _LOG.error("Unknown rule type", rule_type=rule_type)
                 return False
             
             return result["success"]
             
         except Exception as e:
-            self.logger.error("Error adding rule",
-                            zone=zone, rule_type=rule_type, error=str(e))
+            _LOG.error("Error adding rule",
+                     zone=zone, rule_type=rule_type, error=str(e))
             return False
     
     async def remove_rule(self, zone: str, rule_type: str, rule_data: Dict[str, Any]) -> bool:
         """Remove a firewall rule."""
         try:
             if rule_type == "service":
-                result = await self.run_command([
-                    "firewall-cmd", "--zone", zone, "--remove-service", rule_data["service"]
-                ])
+                result = await self._change_zone(zone, "remove-service", rule_data["service"])
             elif rule_type == "port":
-                result = await self.run_command([
-                    "firewall-cmd", "--zone", zone, "--remove-port",
-                    f"{rule_data['port']}/{rule_data['protocol']}"
-                ])
+                result = await self._change_zone(
+                    zone, "remove-port", f"{rule_data['port']}/{rule_data['protocol']}"
+                )
             elif rule_type == "rich_rule":
                 rule_str = rule_data.get("rule_string")
                 if not rule_str and "rich_rule" in rule_data:
@@ -574,23 +1098,27 @@ class FirewalldManager:
                     rule_str = self._build_rich_rule_string(rich_rule)
                 
                 if rule_str:
-                    result = await self.run_command([
-                        "firewall-cmd", "--zone", zone, "--remove-rich-rule", rule_str
-                    ])
+                    result = await self._change_zone(zone, "remove-rich-rule", rule_str)
                 else:
                     return False
             else:
-                self.logger.error("Unknown rule type", rule_type=rule_type)
+                _LOG.error("Unknown rule type", rule_type=rule_type)
                 return False
             
             return result["success"]
             
         except Exception as e:
-            self.logger.error("Error removing rule",
-                            zone=zone, rule_type=rule_type, error=str(e))
+            _LOG.error("Error removing rule",
+                     zone=zone, rule_type=rule_type, error=str(e))
             return False
     
     async def reload(self) -> bool:
         """Reload firewalld configuration."""
-        result = await self.run_command(["firewall-cmd", "--reload"])
+        result = None
+        if await self._connect_dbus():
+            result = await self._dbus_call(self._dbus_root.call_reload)
+        if result is None:
+            result = await self.run_command(["firewall-cmd", "--reload"])
+        self._version_cache = None
+        self._avail_cache = None
         return result["success"]
\ No newline at end of file
@@ -6,8 +6,10 @@ All modules must inherit from BaseModule and implement the required methods.
 Modules are loaded dynamically and can be enabled/disabled at runtime.
 """
 
+import asyncio
+import inspect
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 import logging
 from .protocol import ModuleCapability, ModuleInfo, CommandRequest, CommandResponse
 
@@ -16,8 +18,15 @@ class BaseModule(ABC):
     """Base class for all rootd modules."""
     
     def __init__(self):
-        self.logger = logging.getLogger(f"tuxsec-rootd.module.{self.name}")
+        # One logger per module class, shared by all of its instances
+        cls = type(self)
+        logger = cls.__dict__.get("_class_logger")
+        if logger is None:
+            logger = logging.getLogger(f"tuxsec-rootd.module.{self.name}")
+            cls._class_logger = logger
+        self.logger = logger
         self._initialized = False
+        self._cap_names: Optional[frozenset] = None
     
     @property
     @abstractmethod
@@ -55,7 +64,27 @@ class BaseModule(ABC):
     
     @abstractmethod
     def shutdown(self):
-        """Cleanup on module shutdown."""
+        """
+        Cleanup on module shutdown.
+        
+        May be implemented as a coroutine function; the registry awaits it.
+        """
+        pass
+    
+    def configure_workers(self, workers: int):
+        """
+        Called before the daemon forks, with the number of processes that
+        will serve requests. Each process has its own copy of the module,
+        so state kept between requests is not shared between them.
+        """
+        pass
+    
+    def after_fork(self):
+        """
+        Called in each worker process the daemon forks, before it serves
+        requests. Modules drop anything that must not be shared between
+        processes, such as bus connections opened by the parent.
+        """
         pass
     
     @abstractmethod
@@ -94,40 +123,44 @@ class BaseModule(ABC):
         Returns:
             (is_valid, error_message)
         """
-        # Check if action is in capabilities
-        capabilities = {cap.name for cap in self.get_capabilities()}
-        if command.action not in capabilities:
+        # Check if action is in capabilities (names are cached on registration)
+        if self._cap_names is None:
+            self._cap_names = frozenset(cap.name for cap in self.get_capabilities())
+        if command.action not in self._cap_names:
             return False, f"Unknown action '{command.action}' for module '{self.name}'"
         
         return True, None
     
-    def _run_command(self, cmd: List[str], timeout: int = 30) -> tuple[bool, str, str]:
+    def _run_command(self, cmd: List[str], timeout: int = 30,
+                     binary: bool = False) -> tuple[bool, Union[str, bytes], str]:
         """
         Helper method to run shell commands safely.
         
         Args:
             cmd: Command as list of strings
             timeout: Timeout in seconds
+            binary: Return stdout as undecoded bytes
             
         Returns:
             (success, stdout, stderr)
         """
         import subprocess
         
+        empty = b"" if binary else ""
         try:
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=timeout,
                 check=False
             )
             success = result.returncode == 0
-            return success, result.stdout, result.stderr
+            stdout = result.stdout if binary else result.stdout.decode(errors="replace")
+            return success, stdout, result.stderr.decode(errors="replace")
         except subprocess.TimeoutExpired:
-            return False, "", f"Command timed out after {timeout} seconds"
+            return False, empty, f"Command timed out after {timeout} seconds"
         except Exception as e:
-            return False, "", str(e)
+            return False, empty, str(e)
 
 
 class ModuleRegistry:
@@ -156,6 +189,7 @@ class ModuleRegistry:
             return False, f"Failed to initialize module '{module.name}': {error}"
         
         module._initialized = True
+        module._cap_names = frozenset(cap.name for cap in module.get_capabilities())
         self.modules[module.name] = module
         self.logger.info(f"Registered module: {module.name} v{module.version}")
         return True, None
@@ -166,7 +200,9 @@ class ModuleRegistry:
             return False
         
         module = self.modules[module_name]
-        module.shutdown()
+        result = module.shutdown()
+        if inspect.isawaitable(result):
+            asyncio.run(result)
         del self.modules[module_name]
         self.logger.info(f"Unregistered module: {module_name}")
         return True
@@ -183,11 +219,31 @@ class ModuleRegistry:
         """Get information about all registered modules."""
         return [module.get_info() for module in self.modules.values()]
     
-    def shutdown_all(self):
-        """Shutdown all modules."""
+    def configure_workers(self, workers: int):
+        """Tell every module how many processes will serve requests."""
         for module in self.modules.values():
-            try:
-                module.shutdown()
-            except Exception as e:
-                self.logger.error(f"Error shutting down module {module.name}: {e}")
+            module.configure_workers(workers)
+    
+    def after_fork(self):
+        """Let every module reset its per-process state in a forked worker."""
+        for module in self.modules.values():
+            module.after_fork()
+    
+    async def shutdown_all(self):
+        """Shutdown all modules concurrently."""
+        modules = list(self.modules.values())
+        loop = asyncio.get_running_loop()
+        pending = []
+        for module in modules:
+            if inspect.iscoroutinefunction(module.shutdown):
+                pending.append(module.shutdown())
+            else:
+                # Run blocking shutdowns in threads so one slow module
+                # does not hold up the rest
+                pending.append(loop.run_in_executor(None, module.shutdown))
+        
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        for module, result in zip(modules, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error shutting down module {module.name}: {result}")
         self.modules.clear()
@@ -1,10 +1,9 @@
-c Root Daemon (tuxsec-rootd)
-s root and exposes system management capabilities through
-
-
-
+#!/usr/bin/env python3
+"""
+TuxSec Root Daemon (tuxsec-rootd)
 
- socket. It uses a modular architecture where each module provides
+Runs as root and exposes system management capabilities through a Unix
+socket. It uses a modular architecture where each module provides
 specific functionality (firewalld, SELinux, AIDE, etc.).
 
 Security features:
@@ -16,93 +15,158 @@ Security features:
 
 import os
 import sys
+import argparse
+import asyncio
 import socket
 import signal
 import logging
+import logging.handlers
+import queue
 import json
-import threading
 import importlib
 import pkgutil
+import functools
 import grp
-from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 import uuid
 
 from .base_module import ModuleRegistry
-from .protocol import Message, MessageType, CommandRequest, CommandResponse
+from .protocol import (
+    Message, MessageType, CommandRequest, CommandResponse,
+    HEADER_SIZE, MAX_MESSAGE_SIZE, frame
+)
+
+@functools.lru_cache(maxsize=None)
+def _discover_module_names() -> Tuple[str, ...]:
+    """Names of the public submodules of agent.rootd.modules."""
+    from . import modules
+    
+    names = []
+    for info in pkgutil.iter_modules(modules.__path__):
+        if info.name.startswith('_'):
+            # Skip private modules
+            continue
+        names.append(info.name)
+    return tuple(sorted(names))
+
+
+# Encoded once; PING is answered without a trip through the thread pool
+_PONG_DATA = Message.encode_data({'pong': True})
 
 
 class RootDaemon:
     """Main daemon class for tuxsec-rootd."""
     
-    def __init__(self, socket_path: str = "/var/run/tuxsec/rootd.sock"):
+    def __init__(self, socket_path: str = "/var/run/tuxsec/rootd.sock", workers: int = 1):
         self.socket_path = socket_path
+        self.workers = max(1, workers)
         self.running = False
         self.server_socket: Optional[socket.socket] = None
         self.registry = ModuleRegistry()
         self.logger = self._setup_logging()
+        self._stop_event: Optional[asyncio.Event] = None
         
-        # Setup signal handlers
-        signal.signal(signal.SIGTERM, self._handle_shutdown)
-        signal.signal(signal.SIGINT, self._handle_shutdown)
+        # Pre-forked worker processes (parent only) and whether this is one
+        self._worker_pids: List[int] = []
+        self._is_worker = False
+        
+        # Module list and info are fixed once modules are loaded
+        self._list_modules_cache: List[str] = []
+        self._module_info_cache: Dict[str, Dict[str, Any]] = {}
+        self._encoded_cache: Dict[Tuple[str, Optional[str]], bytes] = {}
+        
+        # Message type -> handler, looked up once per request. Keyed by the
+        # plain string values: incoming types are str, and str-to-str
+        # comparison skips the Enum machinery
+        self._handlers = {
+            MessageType.PING.value: self._handle_ping,
+            MessageType.LIST_MODULES.value: self._handle_list_modules,
+            MessageType.MODULE_INFO.value: self._handle_module_info,
+            MessageType.SYSTEM_INFO.value: self._handle_system_info,
+            MessageType.EXECUTE_COMMAND.value: self._execute_command,
+        }
     
     def _setup_logging(self) -> logging.Logger:
-        """Setup logging configuration."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('/var/log/tuxsec/rootd.log'),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        """
+        Setup logging configuration.
+        
+        Records are handed to a QueueListener thread, so request handling
+        never waits for the log file or stdout to be written.
+        """
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handlers = [
+            logging.FileHandler('/var/log/tuxsec/rootd.log', delay=True),
+            logging.StreamHandler(sys.stdout)
+        ]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        log_queue = queue.SimpleQueue()
+        self._log_listener = logging.handlers.QueueListener(log_queue, *handlers)
+        self._log_listener.start()
+        
+        # The listener's handlers apply the real format; basicConfig would
+        # otherwise give the queue handler its default one as well
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
         return logging.getLogger('tuxsec-rootd')
     
     def _load_modules(self):
         """Load and register all available modules dynamically."""
         self.logger.info("Loading modules...")
         
-        # Import the modules package
-        from . import modules
-        
-        # Get the modules directory path
-        modules_path = Path(modules.__file__).parent
-        
         # Discover all Python modules in the modules directory
-        for importer, module_name, ispkg in pkgutil.iter_modules([str(modules_path)]):
-            if module_name.startswith('_'):
-                # Skip private modules
-                continue
-            
+        for module_name in _discover_module_names():
             try:
                 # Import the module
                 module = importlib.import_module(f'.modules.{module_name}', package='agent.rootd')
                 
-                # Find the module class (should end with 'Module')
-                module_class = None
-                for attr_name in dir(module):
-                    if attr_name.endswith('Module') and not attr_name.startswith('_'):
-                        attr = getattr(module, attr_name)
-                        # Check if it's a class and not the base class
-                        if isinstance(attr, type) and attr.__name__ != 'BaseModule':
-                            module_class = attr
-                            break
+                # Modules name their class in MODULE_CLASS; fall back to
+                # looking for a class whose name ends with 'Module'
+                module_class = getattr(module, 'MODULE_CLASS', None)
+                if module_class is None:
+                    for attr_name in dir(module):
+                        if attr_name.endswith('Module') and not attr_name.startswith('_'):
+                            attr = getattr(module, attr_name)
+                            # Check if it's a class and not the base class
+                            if isinstance(attr, type) and attr.__name__ != 'BaseModule':
+                                module_class = attr
+                                break
                 
                 if module_class:
                     # Instantiate and register the module
                     module_instance = module_class()
                     success, error = self.registry.register_module(module_instance)
                     if success:
-                        self.logger.info(f"Loaded module: {module_name}")
+                        self.logger.info("Loaded module: %s", module_name)
                     else:
-                        self.logger.warning(f"Could not register {module_name}: {error}")
+                        self.logger.warning("Could not register %s: %s", module_name, error)
                 else:
-                    self.logger.warning(f"No module class found in {module_name}")
+                    self.logger.warning("No module class found in %s", module_name)
                     
             except Exception as e:
-                self.logger.warning(f"Could not load module {module_name}: {e}")
+                self.logger.warning("Could not load module %s: %s", module_name, e)
+        
+        self.logger.info("Loaded %d modules: %s",
+                         len(self.registry.modules), ', '.join(self.registry.list_modules()))
+        self._refresh_module_caches()
+    
+    def _refresh_module_caches(self):
+        """Precompute module list/info responses; call again after modules change."""
+        self._list_modules_cache = self.registry.list_modules()
+        self._module_info_cache = {
+            name: module.get_info().to_dict()
+            for name, module in self.registry.modules.items()
+        }
         
-        self.logger.info(f"Loaded {len(self.registry.modules)} modules: {', '.join(self.registry.list_modules())}")
+        # Response data pre-encoded for the fast path in _handle_client
+        self._encoded_cache = {
+            (MessageType.PING.value, None): _PONG_DATA,
+            (MessageType.LIST_MODULES.value, None): Message.encode_data({'modules': self._list_modules_cache}),
+        }
+        for name, info in self._module_info_cache.items():
+            self._encoded_cache[(MessageType.MODULE_INFO.value, name)] = Message.encode_data({'module_info': info})
     
     def _setup_socket(self):
         """Setup the Unix socket."""
@@ -128,8 +192,8 @@ class RootDaemon:
         except KeyError:
             self.logger.warning("Group 'tuxsec' not found, socket will be owned by root:root")
         
-        self.server_socket.listen(5)
-        self.logger.info(f"Listening on {self.socket_path}")
+        self.server_socket.listen(socket.SOMAXCONN)
+        self.logger.info("Listening on %s", self.socket_path)
     
     def start(self):
         """Start the daemon."""
@@ -146,52 +210,123 @@ class RootDaemon:
         # Setup socket
         self._setup_socket()
         
-        self.running = True
-        self.logger.info("tuxsec-rootd started successfully")
+        # Extra processes accept on the same listening socket
+        self._fork_workers()
         
         # Main loop
-        self._run()
+        try:
+            asyncio.run(self._serve())
+        finally:
+            # Flush whatever is still queued for the log handlers
+            self._log_listener.stop()
+    
+    def _fork_workers(self):
+        """
+        Fork workers - 1 child processes that serve the shared socket.
+        
+        Each child gets its own copy of the loaded modules and its own event
+        loop, so requests are handled without sharing a GIL; the kernel hands
+        each incoming connection to one of the accepting processes. Modules
+        are told the process count first, since state one process keeps
+        between requests (such as cached query results) is not seen by the
+        others.
+        """
+        if self.workers < 2:
+            return
+        
+        self.registry.configure_workers(self.workers)
+        
+        # The listener thread would not exist in the children, and must not
+        # hold the queue's lock while forking; each process restarts its own
+        self._log_listener.stop()
+        try:
+            for _ in range(self.workers - 1):
+                pid = os.fork()
+                if pid == 0:
+                    self._is_worker = True
+                    self._worker_pids = []
+                    self.registry.after_fork()
+                    return
+                self._worker_pids.append(pid)
+        finally:
+            self._log_listener.start()
+        
+        if self._worker_pids:
+            self.logger.info("Started %d worker processes", len(self._worker_pids))
     
-    def _run(self):
-        """Main event loop."""
-        while self.running:
+    def _stop_workers(self):
+        """Forward shutdown to the worker processes and reap them."""
+        for pid in self._worker_pids:
             try:
-                # Accept connections
-                client_socket, _ = self.server_socket.accept()
-                
-                # Handle in a thread
-                thread = threading.Thread(
-                    target=self._handle_client,
-                    args=(client_socket,)
-                )
-                thread.daemon = True
-                thread.start()
-                
-            except Exception as e:
-                if self.running:
-                    self.logger.error(f"Error accepting connection: {e}")
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in self._worker_pids:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        self._worker_pids = []
+    
+    async def _serve(self):
+        """Main event loop: serve clients until a shutdown signal arrives."""
+        loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self._handle_shutdown, sig, None)
+        
+        # start_unix_server re-issues listen(); keep the kernel's full backlog
+        # so bursts of short-lived clients are queued rather than refused
+        server = await asyncio.start_unix_server(
+            self._handle_client, sock=self.server_socket, backlog=socket.SOMAXCONN
+        )
+        
+        self.running = True
+        self.logger.info("tuxsec-rootd started successfully")
+        
+        async with server:
+            await self._stop_event.wait()
+        
+        # Shutdown all modules
+        await self.registry.shutdown_all()
+        
+        if self._is_worker:
+            return
+        
+        await asyncio.get_running_loop().run_in_executor(None, self._stop_workers)
+        
+        # Remove socket file
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        
+        self.logger.info("tuxsec-rootd stopped")
     
-    def _handle_client(self, client_socket: socket.socket):
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
         """Handle a client connection."""
         try:
-            # Receive data
-            data = b""
-            while True:
-                chunk = client_socket.recv(4096)
-                if not chunk:
-                    break
-                data += chunk
-                
-                # Check if we have a complete message (ends with newline)
-                if b'\n' in data:
-                    break
+            # Receive one length-prefixed message
+            try:
+                header = await reader.readexactly(HEADER_SIZE)
+            except asyncio.IncompleteReadError:
+                # Client closed the connection without sending anything
+                return
             
-            if not data:
+            length = int.from_bytes(header, 'big')
+            if length > MAX_MESSAGE_SIZE:
+                self.logger.error("Message too large: %d bytes", length)
+                error_response = Message(
+                    type=MessageType.ERROR,
+                    request_id="unknown",
+                    data={'error': 'Message too large'}
+                )
+                writer.write(frame(error_response.to_json()))
+                await writer.drain()
                 return
             
-            # Decode and parse message
-            message_str = data.decode('utf-8').strip()
-            message = Message.from_json(message_str)
+            data = await reader.readexactly(length)
+            
+            # Parse message
+            message = Message.from_json(data)
             
             # Validate message
             if not message.validate():
@@ -200,108 +335,126 @@ class RootDaemon:
                     request_id=message.request_id,
                     data={'error': 'Invalid message format'}
                 )
-                client_socket.sendall((response.to_json() + '\n').encode('utf-8'))
+                writer.write(frame(response.to_json()))
+                await writer.drain()
                 return
             
-            # Process message
-            response = self._process_message(message)
+            encoded_data = self._cached_response_data(message)
+            if encoded_data is not None:
+                payload = Message.encode(MessageType.SUCCESS, message.request_id, encoded_data)
+            else:
+                # Process message; module commands block, so keep them off the loop
+                loop = asyncio.get_running_loop()
+                response = await loop.run_in_executor(None, self._process_message, message)
+                payload = response.to_json()
             
             # Send response
-            client_socket.sendall((response.to_json() + '\n').encode('utf-8'))
+            writer.write(frame(payload))
+            await writer.drain()
             
         except json.JSONDecodeError as e:
-            self.logger.error(f"JSON decode error: {e}")
+            self.logger.error("JSON decode error: %s", e)
             error_response = Message(
                 type=MessageType.ERROR,
                 request_id="unknown",
                 data={'error': 'Invalid JSON'}
             )
-            client_socket.sendall((error_response.to_json() + '\n').encode('utf-8'))
+            writer.write(frame(error_response.to_json()))
+            await writer.drain()
         except Exception as e:
-            self.logger.error(f"Error handling client: {e}")
+            self.logger.error("Error handling client: %s", e)
         finally:
-            client_socket.close()
+            writer.close()
+    
+    def _cached_response_data(self, message: Message) -> Optional[bytes]:
+        """Pre-encoded SUCCESS data for fixed queries, or None."""
+        key = None
+        if message.type == MessageType.MODULE_INFO.value:
+            key = message.data.get('module')
+            if not isinstance(key, str):
+                return None
+        return self._encoded_cache.get((message.type, key))
     
     def _process_message(self, message: Message) -> Message:
         """Process a message and return response."""
         try:
-            msg_type = message.type
-            
-            if msg_type == MessageType.PING:
-                return Message(
-                    type=MessageType.SUCCESS,
-                    request_id=message.request_id,
-                    data={'pong': True}
-                )
-            
-            elif msg_type == MessageType.LIST_MODULES:
-                modules = self.registry.list_modules()
-                return Message(
-                    type=MessageType.SUCCESS,
-                    request_id=message.request_id,
-                    data={'modules': modules}
-                )
-            
-            elif msg_type == MessageType.MODULE_INFO:
-                module_name = message.data.get('module')
-                if not module_name:
-                    return Message(
-                        type=MessageType.ERROR,
-                        request_id=message.request_id,
-                        data={'error': 'Module name is required'}
-                    )
-                
-                module = self.registry.get_module(module_name)
-                if not module:
-                    return Message(
-                        type=MessageType.ERROR,
-                        request_id=message.request_id,
-                        data={'error': f'Module not found: {module_name}'}
-                    )
-                
-                return Message(
-                    type=MessageType.SUCCESS,
-                    request_id=message.request_id,
-                    data={'module_info': module.get_info().to_dict()}
-                )
-            
-            elif msg_type == MessageType.SYSTEM_INFO:
-                # Shortcut to get system info
-                module = self.registry.get_module('systeminfo')
-                if not module:
-                    return Message(
-                        type=MessageType.ERROR,
-                        request_id=message.request_id,
-                        data={'error': 'System info module not available'}
-                    )
-                
-                cmd = CommandRequest(module='systeminfo', action='get_info', parameters={})
-                result = module.execute_command(cmd)
-                
-                return Message(
-                    type=MessageType.SUCCESS if result.success else MessageType.ERROR,
-                    request_id=message.request_id,
-                    data=result.to_dict()
-                )
-            
-            elif msg_type == MessageType.EXECUTE_COMMAND:
-                return self._execute_command(message)
-            
-            else:
+            handler = self._handlers.get(message.type)
+            if handler is None:
                 return Message(
                     type=MessageType.ERROR,
                     request_id=message.request_id,
-                    data={'error': f'Unknown message type: {msg_type}'}
+                    data={'error': f'Unknown message type: {message.type}'}
                 )
+            
+            return handler(message)
                 
         except Exception as e:
-            self.logger.error(f"Error processing message: {e}")
+            self.logger.error("Error processing message: %s", e)
             return Message(
                 type=MessageType.ERROR,
                 request_id=message.request_id,
                 data={'error': str(e)}
             )
     
+    def _handle_ping(self, message: Message) -> Message:
+        """Answer a health check."""
+        return Message(
+            type=MessageType.SUCCESS,
+            request_id=message.request_id,
+            data={'pong': True}
+        )
+    
+    def _handle_list_modules(self, message: Message) -> Message:
+        """List the loaded modules."""
+        return Message(
+            type=MessageType.SUCCESS,
+            request_id=message.request_id,
+            data={'modules': self._list_modules_cache}
+        )
+    
+    def _handle_module_info(self, message: Message) -> Message:
+        """Describe one module and its capabilities."""
+        module_name = message.data.get('module')
+        if not module_name:
+            return Message(
+                type=MessageType.ERROR,
+                request_id=message.request_id,
+                data={'error': 'Module name is required'}
+            )
+        
+        module_info = self._module_info_cache.get(module_name)
+        if module_info is None:
+            return Message(
+                type=MessageType.ERROR,
+                request_id=message.request_id,
+                data={'error': f'Module not found: {module_name}'}
+            )
+        
+        return Message(
+            type=MessageType.SUCCESS,
+            request_id=message.request_id,
+            data={'module_info': module_info}
+        )
+    
+    def _handle_system_info(self, message: Message) -> Message:
+        """Shortcut to get system info."""
+        module = self.registry.get_module('systeminfo')
+        if not module:
+            return Message(
+                type=MessageType.ERROR,
+                request_id=message.request_id,
+                data={'error': 'System info module not available'}
+            )
+        
+        cmd = CommandRequest(module='systeminfo', action='get_info', parameters={})
+        result = module.execute_command(cmd)
+        
+        return Message(
+            type=MessageType.SUCCESS if result.success else MessageType.ERROR,
+            request_id=message.request_id,
+            data=result.to_dict()
+        )
+    
     def _execute_command(self, message: Message) -> Message:
         """Execute a module command."""
         try:
@@ -327,7 +480,7 @@ class RootDaemon:
                 )
             
             # Execute command
-            self.logger.info(f"Executing: {command.module}.{command.action}")
+            self.logger.info("Executing: %s.%s", command.module, command.action)
             result = module.execute_command(command)
             
             return Message(
@@ -337,7 +490,7 @@ class RootDaemon:
             )
             
         except Exception as e:
-            self.logger.error(f"Error executing command: {e}")
+            self.logger.error("Error executing command: %s", e)
             return Message(
                 type=MessageType.ERROR,
                 request_id=message.request_id,
@@ -350,27 +503,37 @@ class RootDaemon:
         self.stop()
     
     def stop(self):
-        """Stop the daemon."""
+        """
+        Stop the daemon.
+        
+        Must be called from the event loop thread; the serve loop then shuts
+        down the modules and removes the socket.
+        """
         self.logger.info("Stopping tuxsec-rootd...")
         self.running = False
         
-        # Shutdown all modules
-        self.registry.shutdown_all()
-        
-        # Close socket
-        if self.server_socket:
-            self.server_socket.close()
-        
-        # Remove socket file
-        if os.path.exists(self.socket_path):
-            os.unlink(self.socket_path)
-        
-        self.logger.info("tuxsec-rootd stopped")
+        if self._stop_event is not None:
+            self._stop_event.set()
 
 
 def main():
     """Main entry point."""
-    daemon = RootDaemon()
+    parser = argparse.ArgumentParser(description='TuxSec Root Daemon')
+    parser.add_argument(
+        '--socket',
+        default='/var/run/tuxsec/rootd.sock',
+        help='Path to the Unix socket'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of processes accepting connections (query caching and wait=false are disabled above 1)'
+    )
+    
+    args = parser.parse_args()
+    
+    daemon = RootDaemon(socket_path=args.socket, workers=args.workers)
     daemon.start()
 
 
@@ -10,15 +10,996 @@ This module provides firewalld management capabilities including:
 - Query operations
 """
 
-from typing import List, Optional, Dict, Any
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Callable, Tuple
+import re
+import threading
+import time
 from ..base_module import BaseModule
 from ..protocol import ModuleCapability, CommandRequest, CommandResponse
 
+# dbus-python is imported by _import_dbus() the first time firewalld is
+# contacted, so processes that never manage the firewall do not load it.
+dbus = None
+_dbus_unavailable = False
+
+
+FIREWALLD_BUS_NAME = "org.fedoraproject.FirewallD1"
+FIREWALLD_PATH = "/org/fedoraproject/FirewallD1"
+FIREWALLD_CONFIG_PATH = "/org/fedoraproject/FirewallD1/config"
+SYSTEMD_BUS_NAME = "org.freedesktop.systemd1"
+SYSTEMD_PATH = "/org/freedesktop/systemd1"
+FIREWALLD_UNIT = "firewalld.service"
+
+# Seconds between checks while waiting for a systemd job on firewalld.service
+_UNIT_JOB_POLL = 0.1
+
+# Zone changes that may be combined in a batch request
+_BATCH_ACTIONS = frozenset({
+    "add_service", "remove_service",
+    "add_interface", "remove_interface", "change_interface",
+    "add_source", "remove_source", "change_source",
+    "add_port", "remove_port",
+    "add_rich_rule", "remove_rich_rule",
+    "add_protocol", "remove_protocol",
+    "add_source_port", "remove_source_port",
+    "add_icmp_block", "remove_icmp_block",
+    "add_icmp_block_inversion", "remove_icmp_block_inversion",
+    "add_masquerade", "remove_masquerade",
+    "add_forward_port", "remove_forward_port",
+})
+
+# Seconds that the responses of rarely-changing query actions are served
+# from cache (None: until invalidated)
+_CACHE_TTLS = {
+    "get_version": None,
+    "list_services": 3600,
+    "list_icmptypes": 3600,
+    "list_helpers": 3600,
+    "list_zones": 60,
+    "list_ipsets": 60,
+    "get_log_denied": 30,
+    "get_default_zone": 10,
+    "query_panic": 10,
+}
+
+# Read-only actions that may be combined in a query_many request
+_QUERY_ACTIONS = frozenset({
+    "get_status", "get_version", "list_zones", "get_zone", "get_default_zone",
+    "get_active_zones", "get_zone_of_interface", "get_zone_of_source",
+    "list_interfaces", "list_sources", "list_services", "list_icmptypes",
+    "service_status", "query_panic", "get_log_denied", "get_service_info",
+    "list_ipsets", "get_ipset_info", "list_helpers", "zone_list_helpers",
+    "list_policies", "policy_get_info", "lockdown_get_status",
+})
+
+# Permanent batch operations that map onto a zone settings field:
+# action -> (settings key, request parameter, add?). A None parameter
+# marks a boolean field.
+_SETTINGS_OPS = {
+    "add_service": ("services", "service", True),
+    "remove_service": ("services", "service", False),
+    "add_interface": ("interfaces", "interface", True),
+    "remove_interface": ("interfaces", "interface", False),
+    "add_source": ("sources", "source", True),
+    "remove_source": ("sources", "source", False),
+    "add_rich_rule": ("rules_str", "rule", True),
+    "remove_rich_rule": ("rules_str", "rule", False),
+    "add_protocol": ("protocols", "protocol", True),
+    "remove_protocol": ("protocols", "protocol", False),
+    "add_port": ("ports", "port", True),
+    "remove_port": ("ports", "port", False),
+    "add_source_port": ("source_ports", "port", True),
+    "remove_source_port": ("source_ports", "port", False),
+    "add_icmp_block": ("icmp_blocks", "icmp_type", True),
+    "remove_icmp_block": ("icmp_blocks", "icmp_type", False),
+    "add_masquerade": ("masquerade", None, True),
+    "remove_masquerade": ("masquerade", None, False),
+    "add_icmp_block_inversion": ("icmp_block_inversion", None, True),
+    "remove_icmp_block_inversion": ("icmp_block_inversion", None, False),
+}
+
+# Threads running batch groups and query_many queries. Each daemon process
+# has one pool with an equal share of them (at least one), so together the
+# processes never run more than max(_BATCH_MAX_WORKERS, workers) at once
+_BATCH_MAX_WORKERS = 8
+
+# firewalld errors that firewall-cmd reports as warnings with exit code 0
+_DBUS_WARNING_CODES = frozenset({"ALREADY_ENABLED", "NOT_ENABLED", "ZONE_ALREADY_SET"})
+
+# A port or port range with its protocol, e.g. "8080/tcp" or "6000-6010/udp"
+_PORT_RE = re.compile(r'(\d{1,5}(?:-\d{1,5})?)/(tcp|udp|sctp|dccp)')
+
+
+def _split_port(port: str) -> Optional[Tuple[str, str]]:
+    """Split "8080/tcp" into ("8080", "tcp"); None if port is malformed."""
+    match = _PORT_RE.fullmatch(port)
+    if match is None:
+        return None
+    return match.group(1), match.group(2)
+
+
+def _split_names(stdout: bytes) -> List[str]:
+    """Split firewall-cmd's whitespace-separated name list into strings."""
+    return [name.decode(errors='replace') for name in stdout.split()]
+
+
+def _import_dbus() -> bool:
+    """Import dbus-python on first use; False if it is not installed."""
+    global dbus, _dbus_unavailable
+    if dbus is None and not _dbus_unavailable:
+        try:
+            import dbus
+        except ImportError:
+            _dbus_unavailable = True
+    return dbus is not None
+
+
+# Parameter descriptors shared by many capabilities. They are referenced,
+# not copied, so treat them as read-only.
+_PERM_PARAM = {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
+_ZONE_PARAM = {"name": "zone", "type": "string", "description": "Zone name", "required": "true"}
+_SERVICE_PARAM = {"name": "service", "type": "string", "description": "Service name", "required": "true"}
+_INTERFACE_PARAM = {"name": "interface", "type": "string", "description": "Interface name", "required": "true"}
+_IPSET_PARAM = {"name": "ipset", "type": "string", "description": "IPSet name", "required": "true"}
+_POLICY_PARAM = {"name": "policy", "type": "string", "description": "Policy name", "required": "true"}
+_IPV_PARAM = {"name": "ipv", "type": "string", "description": "IP version (ipv4 or ipv6)", "required": "true"}
+_TABLE_PARAM = {"name": "table", "type": "string", "description": "Table name (filter, nat, mangle, raw)", "required": "true"}
+_CHAIN_PARAM = {"name": "chain", "type": "string", "description": "Chain name", "required": "true"}
+_WAIT_PARAM = {"name": "wait", "type": "boolean", "description": "Wait for firewalld to apply the change (default true; false needs a single rootd worker)", "required": "false"}
+
+# Built once at import; every module instance returns the same tuple
+_CAPABILITIES: Tuple[ModuleCapability, ...] = (
+    # Query operations
+    ModuleCapability(
+        name="get_status",
+        description="Get firewalld running status",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="get_version",
+        description="Get firewalld version",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="list_zones",
+        description="List all zones",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="get_zone",
+        description="Get zone configuration",
+        parameters=[
+            _ZONE_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="get_default_zone",
+        description="Get default zone",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="list_services",
+        description="List all available firewalld services",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="list_icmptypes",
+        description="List available ICMP types",
+        parameters=[]
+    ),
+    
+    # Zone operations
+    ModuleCapability(
+        name="new_zone",
+        description="Create a new zone",
+        parameters=[
+            _ZONE_PARAM,
+            {"name": "permanent", "type": "boolean", "description": "Create permanent zone", "required": "false"}
+        ]
+    ),
+    ModuleCapability(
+        name="delete_zone",
+        description="Delete a zone",
+        parameters=[
+            _ZONE_PARAM,
+            {"name": "permanent", "type": "boolean", "description": "Delete permanent zone", "required": "false"}
+        ]
+    ),
+    ModuleCapability(
+        name="get_zone_of_interface",
+        description="Get the zone an interface belongs to",
+        parameters=[
+            _INTERFACE_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="get_zone_of_source",
+        description="Get the zone a source belongs to",
+        parameters=[
+            {"name": "source", "type": "string", "description": "Source (IP/CIDR)", "required": "true"}
+        ]
+    ),
+    ModuleCapability(
+        name="set_default_zone",
+        description="Set default zone",
+        parameters=[
+            _ZONE_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="get_active_zones",
+        description="Get all active zones with their interfaces and sources",
+        parameters=[]
+    ),
+    
+    # Service operations
+    ModuleCapability(
+        name="add_service",
+        description="Add service to zone",
+        parameters=[
+            _ZONE_PARAM,
+            _SERVICE_PARAM,
+            _PERM_PARAM,
+            _WAIT_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="remove_service",
+        description="Remove service from zone",
+        parameters=[
+            _ZONE_PARAM,
+            _SERVICE_PARAM,
+            _PERM_PARAM,
+            _WAIT_PARAM
+        ]
+    ),
+    
+    # Interface operations
+    ModuleCapability(
+        name="add_interface",
+        description="Add interface to zone",
+        parameters=[
+            _ZONE_PARAM,
+            {"name": "interface", "type": "string", "description": "Interface name (e.g., eth0)", "required": "true"},
+            _PERM_PARAM,
+            _WAIT_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="remove_interface",
+        description="Remove interface from zone",
+        parameters=[
+            _ZONE_PARAM,
+            _INTERFACE_PARAM,
+            _PERM_PARAM,
+            _WAIT_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="change_interface",
+        description="Change interface to different zone",
+        parameters=[
+            {"name": "zone", "type": "string", "description": "Target zone name", "required": "true"},
+            _INTERFACE_PARAM,
+            _PERM_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="list_interfaces",
+        description="List interfaces in a zone",
+        parameters=[
+            _ZONE_PARAM
+        ]
+    ),
+    
+    # Source operations
+    ModuleCapability(
+        name="add_source",
+        description="Add source to zone",
+        parameters=[
+            _ZONE_PARAM,
+            {"name": "source", "type": "string", "description": "Source (IP/CIDR, MAC, ipset)", "required": "true"},
+            _PERM_PARAM,
+            _WAIT_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="remove_source",
+        description="Remove source from zone",
+        parameters=[
+            _ZONE_PARAM,
+            {"name": "source", "type": "string", "description": "Source", "required": "true"},
+            _PERM_PARAM,
+            _WAIT_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="change_source",
+        description="Change source to different zone",
+        parameters=[
+            {"name": "zone", "type": "string", "description": "Target zone name", "required": "true"},
+            {"name": "source", "type": "string", "description": "Source", "required": "true"},
+            _PERM_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="list_sources",
+        description="List sources in a zone",
+        parameters=[
+            _ZONE_PARAM
+        ]
+    ),
+    
+    # Port operations
+    ModuleCapability(
+        name="add_port",
+        description="Add port to zone",
+        parameters=[
+            _ZONE_PARAM,
+            {"name": "port", "type": "string", "description": "Port/protocol (e.g., 8080/tcp)", "required": "true"},
+            _PERM_PARAM,
+            _WAIT_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="remove_port",
+        description="Remove port from zone",
+        parameters=[
+            _ZONE_PARAM,
+            {"name": "port", "type": "string", "description": "Port/protocol (e.g., 8080/tcp)", "required": "true"},
+            _PERM_PARAM,
+            _WAIT_PARAM
+        ]
+    ),
+    
+    # Rich rule operations
+    ModuleCapability(
+        name="add_rich_rule",
+        description="Add rich rule to zone",
+        parameters=[
+            _ZONE_PARAM,
+            {"name": "rule", "type": "string", "description": "Rich rule", "required": "true"},
+            _PERM_PARAM,
+            _WAIT_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="remove_rich_rule",
+        description="Remove rich rule from zone",
+        parameters=[
+            _ZONE_PARAM,
+            {"name": "rule", "type": "string", "description": "Rich rule", "required": "true"},
+            _PERM_PARAM,
+            _WAIT_PARAM
+        ]
+    ),
+    
+    # Protocol operations
+    ModuleCapability(
+        name="add_protocol",
+        description="Add protocol to zone",
+        parameters=[
+            _ZONE_PARAM,
+            {"name": "protocol", "type": "string", "description": "Protocol (e.g., icmp, igmp)", "required": "true"},
+            _PERM_PARAM,
+            _WAIT_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="remove_protocol",
+        description="Remove protocol from zone",
+        parameters=[
+            _ZONE_PARAM,
+            {"name": "protocol", "type": "string", "description": "Protocol", "required": "true"},
+            _PERM_PARAM,
+            _WAIT_PARAM
+        ]
+    ),
+    
+    # Source port operations
+    ModuleCapability(
+        name="add_source_port",
+        description="Add source port to zone",
+        parameters=[
+            _ZONE_PARAM,
+            {"name": "port", "type": "string", "description": "Source port/protocol (e.g., 8080/tcp)", "required": "true"},
+            _PERM_PARAM,
+            _WAIT_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="remove_source_port",
+        description="Remove source port from zone",
+        parameters=[
+            _ZONE_PARAM,
+            {"name": "port", "type": "string", "description": "Source port/protocol", "required": "true"},
+            _PERM_PARAM,
+            _WAIT_PARAM
+        ]
+    ),
+    
+    # ICMP block operations
+    ModuleCapability(
+        name="add_icmp_block",
+        description="Add ICMP block to zone",
+        parameters=[
+            _ZONE_PARAM,
+            {"name": "icmp_type", "type": "string", "description": "ICMP type", "required": "true"},
+            _PERM_PARAM,
+            _WAIT_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="remove_icmp_block",
+        description="Remove ICMP block from zone",
+        parameters=[
+            _ZONE_PARAM,
+            {"name": "icmp_type", "type": "string", "description": "ICMP type", "required": "true"},
+            _PERM_PARAM,
+            _WAIT_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="add_icmp_block_inversion",
+        description="Enable ICMP block inversion for zone",
+        parameters=[
+            _ZONE_PARAM,
+            _PERM_PARAM,
+            _WAIT_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="remove_icmp_block_inversion",
+        description="Disable ICMP block inversion for zone",
+        parameters=[
+            _ZONE_PARAM,
+            _PERM_PARAM,
+            _WAIT_PARAM
+        ]
+    ),
+    
+    # Masquerade operations
+    ModuleCapability(
+        name="add_masquerade",
+        description="Enable masquerading for zone",
+        parameters=[
+            _ZONE_PARAM,
+            _PERM_PARAM,
+            _WAIT_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="remove_masquerade",
+        description="Disable masquerading for zone",
+        parameters=[
+            _ZONE_PARAM,
+            _PERM_PARAM,
+            _WAIT_PARAM
+        ]
+    ),
+    
+    # Forward port operations
+    ModuleCapability(
+        name="add_forward_port",
+        description="Add port forwarding rule to zone",
+        parameters=[
+            _ZONE_PARAM,
+            {"name": "port", "type": "string", "description": "Port/protocol (e.g., 80/tcp)", "required": "true"},
+            {"name": "to_port", "type": "string", "description": "Destination port", "required": "false"},
+            {"name": "to_addr", "type": "string", "description": "Destination address", "required": "false"},
+            _PERM_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="remove_forward_port",
+        description="Remove port forwarding rule from zone",
+        parameters=[
+            _ZONE_PARAM,
+            {"name": "port", "type": "string", "description": "Port/protocol", "required": "true"},
+            {"name": "to_port", "type": "string", "description": "Destination port", "required": "false"},
+            {"name": "to_addr", "type": "string", "description": "Destination address", "required": "false"},
+            _PERM_PARAM
+        ]
+    ),
+    
+    # Control operations
+    ModuleCapability(
+        name="reload",
+        description="Reload firewalld configuration",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="complete_reload",
+        description="Complete reload - recreates all zones, interfaces, and rules",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="runtime_to_permanent",
+        description="Save runtime configuration to permanent",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="check_config",
+        description="Check firewalld configuration for errors",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="query_many",
+        description="Run several read-only queries concurrently",
+        parameters=[
+            {"name": "queries", "type": "array", "description": "List of {action, parameters} queries", "required": "true"}
+        ]
+    ),
+    ModuleCapability(
+        name="sync",
+        description="Wait until changes made with wait=false have been applied",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="batch",
+        description="Apply a list of zone changes in one request",
+        parameters=[
+            {"name": "operations", "type": "array", "description": "List of {action, parameters} zone changes", "required": "true"},
+            {"name": "reload", "type": "boolean", "description": "Reload firewalld once after all operations", "required": "false"}
+        ]
+    ),
+    
+    # Service control operations
+    ModuleCapability(
+        name="service_status",
+        description="Get firewalld service status",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="start_service",
+        description="Start firewalld service",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="stop_service",
+        description="Stop firewalld service",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="restart_service",
+        description="Restart firewalld service",
+        parameters=[]
+    ),
+    
+    # Panic mode operations
+    ModuleCapability(
+        name="query_panic",
+        description="Check if panic mode is enabled",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="panic_on",
+        description="Enable panic mode (drop all incoming and outgoing packets)",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="panic_off",
+        description="Disable panic mode",
+        parameters=[]
+    ),
+    
+    # Log denied packets operations
+    ModuleCapability(
+        name="get_log_denied",
+        description="Get log denied packets setting",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="set_log_denied",
+        description="Set log denied packets (all, unicast, broadcast, multicast, off)",
+        parameters=[
+            {"name": "value", "type": "string", "description": "Log level: all, unicast, broadcast, multicast, off", "required": "true"}
+        ]
+    ),
+    
+    # Custom service management operations
+    ModuleCapability(
+        name="get_service_info",
+        description="Get detailed information about a service",
+        parameters=[
+            _SERVICE_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="new_service",
+        description="Create a new custom service",
+        parameters=[
+            _SERVICE_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="delete_service",
+        description="Delete a custom service",
+        parameters=[
+            _SERVICE_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="service_add_port",
+        description="Add port to a service definition",
+        parameters=[
+            _SERVICE_PARAM,
+            {"name": "port", "type": "string", "description": "Port number or range", "required": "true"},
+            {"name": "protocol", "type": "string", "description": "Protocol (tcp/udp)", "required": "true"}
+        ]
+    ),
+    ModuleCapability(
+        name="service_remove_port",
+        description="Remove port from a service definition",
+        parameters=[
+            _SERVICE_PARAM,
+            {"name": "port", "type": "string", "description": "Port number or range", "required": "true"},
+            {"name": "protocol", "type": "string", "description": "Protocol (tcp/udp)", "required": "true"}
+        ]
+    ),
+    ModuleCapability(
+        name="service_add_protocol",
+        description="Add protocol to a service definition",
+        parameters=[
+            _SERVICE_PARAM,
+            {"name": "protocol", "type": "string", "description": "Protocol name", "required": "true"}
+        ]
+    ),
+    ModuleCapability(
+        name="service_remove_protocol",
+        description="Remove protocol from a service definition",
+        parameters=[
+            _SERVICE_PARAM,
+            {"name": "protocol", "type": "string", "description": "Protocol name", "required": "true"}
+        ]
+    ),
+    
+    # IPSet management operations
+    ModuleCapability(
+        name="list_ipsets",
+        description="List all IPSets",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="get_ipset_info",
+        description="Get detailed information about an IPSet",
+        parameters=[
+            _IPSET_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="new_ipset",
+        description="Create a new IPSet",
+        parameters=[
+            _IPSET_PARAM,
+            {"name": "type", "type": "string", "description": "IPSet type (hash:ip, hash:net, hash:mac, etc)", "required": "true"}
+        ]
+    ),
+    ModuleCapability(
+        name="delete_ipset",
+        description="Delete an IPSet",
+        parameters=[
+            _IPSET_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="ipset_add_entry",
+        description="Add entry to an IPSet",
+        parameters=[
+            _IPSET_PARAM,
+            {"name": "entry", "type": "string", "description": "Entry to add (IP, network, MAC)", "required": "true"}
+        ]
+    ),
+    ModuleCapability(
+        name="ipset_remove_entry",
+        description="Remove entry from an IPSet",
+        parameters=[
+            _IPSET_PARAM,
+            {"name": "entry", "type": "string", "description": "Entry to remove", "required": "true"}
+        ]
+    ),
+    ModuleCapability(
+        name="zone_add_source_ipset",
+        description="Add IPSet as source to zone",
+        parameters=[
+            _ZONE_PARAM,
+            _IPSET_PARAM,
+            _PERM_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="zone_remove_source_ipset",
+        description="Remove IPSet source from zone",
+        parameters=[
+            _ZONE_PARAM,
+            _IPSET_PARAM,
+            _PERM_PARAM
+        ]
+    ),
+    
+    # Helper module management operations
+    ModuleCapability(
+        name="list_helpers",
+        description="List all available helper modules",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="zone_list_helpers",
+        description="List helpers enabled in a zone",
+        parameters=[
+            _ZONE_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="zone_add_helper",
+        description="Add helper module to zone",
+        parameters=[
+            _ZONE_PARAM,
+            {"name": "helper", "type": "string", "description": "Helper module name", "required": "true"},
+            _PERM_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="zone_remove_helper",
+        description="Remove helper module from zone",
+        parameters=[
+            _ZONE_PARAM,
+            {"name": "helper", "type": "string", "description": "Helper module name", "required": "true"},
+            _PERM_PARAM
+        ]
+    ),
+    
+    # Policy management operations
+    ModuleCapability(
+        name="list_policies",
+        description="List all firewall policies",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="policy_add",
+        description="Add a new firewall policy",
+        parameters=[
+            _POLICY_PARAM,
+            _PERM_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="policy_delete",
+        description="Delete a firewall policy",
+        parameters=[
+            _POLICY_PARAM,
+            _PERM_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="policy_get_info",
+        description="Get detailed information about a policy",
+        parameters=[
+            _POLICY_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="policy_set_ingress_zone",
+        description="Set ingress zone for policy",
+        parameters=[
+            _POLICY_PARAM,
+            {"name": "zone", "type": "string", "description": "Ingress zone name", "required": "true"},
+            _PERM_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="policy_set_egress_zone",
+        description="Set egress zone for policy",
+        parameters=[
+            _POLICY_PARAM,
+            {"name": "zone", "type": "string", "description": "Egress zone name", "required": "true"},
+            _PERM_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="policy_set_target",
+        description="Set target action for policy",
+        parameters=[
+            _POLICY_PARAM,
+            {"name": "target", "type": "string", "description": "Target action (ACCEPT, REJECT, DROP, CONTINUE)", "required": "true"},
+            _PERM_PARAM
+        ]
+    ),
+    
+    # Direct rules management operations
+    ModuleCapability(
+        name="direct_get_all_chains",
+        description="Get all direct chains",
+        parameters=[
+            _IPV_PARAM,
+            _TABLE_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="direct_add_chain",
+        description="Add a new direct chain",
+        parameters=[
+            _IPV_PARAM,
+            _TABLE_PARAM,
+            _CHAIN_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="direct_remove_chain",
+        description="Remove a direct chain",
+        parameters=[
+            _IPV_PARAM,
+            _TABLE_PARAM,
+            _CHAIN_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="direct_get_all_rules",
+        description="Get all direct rules",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="direct_add_rule",
+        description="Add a direct rule",
+        parameters=[
+            _IPV_PARAM,
+            _TABLE_PARAM,
+            _CHAIN_PARAM,
+            {"name": "priority", "type": "integer", "description": "Rule priority (0-999)", "required": "true"},
+            {"name": "args", "type": "array", "description": "Rule arguments", "required": "true"}
+        ]
+    ),
+    ModuleCapability(
+        name="direct_remove_rule",
+        description="Remove a direct rule",
+        parameters=[
+            _IPV_PARAM,
+            _TABLE_PARAM,
+            _CHAIN_PARAM,
+            {"name": "priority", "type": "integer", "description": "Rule priority (0-999)", "required": "true"},
+            {"name": "args", "type": "array", "description": "Rule arguments", "required": "true"}
+        ]
+    ),
+    ModuleCapability(
+        name="direct_get_passthrough",
+        description="Get all passthrough rules",
+        parameters=[
+            _IPV_PARAM
+        ]
+    ),
+    ModuleCapability(
+        name="direct_add_passthrough",
+        description="Add a passthrough rule",
+        parameters=[
+            _IPV_PARAM,
+            {"name": "args", "type": "array", "description": "Passthrough arguments", "required": "true"}
+        ]
+    ),
+    
+    # Lockdown whitelist operations
+    ModuleCapability(
+        name="lockdown_get_status",
+        description="Get lockdown mode status",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="lockdown_enable",
+        description="Enable lockdown mode",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="lockdown_disable",
+        description="Disable lockdown mode",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="lockdown_list_commands",
+        description="List whitelisted commands",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="lockdown_add_command",
+        description="Add command to whitelist",
+        parameters=[
+            {"name": "command", "type": "string", "description": "Command path", "required": "true"}
+        ]
+    ),
+    ModuleCapability(
+        name="lockdown_remove_command",
+        description="Remove command from whitelist",
+        parameters=[
+            {"name": "command", "type": "string", "description": "Command path", "required": "true"}
+        ]
+    ),
+    ModuleCapability(
+        name="lockdown_list_contexts",
+        description="List whitelisted SELinux contexts",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="lockdown_add_context",
+        description="Add SELinux context to whitelist",
+        parameters=[
+            {"name": "context", "type": "string", "description": "SELinux context", "required": "true"}
+        ]
+    ),
+    ModuleCapability(
+        name="lockdown_remove_context",
+        description="Remove SELinux context from whitelist",
+        parameters=[
+            {"name": "context", "type": "string", "description": "SELinux context", "required": "true"}
+        ]
+    ),
+    ModuleCapability(
+        name="lockdown_list_users",
+        description="List whitelisted users",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="lockdown_add_user",
+        description="Add user to whitelist",
+        parameters=[
+            {"name": "user", "type": "string", "description": "Username", "required": "true"}
+        ]
+    ),
+    ModuleCapability(
+        name="lockdown_remove_user",
+        description="Remove user from whitelist",
+        parameters=[
+            {"name": "user", "type": "string", "description": "Username", "required": "true"}
+        ]
+    ),
+    ModuleCapability(
+        name="lockdown_list_uids",
+        description="List whitelisted UIDs",
+        parameters=[]
+    ),
+    ModuleCapability(
+        name="lockdown_add_uid",
+        description="Add UID to whitelist",
+        parameters=[
+            {"name": "uid", "type": "integer", "description": "User ID", "required": "true"}
+        ]
+    ),
+    ModuleCapability(
+        name="lockdown_remove_uid",
+        description="Remove UID from whitelist",
+        parameters=[
+            {"name": "uid", "type": "integer", "description": "User ID", "required": "true"}
+        ]
+    ),
+)
+
+# Parameters each action cannot run without, checked once in validate_command
+_REQUIRED: Dict[str, Tuple[str, ...]] = {
+    capability.name: tuple(
+        param["name"] for param in capability.parameters if param.get("required") == "true"
+    )
+    for capability in _CAPABILITIES
+}
+
 
 class FirewalldModule(BaseModule):
     """Manages firewalld configuration."""
     
+    def __init__(self):
+        super().__init__()
+        self._cache: Dict[str, Tuple[float, CommandResponse]] = {}
+        self._cache_queries = True
+        self._allow_no_wait = True
+        self._pool_size = _BATCH_MAX_WORKERS
+        self._pool = ThreadPoolExecutor(max_workers=self._pool_size)
+        self._dispatch = self._build_dispatch()
+        self._pending_lock = threading.Lock()
+        self._connect_lock = threading.Lock()
+        # Changes sent with wait=false that no sync has confirmed yet, and
+        # whether the connection that carried some of them has been lost
+        self._pending = 0
+        self._pending_lost = False
+        self._bus = self._systemd_bus = self._systemd_manager = None
+        self._reset_dbus()
+    
     @property
     def name(self) -> str:
         return "firewalld"
@@ -31,793 +1012,8 @@ class FirewalldModule(BaseModule):
     def description(self) -> str:
         return "Manages firewalld zones, services, ports, and rules"
     
-    def get_capabilities(self) -> List[ModuleCapability]:
-        return [
-            # Query operations
-            ModuleCapability(
-                name="get_status",
-                description="Get firewalld running status",
-                parameters=[]
-            ),
-            ModuleCapability(
-                name="get_version",
-                description="Get firewalld version",
-                parameters=[]
-            ),
-            ModuleCapability(
-                name="list_zones",
-                description="List all zones",
-                parameters=[]
-            ),
-            ModuleCapability(
-                name="get_zone",
-                description="Get zone configuration",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"}
-                ]
-            ),
-            ModuleCapability(
-                name="get_default_zone",
-                description="Get default zone",
-                parameters=[]
-            ),
-            ModuleCapability(
-                name="list_services",
-                description="List available services",
-                parameters=[]
-            ),
-            ModuleCapability(
-                name="list_icmptypes",
-                description="List available ICMP types",
-                parameters=[]
-            ),
-            
-            # Zone operations
-            ModuleCapability(
-                name="new_zone",
-                description="Create a new zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Create permanent zone", "required": "false"}
-                ]
-            ),
-            ModuleCapability(
-                name="delete_zone",
-                description="Delete a zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Delete permanent zone", "required": "false"}
-                ]
-            ),
-            ModuleCapability(
-                name="get_zone_of_interface",
-                description="Get the zone an interface belongs to",
-                parameters=[
-                    {"name": "interface", "type": "string", "description": "Interface name", "required": "true"}
-                ]
-            ),
-            ModuleCapability(
-                name="get_zone_of_source",
-                description="Get the zone a source belongs to",
-                parameters=[
-                    {"name": "source", "type": "string", "description": "Source (IP/CIDR)", "required": "true"}
-                ]
-            ),
-            ModuleCapability(
-                name="set_default_zone",
-                description="Set default zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"}
-                ]
-            ),
-            ModuleCapability(
-                name="get_active_zones",
-                description="Get all active zones with their interfaces and sources",
-                parameters=[]
-            ),
-            
-            # Service operations
-            ModuleCapability(
-                name="add_service",
-                description="Add service to zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "service", "type": "string", "description": "Service name", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            ModuleCapability(
-                name="remove_service",
-                description="Remove service from zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "service", "type": "string", "description": "Service name", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            
-            # Interface operations
-            ModuleCapability(
-                name="add_interface",
-                description="Add interface to zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "interface", "type": "string", "description": "Interface name (e.g., eth0)", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            ModuleCapability(
-                name="remove_interface",
-                description="Remove interface from zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "interface", "type": "string", "description": "Interface name", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            ModuleCapability(
-                name="change_interface",
-                description="Change interface to different zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Target zone name", "required": "true"},
-                    {"name": "interface", "type": "string", "description": "Interface name", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            ModuleCapability(
-                name="list_interfaces",
-                description="List interfaces in a zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"}
-                ]
-            ),
-            
-            # Source operations
-            ModuleCapability(
-                name="add_source",
-                description="Add source to zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "source", "type": "string", "description": "Source (IP/CIDR, MAC, ipset)", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            ModuleCapability(
-                name="remove_source",
-                description="Remove source from zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "source", "type": "string", "description": "Source", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            ModuleCapability(
-                name="change_source",
-                description="Change source to different zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Target zone name", "required": "true"},
-                    {"name": "source", "type": "string", "description": "Source", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            ModuleCapability(
-                name="list_sources",
-                description="List sources in a zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"}
-                ]
-            ),
-            
-            # Port operations
-            ModuleCapability(
-                name="add_port",
-                description="Add port to zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "port", "type": "string", "description": "Port/protocol (e.g., 8080/tcp)", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            ModuleCapability(
-                name="remove_port",
-                description="Remove port from zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "port", "type": "string", "description": "Port/protocol (e.g., 8080/tcp)", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            
-            # Rich rule operations
-            ModuleCapability(
-                name="add_rich_rule",
-                description="Add rich rule to zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "rule", "type": "string", "description": "Rich rule", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            ModuleCapability(
-                name="remove_rich_rule",
-                description="Remove rich rule from zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "rule", "type": "string", "description": "Rich rule", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            
-            # Protocol operations
-            ModuleCapability(
-                name="add_protocol",
-                description="Add protocol to zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "protocol", "type": "string", "description": "Protocol (e.g., icmp, igmp)", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            ModuleCapability(
-                name="remove_protocol",
-                description="Remove protocol from zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "protocol", "type": "string", "description": "Protocol", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            
-            # Source port operations
-            ModuleCapability(
-                name="add_source_port",
-                description="Add source port to zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "port", "type": "string", "description": "Source port/protocol (e.g., 8080/tcp)", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            ModuleCapability(
-                name="remove_source_port",
-                description="Remove source port from zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "port", "type": "string", "description": "Source port/protocol", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            
-            # ICMP block operations
-            ModuleCapability(
-                name="add_icmp_block",
-                description="Add ICMP block to zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "icmp_type", "type": "string", "description": "ICMP type", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            ModuleCapability(
-                name="remove_icmp_block",
-                description="Remove ICMP block from zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "icmp_type", "type": "string", "description": "ICMP type", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            ModuleCapability(
-                name="add_icmp_block_inversion",
-                description="Enable ICMP block inversion for zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            ModuleCapability(
-                name="remove_icmp_block_inversion",
-                description="Disable ICMP block inversion for zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            
-            # Masquerade operations
-            ModuleCapability(
-                name="add_masquerade",
-                description="Enable masquerading for zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            ModuleCapability(
-                name="remove_masquerade",
-                description="Disable masquerading for zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            
-            # Forward port operations
-            ModuleCapability(
-                name="add_forward_port",
-                description="Add port forwarding rule to zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "port", "type": "string", "description": "Port/protocol (e.g., 80/tcp)", "required": "true"},
-                    {"name": "to_port", "type": "string", "description": "Destination port", "required": "false"},
-                    {"name": "to_addr", "type": "string", "description": "Destination address", "required": "false"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            ModuleCapability(
-                name="remove_forward_port",
-                description="Remove port forwarding rule from zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "port", "type": "string", "description": "Port/protocol", "required": "true"},
-                    {"name": "to_port", "type": "string", "description": "Destination port", "required": "false"},
-                    {"name": "to_addr", "type": "string", "description": "Destination address", "required": "false"},
-                    {"name": "permanent", "type": "boolean", "description": "Make permanent", "required": "false"}
-                ]
-            ),
-            
-            # Control operations
-            ModuleCapability(
-                name="reload",
-                description="Reload firewalld configuration",
-                parameters=[]
-            ),
-            ModuleCapability(
-                name="complete_reload",
-                description="Complete reload - recreates all zones, interfaces, and rules",
-                parameters=[]
-            ),
-            ModuleCapability(
-                name="runtime_to_permanent",
-                description="Save runtime configuration to permanent",
-                parameters=[]
-            ),
-            ModuleCapability(
-                name="check_config",
-                description="Check firewalld configuration for errors",
-                parameters=[]
-            ),
-            
-            # Service control operations
-            ModuleCapability(
-                name="service_status",
-                description="Get firewalld service status",
-                parameters=[]
-            ),
-            ModuleCapability(
-                name="start_service",
-                description="Start firewalld service",
-                parameters=[]
-            ),
-            ModuleCapability(
-                name="stop_service",
-                description="Stop firewalld service",
-                parameters=[]
-            ),
-            ModuleCapability(
-                name="restart_service",
-                description="Restart firewalld service",
-                parameters=[]
-            ),
-            
-            # Panic mode operations
-            ModuleCapability(
-                name="query_panic",
-                description="Check if panic mode is enabled",
-                parameters=[]
-            ),
-            ModuleCapability(
-                name="panic_on",
-                description="Enable panic mode (drop all incoming and outgoing packets)",
-                parameters=[]
-            ),
-            ModuleCapability(
-                name="panic_off",
-                description="Disable panic mode",
-                parameters=[]
-            ),
-            
-            # Log denied packets operations
-            ModuleCapability(
-                name="get_log_denied",
-                description="Get log denied packets setting",
-                parameters=[]
-            ),
-            ModuleCapability(
-                name="set_log_denied",
-                description="Set log denied packets (all, unicast, broadcast, multicast, off)",
-                parameters=[
-                    {"name": "value", "type": "string", "description": "Log level: all, unicast, broadcast, multicast, off", "required": "true"}
-                ]
-            ),
-            
-            # Custom service management operations
-            ModuleCapability(
-                name="list_services",
-                description="List all available firewalld services",
-                parameters=[]
-            ),
-            ModuleCapability(
-                name="get_service_info",
-                description="Get detailed information about a service",
-                parameters=[
-                    {"name": "service", "type": "string", "description": "Service name", "required": "true"}
-                ]
-            ),
-            ModuleCapability(
-                name="new_service",
-                description="Create a new custom service",
-                parameters=[
-                    {"name": "service", "type": "string", "description": "Service name", "required": "true"}
-                ]
-            ),
-            ModuleCapability(
-                name="delete_service",
-                description="Delete a custom service",
-                parameters=[
-                    {"name": "service", "type": "string", "description": "Service name", "required": "true"}
-                ]
-            ),
-            ModuleCapability(
-                name="service_add_port",
-                description="Add port to a service definition",
-                parameters=[
-                    {"name": "service", "type": "string", "description": "Service name", "required": "true"},
-                    {"name": "port", "type": "string", "description": "Port number or range", "required": "true"},
-                    {"name": "protocol", "type": "string", "description": "Protocol (tcp/udp)", "required": "true"}
-                ]
-            ),
-            ModuleCapability(
-                name="service_remove_port",
-                description="Remove port from a service definition",
-                parameters=[
-                    {"name": "service", "type": "string", "description": "Service name", "required": "true"},
-                    {"name": "port", "type": "string", "description": "Port number or range", "required": "true"},
-                    {"name": "protocol", "type": "string", "description": "Protocol (tcp/udp)", "required": "true"}
-                ]
-            ),
-            ModuleCapability(
-                name="service_add_protocol",
-                description="Add protocol to a service definition",
-                parameters=[
-                    {"name": "service", "type": "string", "description": "Service name", "required": "true"},
-                    {"name": "protocol", "type": "string", "description": "Protocol name", "required": "true"}
-                ]
-            ),
-            ModuleCapability(
-                name="service_remove_protocol",
-                description="Remove protocol from a service definition",
-                parameters=[
-                    {"name": "service", "type": "string", "description": "Service name", "required": "true"},
-                    {"name": "protocol", "type": "string", "description": "Protocol name", "required": "true"}
-                ]
-            ),
-            
-            # IPSet management operations
-            ModuleCapability(
-                name="list_ipsets",
-                description="List all IPSets",
-                parameters=[]
-            ),
-            ModuleCapability(
-                name="get_ipset_info",
-                description="Get detailed information about an IPSet",
-                parameters=[
-                    {"name": "ipset", "type": "string", "description": "IPSet name", "required": "true"}
-                ]
-            ),
-            ModuleCapability(
-                name="new_ipset",
-                description="Create a new IPSet",
-                parameters=[
-                    {"name": "ipset", "type": "string", "description": "IPSet name", "required": "true"},
-                    {"name": "type", "type": "string", "description": "IPSet type (hash:ip, hash:net, hash:mac, etc)", "required": "true"}
-                ]
-            ),
-            ModuleCapability(
-                name="delete_ipset",
-                description="Delete an IPSet",
-                parameters=[
-                    {"name": "ipset", "type": "string", "description": "IPSet name", "required": "true"}
-                ]
-            ),
-            ModuleCapability(
-                name="ipset_add_entry",
-                description="Add entry to an IPSet",
-                parameters=[
-                    {"name": "ipset", "type": "string", "description": "IPSet name", "required": "true"},
-                    {"name": "entry", "type": "string", "description": "Entry to add (IP, network, MAC)", "required": "true"}
-                ]
-            ),
-            ModuleCapability(
-                name="ipset_remove_entry",
-                description="Remove entry from an IPSet",
-                parameters=[
-                    {"name": "ipset", "type": "string", "description": "IPSet name", "required": "true"},
-                    {"name": "entry", "type": "string", "description": "Entry to remove", "required": "true"}
-                ]
-            ),
-            ModuleCapability(
-                name="zone_add_source_ipset",
-                description="Add IPSet as source to zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "ipset", "type": "string", "description": "IPSet name", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make change permanent", "required": "false"}
-                ]
-            ),
-            ModuleCapability(
-                name="zone_remove_source_ipset",
-                description="Remove IPSet source from zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "ipset", "type": "string", "description": "IPSet name", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make change permanent", "required": "false"}
-                ]
-            ),
-            
-            # Helper module management operations
-            ModuleCapability(
-                name="list_helpers",
-                description="List all available helper modules",
-                parameters=[]
-            ),
-            ModuleCapability(
-                name="zone_list_helpers",
-                description="List helpers enabled in a zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"}
-                ]
-            ),
-            ModuleCapability(
-                name="zone_add_helper",
-                description="Add helper module to zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "helper", "type": "string", "description": "Helper module name", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make change permanent", "required": "false"}
-                ]
-            ),
-            ModuleCapability(
-                name="zone_remove_helper",
-                description="Remove helper module from zone",
-                parameters=[
-                    {"name": "zone", "type": "string", "description": "Zone name", "required": "true"},
-                    {"name": "helper", "type": "string", "description": "Helper module name", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make change permanent", "required": "false"}
-                ]
-            ),
-            
-            # Policy management operations
-            Capability(
-                name="list_policies",
-                description="List all firewall policies",
-                parameters=[]
-            ),
-            Capability(
-                name="policy_add",
-                description="Add a new firewall policy",
-                parameters=[
-                    {"name": "policy", "type": "string", "description": "Policy name", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make change permanent", "required": "false"}
-                ]
-            ),
-            Capability(
-                name="policy_delete",
-                description="Delete a firewall policy",
-                parameters=[
-                    {"name": "policy", "type": "string", "description": "Policy name", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make change permanent", "required": "false"}
-                ]
-            ),
-            Capability(
-                name="policy_get_info",
-                description="Get detailed information about a policy",
-                parameters=[
-                    {"name": "policy", "type": "string", "description": "Policy name", "required": "true"}
-                ]
-            ),
-            Capability(
-                name="policy_set_ingress_zone",
-                description="Set ingress zone for policy",
-                parameters=[
-                    {"name": "policy", "type": "string", "description": "Policy name", "required": "true"},
-                    {"name": "zone", "type": "string", "description": "Ingress zone name", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make change permanent", "required": "false"}
-                ]
-            ),
-            Capability(
-                name="policy_set_egress_zone",
-                description="Set egress zone for policy",
-                parameters=[
-                    {"name": "policy", "type": "string", "description": "Policy name", "required": "true"},
-                    {"name": "zone", "type": "string", "description": "Egress zone name", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make change permanent", "required": "false"}
-                ]
-            ),
-            Capability(
-                name="policy_set_target",
-                description="Set target action for policy",
-                parameters=[
-                    {"name": "policy", "type": "string", "description": "Policy name", "required": "true"},
-                    {"name": "target", "type": "string", "description": "Target action (ACCEPT, REJECT, DROP, CONTINUE)", "required": "true"},
-                    {"name": "permanent", "type": "boolean", "description": "Make change permanent", "required": "false"}
-                ]
-            ),
-            
-            # Direct rules management operations
-            Capability(
-                name="direct_get_all_chains",
-                description="Get all direct chains",
-                parameters=[
-                    {"name": "ipv", "type": "string", "description": "IP version (ipv4 or ipv6)", "required": "true"},
-                    {"name": "table", "type": "string", "description": "Table name (filter, nat, mangle, raw)", "required": "true"}
-                ]
-            ),
-            Capability(
-                name="direct_add_chain",
-                description="Add a new direct chain",
-                parameters=[
-                    {"name": "ipv", "type": "string", "description": "IP version (ipv4 or ipv6)", "required": "true"},
-                    {"name": "table", "type": "string", "description": "Table name (filter, nat, mangle, raw)", "required": "true"},
-                    {"name": "chain", "type": "string", "description": "Chain name", "required": "true"}
-                ]
-            ),
-            Capability(
-                name="direct_remove_chain",
-                description="Remove a direct chain",
-                parameters=[
-                    {"name": "ipv", "type": "string", "description": "IP version (ipv4 or ipv6)", "required": "true"},
-                    {"name": "table", "type": "string", "description": "Table name (filter, nat, mangle, raw)", "required": "true"},
-                    {"name": "chain", "type": "string", "description": "Chain name", "required": "true"}
-                ]
-            ),
-            Capability(
-                name="direct_get_all_rules",
-                description="Get all direct rules",
-                parameters=[]
-            ),
-            Capability(
-                name="direct_add_rule",
-                description="Add a direct rule",
-                parameters=[
-                    {"name": "ipv", "type": "string", "description": "IP version (ipv4 or ipv6)", "required": "true"},
-                    {"name": "table", "type": "string", "description": "Table name (filter, nat, mangle, raw)", "required": "true"},
-                    {"name": "chain", "type": "string", "description": "Chain name", "required": "true"},
-                    {"name": "priority", "type": "integer", "description": "Rule priority (0-999)", "required": "true"},
-                    {"name": "args", "type": "array", "description": "Rule arguments", "required": "true"}
-                ]
-            ),
-            Capability(
-                name="direct_remove_rule",
-                description="Remove a direct rule",
-                parameters=[
-                    {"name": "ipv", "type": "string", "description": "IP version (ipv4 or ipv6)", "required": "true"},
-                    {"name": "table", "type": "string", "description": "Table name (filter, nat, mangle, raw)", "required": "true"},
-                    {"name": "chain", "type": "string", "description": "Chain name", "required": "true"},
-                    {"name": "priority", "type": "integer", "description": "Rule priority (0-999)", "required": "true"},
-                    {"name": "args", "type": "array", "description": "Rule arguments", "required": "true"}
-                ]
-            ),
-            Capability(
-                name="direct_get_passthrough",
-                description="Get all passthrough rules",
-                parameters=[
-                    {"name": "ipv", "type": "string", "description": "IP version (ipv4 or ipv6)", "required": "true"}
-                ]
-            ),
-            Capability(
-                name="direct_add_passthrough",
-                description="Add a passthrough rule",
-                parameters=[
-                    {"name": "ipv", "type": "string", "description": "IP version (ipv4 or ipv6)", "required": "true"},
-                    {"name": "args", "type": "array", "description": "Passthrough arguments", "required": "true"}
-                ]
-            ),
-            
-            # Lockdown whitelist operations
-            Capability(
-                name="lockdown_get_status",
-                description="Get lockdown mode status",
-                parameters=[]
-            ),
-            Capability(
-                name="lockdown_enable",
-                description="Enable lockdown mode",
-                parameters=[]
-            ),
-            Capability(
-                name="lockdown_disable",
-                description="Disable lockdown mode",
-                parameters=[]
-            ),
-            Capability(
-                name="lockdown_list_commands",
-                description="List whitelisted commands",
-                parameters=[]
-            ),
-            Capability(
-                name="lockdown_add_command",
-                description="Add command to whitelist",
-                parameters=[
-                    {"name": "command", "type": "string", "description": "Command path", "required": "true"}
-                ]
-            ),
-            Capability(
-                name="lockdown_remove_command",
-                description="Remove command from whitelist",
-                parameters=[
-                    {"name": "command", "type": "string", "description": "Command path", "required": "true"}
-                ]
-            ),
-            Capability(
-                name="lockdown_list_contexts",
-                description="List whitelisted SELinux contexts",
-                parameters=[]
-            ),
-            Capability(
-                name="lockdown_add_context",
-                description="Add SELinux context to whitelist",
-                parameters=[
-                    {"name": "context", "type": "string", "description": "SELinux context", "required": "true"}
-                ]
-            ),
-            Capability(
-                name="lockdown_remove_context",
-                description="Remove SELinux context from whitelist",
-                parameters=[
-                    {"name": "context", "type": "string", "description": "SELinux context", "required": "true"}
-                ]
-            ),
-            Capability(
-                name="lockdown_list_users",
-                description="List whitelisted users",
-                parameters=[]
-            ),
-            Capability(
-                name="lockdown_add_user",
-                description="Add user to whitelist",
-                parameters=[
-                    {"name": "user", "type": "string", "description": "Username", "required": "true"}
-                ]
-            ),
-            Capability(
-                name="lockdown_remove_user",
-                description="Remove user from whitelist",
-                parameters=[
-                    {"name": "user", "type": "string", "description": "Username", "required": "true"}
-                ]
-            ),
-            Capability(
-                name="lockdown_list_uids",
-                description="List whitelisted UIDs",
-                parameters=[]
-            ),
-            Capability(
-                name="lockdown_add_uid",
-                description="Add UID to whitelist",
-                parameters=[
-                    {"name": "uid", "type": "integer", "description": "User ID", "required": "true"}
-                ]
-            ),
-            Capability(
-                name="lockdown_remove_uid",
-                description="Remove UID from whitelist",
-                parameters=[
-                    {"name": "uid", "type": "integer", "description": "User ID", "required": "true"}
-                ]
-            ),
-        ]
+    def get_capabilities(self) -> Tuple[ModuleCapability, ...]:
+        return _CAPABILITIES
     
     def initialize(self) -> tuple[bool, Optional[str]]:
         """Initialize the firewalld module."""
@@ -831,410 +1027,500 @@ class FirewalldModule(BaseModule):
         if not success:
             self.logger.warning("firewalld service is not active")
         
+        # D-Bus is connected on first use, after the daemon has forked its
+        # workers; a connection made here would be shared by all of them
         self.logger.info("Firewalld module initialized")
         return True, None
     
     def shutdown(self):
         """Cleanup on shutdown."""
         self.logger.info("Firewalld module shutting down")
+        self._pool.shutdown(wait=False)
+        self._reset_dbus()
+        self._reset_systemd()
     
-    def execute_command(self, command: CommandRequest) -> CommandResponse:
-        """Execute a firewalld command."""
-        # Validate command
-        is_valid, error = self.validate_command(command)
-        if not is_valid:
-            return CommandResponse(success=False, error=error)
+    def configure_workers(self, workers: int):
+        """
+        Adapt to serving requests from several processes.
+        
+        A change made through one process would not invalidate the others'
+        cached query results, so caching is turned off. wait=false is
+        refused, because the 'sync' that should confirm such changes may be
+        handled by another process. The batch pool is split between the
+        processes.
+        """
+        self._cache_queries = workers < 2
+        self._allow_no_wait = workers < 2
+        self._cache.clear()
+        self._pool_size = max(1, _BATCH_MAX_WORKERS // workers)
+        self._pool.shutdown(wait=False)
+        self._pool = ThreadPoolExecutor(max_workers=self._pool_size)
+    
+    def after_fork(self):
+        """Forget D-Bus connections and the thread pool inherited from the parent process."""
+        # Another thread of the parent may have held these while forking
+        self._pending_lock = threading.Lock()
+        self._connect_lock = threading.Lock()
+        # Changes sent by the parent are not this process's to confirm
+        self._pending = 0
+        self._pending_lost = False
+        # Not closed: the parent still uses the same socket
+        self._bus = self._systemd_bus = None
+        self._reset_dbus()
+        self._reset_systemd()
+        # The parent's pool threads do not exist in the child
+        self._pool.shutdown(wait=False)
+        self._pool = ThreadPoolExecutor(max_workers=self._pool_size)
+    
+    def _connect_dbus(self) -> bool:
+        """
+        Connect to firewalld's D-Bus API.
+        
+        firewall-cmd is itself only a D-Bus client, so talking to firewalld
+        directly skips a Python interpreter start per operation. Returns
+        False when dbus-python or firewalld is unavailable; callers then
+        fall back to running firewall-cmd.
+        """
+        if self._fw is not None:
+            return True
+        if not _import_dbus():
+            return False
+        
+        with self._connect_lock:
+            if self._fw is not None:
+                return True
+            return self._open_dbus()
+    
+    def _open_dbus(self) -> bool:
+        """Open this process's own connection to firewalld; see _connect_dbus."""
+        try:
+            # A private connection is never handed out by dbus-python to
+            # other code, and is closed again by _reset_dbus
+            bus = dbus.SystemBus(private=True)
+            self._bus = bus
+            fw_object = bus.get_object(FIREWALLD_BUS_NAME, FIREWALLD_PATH)
+            self._fw = dbus.Interface(fw_object, FIREWALLD_BUS_NAME)
+            self._fw_zone = dbus.Interface(fw_object, f"{FIREWALLD_BUS_NAME}.zone")
+            self._fw_policies = dbus.Interface(fw_object, f"{FIREWALLD_BUS_NAME}.policies")
+            config_object = bus.get_object(FIREWALLD_BUS_NAME, FIREWALLD_CONFIG_PATH)
+            self._fw_config = dbus.Interface(config_object, f"{FIREWALLD_BUS_NAME}.config")
+            self._fw_config_policies = dbus.Interface(config_object, f"{FIREWALLD_BUS_NAME}.config.policies")
+        except dbus.DBusException as e:
+            self.logger.warning("firewalld D-Bus API unavailable, using firewall-cmd: %s", e)
+            self._reset_dbus()
+            return False
+        
+        return True
+    
+    def _reset_dbus(self):
+        """Close the firewalld connection and forget its proxies so the next call reconnects."""
+        if self._bus is not None:
+            self._bus.close()
+        self._bus = self._fw = self._fw_zone = self._fw_policies = None
+        self._fw_config = self._fw_config_policies = None
+        with self._pending_lock:
+            # Unconfirmed changes went out on the closed connection and
+            # the next sync must not report them as applied
+            if self._pending:
+                self._pending_lost = True
+    
+    def _dbus(self, call: Callable[[], Any]) -> Optional[Tuple[bool, Any, str]]:
+        """
+        Run call() against the firewalld D-Bus API.
+        
+        Returns (success, result, error) like _run_command, or None when
+        D-Bus cannot be used and the caller should run firewall-cmd instead.
+        """
+        if not self._connect_dbus():
+            return None
         
         try:
-            action = command.action
-            params = command.parameters
+            return True, call(), ""
+        except dbus.DBusException as e:
+            if (e.get_dbus_name() or "").startswith("org.freedesktop.DBus.Error"):
+                # Bus-level failure (firewalld restarted, timeout, ...)
+                self.logger.warning("firewalld D-Bus call failed, using firewall-cmd: %s", e)
+                self._reset_dbus()
+                return None
             
+            message = e.get_dbus_message() or str(e)
+            if message.split(':', 1)[0].strip() in _DBUS_WARNING_CODES:
+                return True, None, ""
+            return False, None, message
+    
+    def _systemd(self, call: Callable[[], Any]) -> Optional[Tuple[bool, Any, str]]:
+        """
+        Run call() against systemd's D-Bus API.
+        
+        Returns (success, result, error) like _run_command, or None when
+        D-Bus cannot be used and the caller should run systemctl instead.
+        This connection is separate from firewalld's, which does not exist
+        while the service is stopped.
+        """
+        if not _import_dbus():
+            return None
+        
+        try:
+            if self._systemd_manager is None:
+                with self._connect_lock:
+                    if self._systemd_manager is None:
+                        self._systemd_bus = dbus.SystemBus(private=True)
+                        self._systemd_manager = dbus.Interface(
+                            self._systemd_bus.get_object(SYSTEMD_BUS_NAME, SYSTEMD_PATH),
+                            f"{SYSTEMD_BUS_NAME}.Manager")
+            return True, call(), ""
+        except dbus.DBusException as e:
+            if self._systemd_manager is None or (e.get_dbus_name() or "").startswith("org.freedesktop.DBus.Error"):
+                self.logger.warning("systemd D-Bus call failed, using systemctl: %s", e)
+                self._reset_systemd()
+                return None
+            return False, None, e.get_dbus_message() or str(e)
+    
+    def _reset_systemd(self):
+        """Close the systemd connection so the next call reconnects."""
+        if self._systemd_bus is not None:
+            self._systemd_bus.close()
+        self._systemd_bus = self._systemd_manager = None
+    
+    def _unit_properties(self) -> Dict[str, Any]:
+        """firewalld.service's org.freedesktop.systemd1.Unit properties; call inside _systemd()."""
+        unit = self._systemd_bus.get_object(SYSTEMD_BUS_NAME, self._systemd_manager.LoadUnit(FIREWALLD_UNIT))
+        return dbus.Interface(unit, 'org.freedesktop.DBus.Properties').GetAll(f"{SYSTEMD_BUS_NAME}.Unit")
+    
+    def _unit_job(self, method: str, verb: str, timeout: int = 30) -> Tuple[bool, str, str]:
+        """
+        Start, stop or restart firewalld.service and wait for the job.
+        
+        method is the systemd Manager method (StartUnit, ...) and verb the
+        matching systemctl command. Like systemctl, this returns once the
+        job has finished; the job's outcome shows in the unit's ActiveState.
+        Returns (success, active state, error).
+        """
+        def run():
+            self._systemd_manager.get_dbus_method(method)(FIREWALLD_UNIT, 'replace')
+            deadline = time.monotonic() + timeout
+            properties = self._unit_properties()
+            # Job is (id, path); id 0 means no job is queued or running
+            while properties['Job'][0] != 0 and time.monotonic() < deadline:
+                time.sleep(_UNIT_JOB_POLL)
+                properties = self._unit_properties()
+            return str(properties['ActiveState'])
+        
+        result = self._systemd(run)
+        if result is not None:
+            return result[0], result[1] or '', result[2]
+        
+        success, stdout, stderr = self._run_command(['systemctl', verb, 'firewalld'], timeout=timeout)
+        if not success:
+            return False, '', stderr
+        success, stdout, stderr = self._run_command(['systemctl', 'is-active', 'firewalld'])
+        return True, stdout.strip(), ''
+    
+    def _cached(self, key: str, fn: Callable[[], CommandResponse]) -> CommandResponse:
+        """
+        Return fn()'s response, reusing a successful one for _CACHE_TTLS[key] seconds.
+        
+        Only successful responses are cached so that a transient failure
+        is retried on the next request.
+        """
+        if not self._cache_queries:
+            return fn()
+        
+        entry = self._cache.get(key)
+        if entry is not None:
+            expires, response = entry
+            if expires is None or time.monotonic() < expires:
+                return response
+        
+        response = fn()
+        if response.success:
+            ttl = _CACHE_TTLS[key]
+            self._cache[key] = (None if ttl is None else time.monotonic() + ttl, response)
+        return response
+    
+    def _invalidate(self, *keys: str):
+        """Drop cached query results; all of them when no keys are given."""
+        if not keys:
+            self._cache.clear()
+        for key in keys:
+            self._cache.pop(key, None)
+    
+    def _config_zone(self, zone: str) -> Any:
+        """D-Bus interface of a zone's permanent configuration."""
+        path = self._fw_config.getZoneByName(zone)
+        return dbus.Interface(
+            self._bus.get_object(FIREWALLD_BUS_NAME, path),
+            f"{FIREWALLD_BUS_NAME}.config.zone"
+        )
+    
+    def _zone_change(self, zone: str, method: str, args: Optional[tuple], permanent: bool,
+                     cmd: List[str], timeout: bool = False, wait: bool = True) -> Tuple[bool, str]:
+        """
+        Change a zone over D-Bus, or by running cmd when D-Bus is unavailable.
+        
+        method is the firewalld D-Bus method (e.g. 'addService'). Runtime
+        calls take the zone as first argument, followed by a timeout of 0
+        if the method has one; permanent calls go to the zone's config
+        object. args=None forces the firewall-cmd path.
+        
+        With wait=False the D-Bus call is sent without waiting for its
+        reply; firewalld's errors for it are then lost, and a later
+        'sync' action waits until it has been applied. firewall-cmd
+        fallbacks always wait.
+        
+        Returns (success, error).
+        """
+        result = None
+        if args is not None:
+            kwargs = {} if wait else {'ignore_reply': True}
+            if permanent:
+                result = self._dbus(lambda: getattr(self._config_zone(zone), method)(*args, **kwargs))
+            else:
+                extra = (0,) if timeout else ()
+                result = self._dbus(lambda: getattr(self._fw_zone, method)(zone, *args, *extra, **kwargs))
+        
+        if result is None:
+            success, stdout, stderr = self._run_command(cmd)
+            return success, stderr
+        
+        success, _, error = result
+        if success and not wait:
+            with self._pending_lock:
+                self._pending += 1
+        return success, error
+    
+    def _build_dispatch(self) -> Dict[str, Callable[[Dict[str, Any]], CommandResponse]]:
+        """Map each action to a handler taking the request parameters."""
+        return {
             # Query operations
-            if action == "get_status":
-                return self._get_status()
-            elif action == "get_version":
-                return self._get_version()
-            elif action == "list_zones":
-                return self._list_zones()
-            elif action == "get_zone":
-                return self._get_zone(params.get('zone'))
-            elif action == "get_default_zone":
-                return self._get_default_zone()
-            elif action == "list_services":
-                return self._list_services()
-            elif action == "list_icmptypes":
-                return self._list_icmptypes()
+            "get_status": lambda p: self._get_status(),
+            "get_version": lambda p: self._cached('get_version', self._get_version),
+            "list_zones": lambda p: self._cached('list_zones', self._list_zones),
+            "get_zone": lambda p: self._get_zone(p.get('zone')),
+            "get_default_zone": lambda p: self._cached('get_default_zone', self._get_default_zone),
+            "list_services": lambda p: self._cached('list_services', self._list_services),
+            "list_icmptypes": lambda p: self._cached('list_icmptypes', self._list_icmptypes),
             
             # Zone operations
-            elif action == "new_zone":
-                return self._new_zone(params.get('zone'), params.get('permanent', True))
-            elif action == "delete_zone":
-                return self._delete_zone(params.get('zone'), params.get('permanent', True))
-            elif action == "get_zone_of_interface":
-                return self._get_zone_of_interface(params.get('interface'))
-            elif action == "get_zone_of_source":
-                return self._get_zone_of_source(params.get('source'))
-            elif action == "set_default_zone":
-                return self._set_default_zone(params.get('zone'))
-            elif action == "get_active_zones":
-                return self._get_active_zones()
-
+            "new_zone": lambda p: self._new_zone(p.get('zone'), p.get('permanent', True)),
+            "delete_zone": lambda p: self._delete_zone(p.get('zone'), p.get('permanent', True)),
+            "get_zone_of_interface": lambda p: self._get_zone_of_interface(p.get('interface')),
+            "get_zone_of_source": lambda p: self._get_zone_of_source(p.get('source')),
+            "set_default_zone": lambda p: self._set_default_zone(p.get('zone')),
+            "get_active_zones": lambda p: self._get_active_zones(),
             
             # Service operations
-            elif action == "add_service":
-                return self._add_service(
-                    params.get('zone'),
-                    params.get('service'),
-                    params.get('permanent', False)
-                )
-            elif action == "remove_service":
-                return self._remove_service(
-                    params.get('zone'),
-                    params.get('service'),
-                    params.get('permanent', False)
-                )
+            "add_service": lambda p: self._add_service(p.get('zone'), p.get('service'), p.get('permanent', False), p.get('wait', True)),
+            "remove_service": lambda p: self._remove_service(p.get('zone'), p.get('service'), p.get('permanent', False), p.get('wait', True)),
             
             # Interface operations
-            elif action == "add_interface":
-                return self._add_interface(
-                    params.get('zone'),
-                    params.get('interface'),
-                    params.get('permanent', False)
-                )
-            elif action == "remove_interface":
-                return self._remove_interface(
-                    params.get('zone'),
-                    params.get('interface'),
-                    params.get('permanent', False)
-                )
-            elif action == "change_interface":
-                return self._change_interface(
-                    params.get('zone'),
-                    params.get('interface'),
-                    params.get('permanent', False)
-                )
-            elif action == "list_interfaces":
-                return self._list_interfaces(params.get('zone'))
+            "add_interface": lambda p: self._add_interface(p.get('zone'), p.get('interface'), p.get('permanent', False), p.get('wait', True)),
+            "remove_interface": lambda p: self._remove_interface(p.get('zone'), p.get('interface'), p.get('permanent', False), p.get('wait', True)),
+            "change_interface": lambda p: self._change_interface(p.get('zone'), p.get('interface'), p.get('permanent', False)),
+            "list_interfaces": lambda p: self._list_interfaces(p.get('zone')),
             
             # Source operations
-            elif action == "add_source":
-                return self._add_source(
-                    params.get('zone'),
-                    params.get('source'),
-                    params.get('permanent', False)
-                )
-            elif action == "remove_source":
-                return self._remove_source(
-                    params.get('zone'),
-                    params.get('source'),
-                    params.get('permanent', False)
-                )
-            elif action == "change_source":
-                return self._change_source(
-                    params.get('zone'),
-                    params.get('source'),
-                    params.get('permanent', False)
-                )
-            elif action == "list_sources":
-                return self._list_sources(params.get('zone'))
+            "add_source": lambda p: self._add_source(p.get('zone'), p.get('source'), p.get('permanent', False), p.get('wait', True)),
+            "remove_source": lambda p: self._remove_source(p.get('zone'), p.get('source'), p.get('permanent', False), p.get('wait', True)),
+            "change_source": lambda p: self._change_source(p.get('zone'), p.get('source'), p.get('permanent', False)),
+            "list_sources": lambda p: self._list_sources(p.get('zone')),
             
             # Port operations
-            elif action == "add_port":
-                return self._add_port(
-                    params.get('zone'),
-                    params.get('port'),
-                    params.get('permanent', False)
-                )
-            elif action == "remove_port":
-                return self._remove_port(
-                    params.get('zone'),
-                    params.get('port'),
-                    params.get('permanent', False)
-                )
+            "add_port": lambda p: self._add_port(p.get('zone'), p.get('port'), p.get('permanent', False), p.get('wait', True)),
+            "remove_port": lambda p: self._remove_port(p.get('zone'), p.get('port'), p.get('permanent', False), p.get('wait', True)),
             
             # Rich rule operations
-            elif action == "add_rich_rule":
-                return self._add_rich_rule(
-                    params.get('zone'),
-                    params.get('rule'),
-                    params.get('permanent', False)
-                )
-            elif action == "remove_rich_rule":
-                return self._remove_rich_rule(
-                    params.get('zone'),
-                    params.get('rule'),
-                    params.get('permanent', False)
-                )
+            "add_rich_rule": lambda p: self._add_rich_rule(p.get('zone'), p.get('rule'), p.get('permanent', False), p.get('wait', True)),
+            "remove_rich_rule": lambda p: self._remove_rich_rule(p.get('zone'), p.get('rule'), p.get('permanent', False), p.get('wait', True)),
             
             # Protocol operations
-            elif action == "add_protocol":
-                return self._add_protocol(
-                    params.get('zone'),
-                    params.get('protocol'),
-                    params.get('permanent', False)
-                )
-            elif action == "remove_protocol":
-                return self._remove_protocol(
-                    params.get('zone'),
-                    params.get('protocol'),
-                    params.get('permanent', False)
-                )
+            "add_protocol": lambda p: self._add_protocol(p.get('zone'), p.get('protocol'), p.get('permanent', False), p.get('wait', True)),
+            "remove_protocol": lambda p: self._remove_protocol(p.get('zone'), p.get('protocol'), p.get('permanent', False), p.get('wait', True)),
             
             # Source port operations
-            elif action == "add_source_port":
-                return self._add_source_port(
-                    params.get('zone'),
-                    params.get('port'),
-                    params.get('permanent', False)
-                )
-            elif action == "remove_source_port":
-                return self._remove_source_port(
-                    params.get('zone'),
-                    params.get('port'),
-                    params.get('permanent', False)
-                )
+            "add_source_port": lambda p: self._add_source_port(p.get('zone'), p.get('port'), p.get('permanent', False), p.get('wait', True)),
+            "remove_source_port": lambda p: self._remove_source_port(p.get('zone'), p.get('port'), p.get('permanent', False), p.get('wait', True)),
             
             # ICMP block operations
-            elif action == "add_icmp_block":
-                return self._add_icmp_block(
-                    params.get('zone'),
-                    params.get('icmp_type'),
-                    params.get('permanent', False)
-                )
-            elif action == "remove_icmp_block":
-                return self._remove_icmp_block(
-                    params.get('zone'),
-                    params.get('icmp_type'),
-                    params.get('permanent', False)
-                )
-            elif action == "add_icmp_block_inversion":
-                return self._add_icmp_block_inversion(
-                    params.get('zone'),
-                    params.get('permanent', False)
-                )
-            elif action == "remove_icmp_block_inversion":
-                return self._remove_icmp_block_inversion(
-                    params.get('zone'),
-                    params.get('permanent', False)
-                )
+            "add_icmp_block": lambda p: self._add_icmp_block(p.get('zone'), p.get('icmp_type'), p.get('permanent', False), p.get('wait', True)),
+            "remove_icmp_block": lambda p: self._remove_icmp_block(p.get('zone'), p.get('icmp_type'), p.get('permanent', False), p.get('wait', True)),
+            "add_icmp_block_inversion": lambda p: self._add_icmp_block_inversion(p.get('zone'), p.get('permanent', False), p.get('wait', True)),
+            "remove_icmp_block_inversion": lambda p: self._remove_icmp_block_inversion(p.get('zone'), p.get('permanent', False), p.get('wait', True)),
             
             # Masquerade operations
-            elif action == "add_masquerade":
-                return self._add_masquerade(
-                    params.get('zone'),
-                    params.get('permanent', False)
-                )
-            elif action == "remove_masquerade":
-                return self._remove_masquerade(
-                    params.get('zone'),
-                    params.get('permanent', False)
-                )
+            "add_masquerade": lambda p: self._add_masquerade(p.get('zone'), p.get('permanent', False), p.get('wait', True)),
+            "remove_masquerade": lambda p: self._remove_masquerade(p.get('zone'), p.get('permanent', False), p.get('wait', True)),
             
             # Forward port operations
-            elif action == "add_forward_port":
-                return self._add_forward_port(
-                    params.get('zone'),
-                    params.get('port'),
-                    params.get('to_port'),
-                    params.get('to_addr'),
-                    params.get('permanent', False)
-                )
-            elif action == "remove_forward_port":
-                return self._remove_forward_port(
-                    params.get('zone'),
-                    params.get('port'),
-                    params.get('to_port'),
-                    params.get('to_addr'),
-                    params.get('permanent', False)
-                )
+            "add_forward_port": lambda p: self._add_forward_port(p.get('zone'), p.get('port'), p.get('to_port'), p.get('to_addr'), p.get('permanent', False)),
+            "remove_forward_port": lambda p: self._remove_forward_port(p.get('zone'), p.get('port'), p.get('to_port'), p.get('to_addr'), p.get('permanent', False)),
             
             # Control operations
-            elif action == "reload":
-                return self._reload()
-            elif action == "complete_reload":
-                return self._complete_reload()
-            elif action == "runtime_to_permanent":
-                return self._runtime_to_permanent()
-            elif action == "check_config":
-                return self._check_config()
+            "reload": lambda p: self._reload(),
+            "complete_reload": lambda p: self._complete_reload(),
+            "runtime_to_permanent": lambda p: self._runtime_to_permanent(),
+            "check_config": lambda p: self._check_config(),
+            "batch": lambda p: self._batch(p.get('operations'), p.get('reload', False)),
+            "sync": lambda p: self._sync(),
+            "query_many": lambda p: self._query_many(p.get('queries')),
             
             # Service control operations
-            elif action == "service_status":
-                return self._service_status()
-            elif action == "start_service":
-                return self._start_service()
-            elif action == "stop_service":
-                return self._stop_service()
-            elif action == "restart_service":
-                return self._restart_service()
+            "service_status": lambda p: self._service_status(),
+            "start_service": lambda p: self._start_service(),
+            "stop_service": lambda p: self._stop_service(),
+            "restart_service": lambda p: self._restart_service(),
             
             # Panic mode operations
-            elif action == "query_panic":
-                return self._query_panic()
-            elif action == "panic_on":
-                return self._panic_on()
-            elif action == "panic_off":
-                return self._panic_off()
+            "query_panic": lambda p: self._cached('query_panic', self._query_panic),
+            "panic_on": lambda p: self._panic_on(),
+            "panic_off": lambda p: self._panic_off(),
             
             # Log denied packets operations
-            elif action == "get_log_denied":
-                return self._get_log_denied()
-            elif action == "set_log_denied":
-                return self._set_log_denied(command.parameters)
+            "get_log_denied": lambda p: self._cached('get_log_denied', self._get_log_denied),
+            "set_log_denied": lambda p: self._set_log_denied(p),
             
             # Custom service management operations
-            elif action == "list_services":
-                return self._list_services()
-            elif action == "get_service_info":
-                return self._get_service_info(params.get('service'))
-            elif action == "new_service":
-                return self._new_service(params.get('service'))
-            elif action == "delete_service":
-                return self._delete_service(params.get('service'))
-            elif action == "service_add_port":
-                return self._service_add_port(params.get('service'), params.get('port'), params.get('protocol'))
-            elif action == "service_remove_port":
-                return self._service_remove_port(params.get('service'), params.get('port'), params.get('protocol'))
-            elif action == "service_add_protocol":
-                return self._service_add_protocol(params.get('service'), params.get('protocol'))
-            elif action == "service_remove_protocol":
-                return self._service_remove_protocol(params.get('service'), params.get('protocol'))
+            "get_service_info": lambda p: self._get_service_info(p.get('service')),
+            "new_service": lambda p: self._new_service(p.get('service')),
+            "delete_service": lambda p: self._delete_service(p.get('service')),
+            "service_add_port": lambda p: self._service_add_port(p.get('service'), p.get('port'), p.get('protocol')),
+            "service_remove_port": lambda p: self._service_remove_port(p.get('service'), p.get('port'), p.get('protocol')),
+            "service_add_protocol": lambda p: self._service_add_protocol(p.get('service'), p.get('protocol')),
+            "service_remove_protocol": lambda p: self._service_remove_protocol(p.get('service'), p.get('protocol')),
             
             # IPSet management operations
-            elif action == "list_ipsets":
-                return self._list_ipsets()
-            elif action == "get_ipset_info":
-                return self._get_ipset_info(params.get('ipset'))
-            elif action == "new_ipset":
-                return self._new_ipset(params.get('ipset'), params.get('type'))
-            elif action == "delete_ipset":
-                return self._delete_ipset(params.get('ipset'))
-            elif action == "ipset_add_entry":
-                return self._ipset_add_entry(params.get('ipset'), params.get('entry'))
-            elif action == "ipset_remove_entry":
-                return self._ipset_remove_entry(params.get('ipset'), params.get('entry'))
-            elif action == "zone_add_source_ipset":
-                return self._zone_add_source_ipset(params.get('zone'), params.get('ipset'), params.get('permanent', False))
-            elif action == "zone_remove_source_ipset":
-                return self._zone_remove_source_ipset(params.get('zone'), params.get('ipset'), params.get('permanent', False))
+            "list_ipsets": lambda p: self._cached('list_ipsets', self._list_ipsets),
+            "get_ipset_info": lambda p: self._get_ipset_info(p.get('ipset')),
+            "new_ipset": lambda p: self._new_ipset(p.get('ipset'), p.get('type')),
+            "delete_ipset": lambda p: self._delete_ipset(p.get('ipset')),
+            "ipset_add_entry": lambda p: self._ipset_add_entry(p.get('ipset'), p.get('entry')),
+            "ipset_remove_entry": lambda p: self._ipset_remove_entry(p.get('ipset'), p.get('entry')),
+            "zone_add_source_ipset": lambda p: self._zone_add_source_ipset(p.get('zone'), p.get('ipset'), p.get('permanent', False)),
+            "zone_remove_source_ipset": lambda p: self._zone_remove_source_ipset(p.get('zone'), p.get('ipset'), p.get('permanent', False)),
             
             # Helper module management operations
-            elif action == "list_helpers":
-                return self._list_helpers()
-            elif action == "zone_list_helpers":
-                return self._zone_list_helpers(params.get('zone'))
-            elif action == "zone_add_helper":
-                return self._zone_add_helper(params.get('zone'), params.get('helper'), params.get('permanent', False))
-            elif action == "zone_remove_helper":
-                return self._zone_remove_helper(params.get('zone'), params.get('helper'), params.get('permanent', False))
+            "list_helpers": lambda p: self._cached('list_helpers', self._list_helpers),
+            "zone_list_helpers": lambda p: self._zone_list_helpers(p.get('zone')),
+            "zone_add_helper": lambda p: self._zone_add_helper(p.get('zone'), p.get('helper'), p.get('permanent', False)),
+            "zone_remove_helper": lambda p: self._zone_remove_helper(p.get('zone'), p.get('helper'), p.get('permanent', False)),
             
             # Policy management operations
-            elif action == "list_policies":
-                return self._list_policies()
-            elif action == "policy_add":
-                return self._policy_add(params.get('policy'), params.get('permanent', False))
-            elif action == "policy_delete":
-                return self._policy_delete(params.get('policy'), params.get('permanent', False))
-            elif action == "policy_get_info":
-                return self._policy_get_info(params.get('policy'))
-            elif action == "policy_set_ingress_zone":
-                return self._policy_set_ingress_zone(params.get('policy'), params.get('zone'), params.get('permanent', False))
-            elif action == "policy_set_egress_zone":
-                return self._policy_set_egress_zone(params.get('policy'), params.get('zone'), params.get('permanent', False))
-            elif action == "policy_set_target":
-                return self._policy_set_target(params.get('policy'), params.get('target'), params.get('permanent', False))
+            "list_policies": lambda p: self._list_policies(),
+            "policy_add": lambda p: self._policy_add(p.get('policy'), p.get('permanent', False)),
+            "policy_delete": lambda p: self._policy_delete(p.get('policy'), p.get('permanent', False)),
+            "policy_get_info": lambda p: self._policy_get_info(p.get('policy')),
+            "policy_set_ingress_zone": lambda p: self._policy_set_ingress_zone(p.get('policy'), p.get('zone'), p.get('permanent', False)),
+            "policy_set_egress_zone": lambda p: self._policy_set_egress_zone(p.get('policy'), p.get('zone'), p.get('permanent', False)),
+            "policy_set_target": lambda p: self._policy_set_target(p.get('policy'), p.get('target'), p.get('permanent', False)),
             
             # Direct rules operations
-            elif action == "direct_get_all_chains":
-                return self._direct_get_all_chains(params.get('ipv'), params.get('table'))
-            elif action == "direct_add_chain":
-                return self._direct_add_chain(params.get('ipv'), params.get('table'), params.get('chain'))
-            elif action == "direct_remove_chain":
-                return self._direct_remove_chain(params.get('ipv'), params.get('table'), params.get('chain'))
-            elif action == "direct_get_all_rules":
-                return self._direct_get_all_rules()
-            elif action == "direct_add_rule":
-                return self._direct_add_rule(params.get('ipv'), params.get('table'), params.get('chain'), 
-                                            params.get('priority'), params.get('args'))
-            elif action == "direct_remove_rule":
-                return self._direct_remove_rule(params.get('ipv'), params.get('table'), params.get('chain'), 
-                                               params.get('priority'), params.get('args'))
-            elif action == "direct_get_passthrough":
-                return self._direct_get_passthrough(params.get('ipv'))
-            elif action == "direct_add_passthrough":
-                return self._direct_add_passthrough(params.get('ipv'), params.get('args'))
+            "direct_get_all_chains": lambda p: self._direct_get_all_chains(p.get('ipv'), p.get('table')),
+            "direct_add_chain": lambda p: self._direct_add_chain(p.get('ipv'), p.get('table'), p.get('chain')),
+            "direct_remove_chain": lambda p: self._direct_remove_chain(p.get('ipv'), p.get('table'), p.get('chain')),
+            "direct_get_all_rules": lambda p: self._direct_get_all_rules(),
+            "direct_add_rule": lambda p: self._direct_add_rule(p.get('ipv'), p.get('table'), p.get('chain'), p.get('priority'), p.get('args')),
+            "direct_remove_rule": lambda p: self._direct_remove_rule(p.get('ipv'), p.get('table'), p.get('chain'), p.get('priority'), p.get('args')),
+            "direct_get_passthrough": lambda p: self._direct_get_passthrough(p.get('ipv')),
+            "direct_add_passthrough": lambda p: self._direct_add_passthrough(p.get('ipv'), p.get('args')),
             
             # Lockdown operations
-            elif action == "lockdown_get_status":
-                return self._lockdown_get_status()
-            elif action == "lockdown_enable":
-                return self._lockdown_enable()
-            elif action == "lockdown_disable":
-                return self._lockdown_disable()
-            elif action == "lockdown_list_commands":
-                return self._lockdown_list_commands()
-            elif action == "lockdown_add_command":
-                return self._lockdown_add_command(params.get('command'))
-            elif action == "lockdown_remove_command":
-                return self._lockdown_remove_command(params.get('command'))
-            elif action == "lockdown_list_contexts":
-                return self._lockdown_list_contexts()
-            elif action == "lockdown_add_context":
-                return self._lockdown_add_context(params.get('context'))
-            elif action == "lockdown_remove_context":
-                return self._lockdown_remove_context(params.get('context'))
-            elif action == "lockdown_list_users":
-                return self._lockdown_list_users()
-            elif action == "lockdown_add_user":
-                return self._lockdown_add_user(params.get('user'))
-            elif action == "lockdown_remove_user":
-                return self._lockdown_remove_user(params.get('user'))
-            elif action == "lockdown_list_uids":
-                return self._lockdown_list_uids()
-            elif action == "lockdown_add_uid":
-                return self._lockdown_add_uid(params.get('uid'))
-            elif action == "lockdown_remove_uid":
-                return self._lockdown_remove_uid(params.get('uid'))
-            
-            else:
-                return CommandResponse(success=False, error=f"Unknown action: {action}")
-                
+            "lockdown_get_status": lambda p: self._lockdown_get_status(),
+            "lockdown_enable": lambda p: self._lockdown_enable(),
+            "lockdown_disable": lambda p: self._lockdown_disable(),
+            "lockdown_list_commands": lambda p: self._lockdown_list_commands(),
+            "lockdown_add_command": lambda p: self._lockdown_add_command(p.get('command')),
+            "lockdown_remove_command": lambda p: self._lockdown_remove_command(p.get('command')),
+            "lockdown_list_contexts": lambda p: self._lockdown_list_contexts(),
+            "lockdown_add_context": lambda p: self._lockdown_add_context(p.get('context')),
+            "lockdown_remove_context": lambda p: self._lockdown_remove_context(p.get('context')),
+            "lockdown_list_users": lambda p: self._lockdown_list_users(),
+            "lockdown_add_user": lambda p: self._lockdown_add_user(p.get('user')),
+            "lockdown_remove_user": lambda p: self._lockdown_remove_user(p.get('user')),
+            "lockdown_list_uids": lambda p: self._lockdown_list_uids(),
+            "lockdown_add_uid": lambda p: self._lockdown_add_uid(p.get('uid')),
+            "lockdown_remove_uid": lambda p: self._lockdown_remove_uid(p.get('uid')),
+        }
+    
+    def validate_command(self, command: CommandRequest) -> tuple[bool, Optional[str]]:
+        """Validate the action, that its required parameters are present and non-empty, and wait=false."""
+        is_valid, error = super().validate_command(command)
+        if not is_valid:
+            return is_valid, error
+        
+        params = command.parameters
+        for name in _REQUIRED[command.action]:
+            value = params.get(name)
+            if value is None or value == "" or value == []:
+                return False, f"Missing required parameter '{name}' for action '{command.action}'"
+        
+        if not self._allow_no_wait and not params.get('wait', True):
+            return False, "wait=false is not supported with several rootd workers"
+        
+        return True, None
+    
+    def execute_command(self, command: CommandRequest) -> CommandResponse:
+        """Execute a firewalld command."""
+        # Validate command
+        is_valid, error = self.validate_command(command)
+        if not is_valid:
+            return CommandResponse(success=False, error=error)
+        
+        try:
+            handler = self._dispatch.get(command.action)
+            if handler is None:
+                return CommandResponse(success=False, error=f"Unknown action: {command.action}")
+            return handler(command.parameters)
+        
         except Exception as e:
             self.logger.error(f"Error executing command {command.action}: {e}")
             return CommandResponse(success=False, error=str(e))
     
     def _get_status(self) -> CommandResponse:
         """Get firewalld status."""
-        success, stdout, stderr = self._run_command(['systemctl', 'is-active', 'firewalld'])
-        is_active = stdout.strip() == 'active'
+        result = self._dbus(lambda: str(self._fw.get_dbus_method(
+            'Get', 'org.freedesktop.DBus.Properties')(FIREWALLD_BUS_NAME, 'state')))
+        if result is not None and result[0]:
+            # firewalld reports INIT, FAILED or RUNNING
+            state = result[1]
+            status = 'active' if state == 'RUNNING' else state.lower()
+        else:
+            success, stdout, stderr = self._run_command(['systemctl', 'is-active', 'firewalld'])
+            status = stdout.strip()
         
         return CommandResponse(
             success=True,
-            data={'active': is_active, 'status': stdout.strip()}
+            data={'active': status == 'active', 'status': status}
         )
     
     def _get_version(self) -> CommandResponse:
         """Get firewalld version."""
-        success, stdout, stderr = self._run_command(['firewall-cmd', '--version'])
+        result = self._dbus(lambda: str(self._fw.get_dbus_method(
+            'Get', 'org.freedesktop.DBus.Properties')(FIREWALLD_BUS_NAME, 'version')))
+        if result is not None:
+            success, version, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(['firewall-cmd', '--version'])
+            version = stdout.strip()
         if not success:
             return CommandResponse(success=False, error=stderr)
         
-        return CommandResponse(success=True, data={'version': stdout.strip()})
+        return CommandResponse(success=True, data={'version': version})
     
     def _list_zones(self) -> CommandResponse:
         """List all zones."""
-        success, stdout, stderr = self._run_command(['firewall-cmd', '--get-zones'])
+        result = self._dbus(lambda: [str(zone) for zone in self._fw_zone.getZones()])
+        if result is not None:
+            success, zones, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(['firewall-cmd', '--get-zones'], binary=True)
+            zones = _split_names(stdout)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
-        zones = stdout.strip().split()
         return CommandResponse(success=True, data={'zones': zones})
     
     def _get_zone(self, zone: str) -> CommandResponse:
         """Get zone configuration."""
-        if not zone:
-            return CommandResponse(success=False, error="Zone name is required")
-        
         # Get zone info
         success, stdout, stderr = self._run_command(['firewall-cmd', '--zone', zone, '--list-all'])
         if not success:
@@ -1244,35 +1530,32 @@ class FirewalldModule(BaseModule):
     
     def _get_default_zone(self) -> CommandResponse:
         """Get default zone."""
-        success, stdout, stderr = self._run_command(['firewall-cmd', '--get-default-zone'])
-        if not success:
-            return CommandResponse(success=False, error=stderr)
-        
-        return CommandResponse(success=True, data={'default_zone': stdout.strip()})
-    
-    def _list_services(self) -> CommandResponse:
-        """List available services."""
-        success, stdout, stderr = self._run_command(['firewall-cmd', '--get-services'])
+        result = self._dbus(lambda: str(self._fw.getDefaultZone()))
+        if result is not None:
+            success, default_zone, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(['firewall-cmd', '--get-default-zone'])
+            default_zone = stdout.strip()
         if not success:
             return CommandResponse(success=False, error=stderr)
         
-        services = stdout.strip().split()
-        return CommandResponse(success=True, data={'services': services})
+        return CommandResponse(success=True, data={'default_zone': default_zone})
     
     def _list_icmptypes(self) -> CommandResponse:
         """List available ICMP types."""
-        success, stdout, stderr = self._run_command(['firewall-cmd', '--get-icmptypes'])
+        result = self._dbus(lambda: [str(name) for name in self._fw.listIcmpTypes()])
+        if result is not None:
+            success, icmptypes, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(['firewall-cmd', '--get-icmptypes'], binary=True)
+            icmptypes = _split_names(stdout)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
-        icmptypes = stdout.strip().split()
         return CommandResponse(success=True, data={'icmptypes': icmptypes})
     
     def _new_zone(self, zone: str, permanent: bool) -> CommandResponse:
         """Create a new zone."""
-        if not zone:
-            return CommandResponse(success=False, error="Zone name is required")
-        
         cmd = ['firewall-cmd', f'--new-zone={zone}']
         if permanent:
             cmd.append('--permanent')
@@ -1280,6 +1563,7 @@ class FirewalldModule(BaseModule):
         success, stdout, stderr = self._run_command(cmd)
         if not success:
             return CommandResponse(success=False, error=stderr)
+        self._invalidate('list_zones')
         
         return CommandResponse(
             success=True,
@@ -1288,9 +1572,6 @@ class FirewalldModule(BaseModule):
     
     def _delete_zone(self, zone: str, permanent: bool) -> CommandResponse:
         """Delete a zone."""
-        if not zone:
-            return CommandResponse(success=False, error="Zone name is required")
-        
         cmd = ['firewall-cmd', f'--delete-zone={zone}']
         if permanent:
             cmd.append('--permanent')
@@ -1298,6 +1579,7 @@ class FirewalldModule(BaseModule):
         success, stdout, stderr = self._run_command(cmd)
         if not success:
             return CommandResponse(success=False, error=stderr)
+        self._invalidate('list_zones')
         
         return CommandResponse(
             success=True,
@@ -1306,8 +1588,12 @@ class FirewalldModule(BaseModule):
     
     def _get_zone_of_interface(self, interface: str) -> CommandResponse:
         """Get the zone an interface belongs to."""
-        if not interface:
-            return CommandResponse(success=False, error="Interface name is required")
+        result = self._dbus(lambda: str(self._fw_zone.getZoneOfInterface(interface)))
+        if result is not None:
+            success, zone, stderr = result
+            if not success:
+                return CommandResponse(success=False, error=stderr)
+            return CommandResponse(success=True, data={'interface': interface, 'zone': zone or None})
         
         success, stdout, stderr = self._run_command(['firewall-cmd', f'--get-zone-of-interface={interface}'])
         if not success:
@@ -1321,8 +1607,12 @@ class FirewalldModule(BaseModule):
     
     def _get_zone_of_source(self, source: str) -> CommandResponse:
         """Get the zone a source belongs to."""
-        if not source:
-            return CommandResponse(success=False, error="Source is required")
+        result = self._dbus(lambda: str(self._fw_zone.getZoneOfSource(source)))
+        if result is not None:
+            success, zone, stderr = result
+            if not success:
+                return CommandResponse(success=False, error=stderr)
+            return CommandResponse(success=True, data={'source': source, 'zone': zone or None})
         
         success, stdout, stderr = self._run_command(['firewall-cmd', f'--get-zone-of-source={source}'])
         if not success:
@@ -1344,25 +1634,24 @@ class FirewalldModule(BaseModule):
     
     def _set_default_zone(self, zone: str) -> CommandResponse:
         """Set default zone."""
-        if not zone:
-            return CommandResponse(success=False, error="Zone name is required")
-        
-        success, stdout, stderr = self._run_command(['firewall-cmd', '--set-default-zone', zone])
+        result = self._dbus(lambda: self._fw.setDefaultZone(zone))
+        if result is not None:
+            success, _, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(['firewall-cmd', '--set-default-zone', zone])
+        self._invalidate('get_default_zone')
         if not success:
             return CommandResponse(success=False, error=stderr)
         
         return CommandResponse(success=True, data={'default_zone': zone})
     
-    def _add_service(self, zone: str, service: str, permanent: bool) -> CommandResponse:
+    def _add_service(self, zone: str, service: str, permanent: bool, wait: bool = True) -> CommandResponse:
         """Add service to zone."""
-        if not zone or not service:
-            return CommandResponse(success=False, error="Zone and service are required")
-        
         cmd = ['firewall-cmd', f'--zone={zone}', f'--add-service={service}']
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stderr = self._zone_change(zone, 'addService', (service,), permanent, cmd, timeout=True, wait=wait)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1371,16 +1660,13 @@ class FirewalldModule(BaseModule):
             data={'zone': zone, 'service': service, 'permanent': permanent}
         )
     
-    def _remove_service(self, zone: str, service: str, permanent: bool) -> CommandResponse:
+    def _remove_service(self, zone: str, service: str, permanent: bool, wait: bool = True) -> CommandResponse:
         """Remove service from zone."""
-        if not zone or not service:
-            return CommandResponse(success=False, error="Zone and service are required")
-        
         cmd = ['firewall-cmd', f'--zone={zone}', f'--remove-service={service}']
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stderr = self._zone_change(zone, 'removeService', (service,), permanent, cmd, wait=wait)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1389,16 +1675,13 @@ class FirewalldModule(BaseModule):
             data={'zone': zone, 'service': service, 'permanent': permanent}
         )
     
-    def _add_interface(self, zone: str, interface: str, permanent: bool) -> CommandResponse:
+    def _add_interface(self, zone: str, interface: str, permanent: bool, wait: bool = True) -> CommandResponse:
         """Add interface to zone."""
-        if not zone or not interface:
-            return CommandResponse(success=False, error="Zone and interface are required")
-        
         cmd = ['firewall-cmd', f'--zone={zone}', f'--add-interface={interface}']
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stderr = self._zone_change(zone, 'addInterface', (interface,), permanent, cmd, wait=wait)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1407,16 +1690,13 @@ class FirewalldModule(BaseModule):
             data={'zone': zone, 'interface': interface, 'permanent': permanent}
         )
     
-    def _remove_interface(self, zone: str, interface: str, permanent: bool) -> CommandResponse:
+    def _remove_interface(self, zone: str, interface: str, permanent: bool, wait: bool = True) -> CommandResponse:
         """Remove interface from zone."""
-        if not zone or not interface:
-            return CommandResponse(success=False, error="Zone and interface are required")
-        
         cmd = ['firewall-cmd', f'--zone={zone}', f'--remove-interface={interface}']
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stderr = self._zone_change(zone, 'removeInterface', (interface,), permanent, cmd, wait=wait)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1427,14 +1707,13 @@ class FirewalldModule(BaseModule):
     
     def _change_interface(self, zone: str, interface: str, permanent: bool) -> CommandResponse:
         """Change interface to different zone."""
-        if not zone or not interface:
-            return CommandResponse(success=False, error="Zone and interface are required")
-        
         cmd = ['firewall-cmd', f'--zone={zone}', f'--change-interface={interface}']
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        # The permanent change spans the old and new zone configs; leave it to firewall-cmd
+        args = None if permanent else (interface,)
+        success, stderr = self._zone_change(zone, 'changeZoneOfInterface', args, permanent, cmd)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1445,26 +1724,24 @@ class FirewalldModule(BaseModule):
     
     def _list_interfaces(self, zone: str) -> CommandResponse:
         """List interfaces in a zone."""
-        if not zone:
-            return CommandResponse(success=False, error="Zone is required")
-        
-        success, stdout, stderr = self._run_command(['firewall-cmd', f'--zone={zone}', '--list-interfaces'])
+        result = self._dbus(lambda: [str(name) for name in self._fw_zone.getInterfaces(zone)])
+        if result is not None:
+            success, interfaces, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(['firewall-cmd', f'--zone={zone}', '--list-interfaces'], binary=True)
+            interfaces = _split_names(stdout)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
-        interfaces = stdout.strip().split() if stdout.strip() else []
         return CommandResponse(success=True, data={'zone': zone, 'interfaces': interfaces})
     
-    def _add_source(self, zone: str, source: str, permanent: bool) -> CommandResponse:
+    def _add_source(self, zone: str, source: str, permanent: bool, wait: bool = True) -> CommandResponse:
         """Add source to zone."""
-        if not zone or not source:
-            return CommandResponse(success=False, error="Zone and source are required")
-        
         cmd = ['firewall-cmd', f'--zone={zone}', f'--add-source={source}']
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stderr = self._zone_change(zone, 'addSource', (source,), permanent, cmd, wait=wait)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1473,16 +1750,13 @@ class FirewalldModule(BaseModule):
             data={'zone': zone, 'source': source, 'permanent': permanent}
         )
     
-    def _remove_source(self, zone: str, source: str, permanent: bool) -> CommandResponse:
+    def _remove_source(self, zone: str, source: str, permanent: bool, wait: bool = True) -> CommandResponse:
         """Remove source from zone."""
-        if not zone or not source:
-            return CommandResponse(success=False, error="Zone and source are required")
-        
         cmd = ['firewall-cmd', f'--zone={zone}', f'--remove-source={source}']
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stderr = self._zone_change(zone, 'removeSource', (source,), permanent, cmd, wait=wait)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1493,14 +1767,13 @@ class FirewalldModule(BaseModule):
     
     def _change_source(self, zone: str, source: str, permanent: bool) -> CommandResponse:
         """Change source to different zone."""
-        if not zone or not source:
-            return CommandResponse(success=False, error="Zone and source are required")
-        
         cmd = ['firewall-cmd', f'--zone={zone}', f'--change-source={source}']
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        # The permanent change spans the old and new zone configs; leave it to firewall-cmd
+        args = None if permanent else (source,)
+        success, stderr = self._zone_change(zone, 'changeZoneOfSource', args, permanent, cmd)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1511,26 +1784,28 @@ class FirewalldModule(BaseModule):
     
     def _list_sources(self, zone: str) -> CommandResponse:
         """List sources in a zone."""
-        if not zone:
-            return CommandResponse(success=False, error="Zone is required")
-        
-        success, stdout, stderr = self._run_command(['firewall-cmd', f'--zone={zone}', '--list-sources'])
+        result = self._dbus(lambda: [str(name) for name in self._fw_zone.getSources(zone)])
+        if result is not None:
+            success, sources, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(['firewall-cmd', f'--zone={zone}', '--list-sources'], binary=True)
+            sources = _split_names(stdout)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
-        sources = stdout.strip().split() if stdout.strip() else []
         return CommandResponse(success=True, data={'zone': zone, 'sources': sources})
     
-    def _add_port(self, zone: str, port: str, permanent: bool) -> CommandResponse:
+    def _add_port(self, zone: str, port: str, permanent: bool, wait: bool = True) -> CommandResponse:
         """Add port to zone."""
-        if not zone or not port:
-            return CommandResponse(success=False, error="Zone and port are required")
+        port_proto = _split_port(port)
+        if port_proto is None:
+            return CommandResponse(success=False, error=f"Invalid port '{port}', expected <port>[-<port>]/<tcp|udp|sctp|dccp>")
         
         cmd = ['firewall-cmd', f'--zone={zone}', f'--add-port={port}']
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stderr = self._zone_change(zone, 'addPort', port_proto, permanent, cmd, timeout=True, wait=wait)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1539,16 +1814,17 @@ class FirewalldModule(BaseModule):
             data={'zone': zone, 'port': port, 'permanent': permanent}
         )
     
-    def _remove_port(self, zone: str, port: str, permanent: bool) -> CommandResponse:
+    def _remove_port(self, zone: str, port: str, permanent: bool, wait: bool = True) -> CommandResponse:
         """Remove port from zone."""
-        if not zone or not port:
-            return CommandResponse(success=False, error="Zone and port are required")
+        port_proto = _split_port(port)
+        if port_proto is None:
+            return CommandResponse(success=False, error=f"Invalid port '{port}', expected <port>[-<port>]/<tcp|udp|sctp|dccp>")
         
         cmd = ['firewall-cmd', f'--zone={zone}', f'--remove-port={port}']
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stderr = self._zone_change(zone, 'removePort', port_proto, permanent, cmd, wait=wait)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1557,16 +1833,13 @@ class FirewalldModule(BaseModule):
             data={'zone': zone, 'port': port, 'permanent': permanent}
         )
     
-    def _add_rich_rule(self, zone: str, rule: str, permanent: bool) -> CommandResponse:
+    def _add_rich_rule(self, zone: str, rule: str, permanent: bool, wait: bool = True) -> CommandResponse:
         """Add rich rule to zone."""
-        if not zone or not rule:
-            return CommandResponse(success=False, error="Zone and rule are required")
-        
         cmd = ['firewall-cmd', f'--zone={zone}', f'--add-rich-rule={rule}']
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stderr = self._zone_change(zone, 'addRichRule', (rule,), permanent, cmd, timeout=True, wait=wait)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1575,16 +1848,13 @@ class FirewalldModule(BaseModule):
             data={'zone': zone, 'rule': rule, 'permanent': permanent}
         )
     
-    def _remove_rich_rule(self, zone: str, rule: str, permanent: bool) -> CommandResponse:
+    def _remove_rich_rule(self, zone: str, rule: str, permanent: bool, wait: bool = True) -> CommandResponse:
         """Remove rich rule from zone."""
-        if not zone or not rule:
-            return CommandResponse(success=False, error="Zone and rule are required")
-        
         cmd = ['firewall-cmd', f'--zone={zone}', f'--remove-rich-rule={rule}']
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stderr = self._zone_change(zone, 'removeRichRule', (rule,), permanent, cmd, wait=wait)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1593,16 +1863,13 @@ class FirewalldModule(BaseModule):
             data={'zone': zone, 'rule': rule, 'permanent': permanent}
         )
     
-    def _add_protocol(self, zone: str, protocol: str, permanent: bool) -> CommandResponse:
+    def _add_protocol(self, zone: str, protocol: str, permanent: bool, wait: bool = True) -> CommandResponse:
         """Add protocol to zone."""
-        if not zone or not protocol:
-            return CommandResponse(success=False, error="Zone and protocol are required")
-        
         cmd = ['firewall-cmd', f'--zone={zone}', f'--add-protocol={protocol}']
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stderr = self._zone_change(zone, 'addProtocol', (protocol,), permanent, cmd, timeout=True, wait=wait)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1611,16 +1878,13 @@ class FirewalldModule(BaseModule):
             data={'zone': zone, 'protocol': protocol, 'permanent': permanent}
         )
     
-    def _remove_protocol(self, zone: str, protocol: str, permanent: bool) -> CommandResponse:
+    def _remove_protocol(self, zone: str, protocol: str, permanent: bool, wait: bool = True) -> CommandResponse:
         """Remove protocol from zone."""
-        if not zone or not protocol:
-            return CommandResponse(success=False, error="Zone and protocol are required")
-        
         cmd = ['firewall-cmd', f'--zone={zone}', f'--remove-protocol={protocol}']
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stderr = self._zone_change(zone, 'removeProtocol', (protocol,), permanent, cmd, wait=wait)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1629,16 +1893,17 @@ class FirewalldModule(BaseModule):
             data={'zone': zone, 'protocol': protocol, 'permanent': permanent}
         )
     
-    def _add_source_port(self, zone: str, port: str, permanent: bool) -> CommandResponse:
+    def _add_source_port(self, zone: str, port: str, permanent: bool, wait: bool = True) -> CommandResponse:
         """Add source port to zone."""
-        if not zone or not port:
-            return CommandResponse(success=False, error="Zone and source port are required")
+        port_proto = _split_port(port)
+        if port_proto is None:
+            return CommandResponse(success=False, error=f"Invalid port '{port}', expected <port>[-<port>]/<tcp|udp|sctp|dccp>")
         
         cmd = ['firewall-cmd', f'--zone={zone}', f'--add-source-port={port}']
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stderr = self._zone_change(zone, 'addSourcePort', port_proto, permanent, cmd, timeout=True, wait=wait)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1647,16 +1912,17 @@ class FirewalldModule(BaseModule):
             data={'zone': zone, 'source_port': port, 'permanent': permanent}
         )
     
-    def _remove_source_port(self, zone: str, port: str, permanent: bool) -> CommandResponse:
+    def _remove_source_port(self, zone: str, port: str, permanent: bool, wait: bool = True) -> CommandResponse:
         """Remove source port from zone."""
-        if not zone or not port:
-            return CommandResponse(success=False, error="Zone and source port are required")
+        port_proto = _split_port(port)
+        if port_proto is None:
+            return CommandResponse(success=False, error=f"Invalid port '{port}', expected <port>[-<port>]/<tcp|udp|sctp|dccp>")
         
         cmd = ['firewall-cmd', f'--zone={zone}', f'--remove-source-port={port}']
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stderr = self._zone_change(zone, 'removeSourcePort', port_proto, permanent, cmd, wait=wait)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1665,16 +1931,13 @@ class FirewalldModule(BaseModule):
             data={'zone': zone, 'source_port': port, 'permanent': permanent}
         )
     
-    def _add_icmp_block(self, zone: str, icmp_type: str, permanent: bool) -> CommandResponse:
+    def _add_icmp_block(self, zone: str, icmp_type: str, permanent: bool, wait: bool = True) -> CommandResponse:
         """Add ICMP block to zone."""
-        if not zone or not icmp_type:
-            return CommandResponse(success=False, error="Zone and ICMP type are required")
-        
         cmd = ['firewall-cmd', f'--zone={zone}', f'--add-icmp-block={icmp_type}']
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stderr = self._zone_change(zone, 'addIcmpBlock', (icmp_type,), permanent, cmd, timeout=True, wait=wait)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1683,16 +1946,13 @@ class FirewalldModule(BaseModule):
             data={'zone': zone, 'icmp_type': icmp_type, 'permanent': permanent}
         )
     
-    def _remove_icmp_block(self, zone: str, icmp_type: str, permanent: bool) -> CommandResponse:
+    def _remove_icmp_block(self, zone: str, icmp_type: str, permanent: bool, wait: bool = True) -> CommandResponse:
         """Remove ICMP block from zone."""
-        if not zone or not icmp_type:
-            return CommandResponse(success=False, error="Zone and ICMP type are required")
-        
         cmd = ['firewall-cmd', f'--zone={zone}', f'--remove-icmp-block={icmp_type}']
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stderr = self._zone_change(zone, 'removeIcmpBlock', (icmp_type,), permanent, cmd, wait=wait)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1701,16 +1961,13 @@ class FirewalldModule(BaseModule):
             data={'zone': zone, 'icmp_type': icmp_type, 'permanent': permanent}
         )
     
-    def _add_icmp_block_inversion(self, zone: str, permanent: bool) -> CommandResponse:
+    def _add_icmp_block_inversion(self, zone: str, permanent: bool, wait: bool = True) -> CommandResponse:
         """Enable ICMP block inversion for zone."""
-        if not zone:
-            return CommandResponse(success=False, error="Zone is required")
-        
         cmd = ['firewall-cmd', f'--zone={zone}', '--add-icmp-block-inversion']
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stderr = self._zone_change(zone, 'addIcmpBlockInversion', (), permanent, cmd, wait=wait)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1719,16 +1976,13 @@ class FirewalldModule(BaseModule):
             data={'zone': zone, 'permanent': permanent}
         )
     
-    def _remove_icmp_block_inversion(self, zone: str, permanent: bool) -> CommandResponse:
+    def _remove_icmp_block_inversion(self, zone: str, permanent: bool, wait: bool = True) -> CommandResponse:
         """Disable ICMP block inversion for zone."""
-        if not zone:
-            return CommandResponse(success=False, error="Zone is required")
-        
         cmd = ['firewall-cmd', f'--zone={zone}', '--remove-icmp-block-inversion']
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stderr = self._zone_change(zone, 'removeIcmpBlockInversion', (), permanent, cmd, wait=wait)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1737,16 +1991,13 @@ class FirewalldModule(BaseModule):
             data={'zone': zone, 'permanent': permanent}
         )
     
-    def _add_masquerade(self, zone: str, permanent: bool) -> CommandResponse:
+    def _add_masquerade(self, zone: str, permanent: bool, wait: bool = True) -> CommandResponse:
         """Enable masquerading for zone."""
-        if not zone:
-            return CommandResponse(success=False, error="Zone is required")
-        
         cmd = ['firewall-cmd', f'--zone={zone}', '--add-masquerade']
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stderr = self._zone_change(zone, 'addMasquerade', (), permanent, cmd, timeout=True, wait=wait)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1755,16 +2006,13 @@ class FirewalldModule(BaseModule):
             data={'zone': zone, 'permanent': permanent}
         )
     
-    def _remove_masquerade(self, zone: str, permanent: bool) -> CommandResponse:
+    def _remove_masquerade(self, zone: str, permanent: bool, wait: bool = True) -> CommandResponse:
         """Disable masquerading for zone."""
-        if not zone:
-            return CommandResponse(success=False, error="Zone is required")
-        
         cmd = ['firewall-cmd', f'--zone={zone}', '--remove-masquerade']
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stderr = self._zone_change(zone, 'removeMasquerade', (), permanent, cmd, wait=wait)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1775,9 +2023,6 @@ class FirewalldModule(BaseModule):
     
     def _add_forward_port(self, zone: str, port: str, to_port: Optional[str], to_addr: Optional[str], permanent: bool) -> CommandResponse:
         """Add port forwarding rule to zone."""
-        if not zone or not port:
-            return CommandResponse(success=False, error="Zone and port are required")
-        
         cmd = ['firewall-cmd', f'--zone={zone}', f'--add-forward-port=port={port}']
         if to_port:
             # Append to the same parameter
@@ -1788,7 +2033,9 @@ class FirewalldModule(BaseModule):
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        port_proto = _split_port(port)
+        args = port_proto + (to_port or '', to_addr or '') if port_proto else None
+        success, stderr = self._zone_change(zone, 'addForwardPort', args, permanent, cmd, timeout=True)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1799,9 +2046,6 @@ class FirewalldModule(BaseModule):
     
     def _remove_forward_port(self, zone: str, port: str, to_port: Optional[str], to_addr: Optional[str], permanent: bool) -> CommandResponse:
         """Remove port forwarding rule from zone."""
-        if not zone or not port:
-            return CommandResponse(success=False, error="Zone and port are required")
-        
         cmd = ['firewall-cmd', f'--zone={zone}', f'--remove-forward-port=port={port}']
         if to_port:
             cmd[-1] += f':toport={to_port}'
@@ -1811,7 +2055,9 @@ class FirewalldModule(BaseModule):
         if permanent:
             cmd.append('--permanent')
         
-        success, stdout, stderr = self._run_command(cmd)
+        port_proto = _split_port(port)
+        args = port_proto + (to_port or '', to_addr or '') if port_proto else None
+        success, stderr = self._zone_change(zone, 'removeForwardPort', args, permanent, cmd)
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1822,15 +2068,253 @@ class FirewalldModule(BaseModule):
     
     def _reload(self) -> CommandResponse:
         """Reload firewalld."""
-        success, stdout, stderr = self._run_command(['firewall-cmd', '--reload'])
+        result = self._dbus(lambda: self._fw.reload())
+        if result is not None:
+            success, _, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(['firewall-cmd', '--reload'])
+        self._invalidate()
         if not success:
             return CommandResponse(success=False, error=stderr)
         
         return CommandResponse(success=True, data={'reloaded': True})
     
+    def _batch(self, operations: Any, reload: bool) -> CommandResponse:
+        """
+        Apply many zone changes in one request.
+        
+        Every operation is validated before any is applied, so a malformed
+        batch changes nothing. The operations share the module's D-Bus
+        connection; permanent changes take effect at the single optional
+        reload at the end rather than one reload per change.
+        
+        Operations on the same zone and configuration (runtime or
+        permanent) run in order on one thread; different groups run
+        concurrently. A zone's permanent operations are written with a
+        single settings update when D-Bus is available; without D-Bus a
+        group is sent as one firewall-cmd invocation.
+        """
+        if not isinstance(operations, list) or not operations:
+            return CommandResponse(success=False, error="Operations must be a non-empty list")
+        
+        requests = []
+        for index, op in enumerate(operations):
+            if not isinstance(op, dict) or op.get('action') not in _BATCH_ACTIONS:
+                action = op.get('action') if isinstance(op, dict) else None
+                return CommandResponse(
+                    success=False,
+                    error=f"Operation {index}: unsupported batch action '{action}'"
+                )
+            parameters = op.get('parameters', {})
+            if not isinstance(parameters, dict):
+                return CommandResponse(success=False, error=f"Operation {index}: parameters must be a dictionary")
+            request = CommandRequest(module=self.name, action=op['action'], parameters=parameters)
+            is_valid, error = self.validate_command(request)
+            if not is_valid:
+                return CommandResponse(success=False, error=f"Operation {index}: {error}")
+            requests.append(request)
+        
+        groups: Dict[Tuple[Any, bool], List[int]] = {}
+        for index, request in enumerate(requests):
+            key = (request.parameters.get('zone'), bool(request.parameters.get('permanent', False)))
+            groups.setdefault(key, []).append(index)
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        
+        def run_group(key: Tuple[Any, bool], indexes: List[int]):
+            zone, permanent = key
+            if len(indexes) > 1:
+                group = [requests[index] for index in indexes]
+                outcome = self._update_zone_settings(zone, group) if permanent else None
+                if outcome is None:
+                    outcome = self._run_zone_batch(zone, permanent, group)
+                if outcome is not None:
+                    success, error = outcome
+                    for index in indexes:
+                        results[index] = {'index': index, 'success': success, 'error': error or None}
+                    return
+            
+            for index in indexes:
+                response = self.execute_command(requests[index])
+                results[index] = {'index': index, 'success': response.success, 'error': response.error}
+        
+        if len(groups) == 1:
+            run_group(*next(iter(groups.items())))
+        else:
+            # list() re-raises any worker exception
+            list(self._pool.map(lambda item: run_group(*item), groups.items()))
+        
+        failed = sum(1 for result in results if not result['success'])
+        data = {'results': results, 'applied': len(results) - failed, 'failed': failed}
+        
+        if reload:
+            reload_response = self._reload()
+            data['reloaded'] = reload_response.success
+            if not reload_response.success:
+                return CommandResponse(success=False, data=data, error=reload_response.error)
+        
+        if failed:
+            return CommandResponse(success=False, data=data, error=f"{failed} of {len(results)} operations failed")
+        return CommandResponse(success=True, data=data)
+    
+    def _sync(self) -> CommandResponse:
+        """
+        Wait for changes sent with wait=false.
+        
+        firewalld handles the calls of one D-Bus connection in order, so
+        once a synchronous call on the same connection returns, every
+        earlier call on it has been processed. If the connection was lost
+        in the meantime, firewalld may never have seen some of them.
+        """
+        with self._pending_lock:
+            pending, self._pending = self._pending, 0
+            lost, self._pending_lost = self._pending_lost, False
+        if lost:
+            return CommandResponse(success=False, error=f"firewalld D-Bus connection lost; {pending} unconfirmed change(s) may not have been applied")
+        if pending:
+            result = self._dbus(lambda: self._fw.getDefaultZone())
+            if result is None:
+                return CommandResponse(success=False, error="firewalld D-Bus connection lost; unconfirmed changes may not have been applied")
+            success, _, stderr = result
+            if not success:
+                return CommandResponse(success=False, error=stderr)
+        
+        return CommandResponse(success=True, data={'synced': pending})
+    
+    def _query_many(self, queries: Any) -> CommandResponse:
+        """
+        Run independent read-only queries concurrently.
+        
+        Dashboards ask for several queries at once; running them on a
+        thread pool makes the wall time that of the slowest one rather
+        than the sum. Each query's response is returned in request order.
+        """
+        if not isinstance(queries, list) or not queries:
+            return CommandResponse(success=False, error="Queries must be a non-empty list")
+        
+        requests = []
+        for index, query in enumerate(queries):
+            if not isinstance(query, dict) or query.get('action') not in _QUERY_ACTIONS:
+                action = query.get('action') if isinstance(query, dict) else None
+                return CommandResponse(success=False, error=f"Query {index}: unsupported query action '{action}'")
+            parameters = query.get('parameters', {})
+            if not isinstance(parameters, dict):
+                return CommandResponse(success=False, error=f"Query {index}: parameters must be a dictionary")
+            requests.append(CommandRequest(module=self.name, action=query['action'], parameters=parameters))
+        
+        if len(requests) == 1:
+            responses = [self.execute_command(requests[0])]
+        else:
+            responses = list(self._pool.map(self.execute_command, requests))
+        
+        results = [
+            {'action': request.action, 'success': response.success, 'data': response.data, 'error': response.error}
+            for request, response in zip(requests, responses)
+        ]
+        return CommandResponse(success=True, data={'results': results})
+    
+    def _settings_edits(self, requests: List[CommandRequest]) -> Optional[List[Tuple[str, str, Any, bool]]]:
+        """
+        Map batch operations to (action, settings key, value, add?) edits.
+        
+        Returns None if any operation has no settings field or fails
+        validation, so the group is applied one by one and each error
+        is reported against its own operation.
+        """
+        edits = []
+        for request in requests:
+            op = _SETTINGS_OPS.get(request.action)
+            if op is None or not self.validate_command(request)[0]:
+                return None
+            key, param, add = op
+            value = request.parameters.get(param) if param else None
+            if key in ('ports', 'source_ports') and _split_port(value) is None:
+                return None
+            edits.append((request.action, key, value, add))
+        return edits
+    
+    def _run_zone_batch(self, zone: str, permanent: bool, requests: List[CommandRequest]) -> Optional[Tuple[bool, str]]:
+        """
+        Apply a zone's batch operations with a single firewall-cmd run.
+        
+        firewall-cmd accepts any number of --add-*/--remove-* zone
+        options at once, so the interpreter start is paid once per group.
+        Only used when D-Bus is unavailable; returns None otherwise, or
+        when the operations cannot be combined.
+        """
+        if self._connect_dbus():
+            return None
+        edits = self._settings_edits(requests)
+        if edits is None:
+            return None
+        
+        cmd = ['firewall-cmd', f'--zone={zone}']
+        for action, key, value, add in edits:
+            flag = '--' + action.replace('_', '-')
+            cmd.append(flag if value is None else f'{flag}={value}')
+        if permanent:
+            cmd.append('--permanent')
+        
+        success, stdout, stderr = self._run_command(cmd)
+        return success, stderr
+    
+    def _update_zone_settings(self, zone: str, requests: List[CommandRequest]) -> Optional[Tuple[bool, str]]:
+        """
+        Apply permanent zone changes with one getSettings2/update2 round trip.
+        
+        firewalld writes the zone file once instead of once per change.
+        Returns (success, error) for the whole group, or None when the
+        operations must be applied one by one: D-Bus is unavailable, an
+        operation has no settings field, or one fails validation (so its
+        own error gets reported).
+        """
+        edits = self._settings_edits(requests)
+        if edits is None:
+            return None
+        
+        def update():
+            config_zone = self._config_zone(zone)
+            settings = config_zone.getSettings2()
+            changed = {}
+            for _, key, value, add in edits:
+                if key in ('ports', 'source_ports'):
+                    value = _split_port(value)
+                if value is None:
+                    changed[key] = dbus.Boolean(add)
+                    continue
+                if key not in changed:
+                    current = [tuple(str(v) for v in item) if isinstance(item, dbus.Struct) else str(item)
+                               for item in settings.get(key, [])]
+                    changed[key] = current
+                entries = changed[key]
+                if add and value not in entries:
+                    entries.append(value)
+                elif not add and value in entries:
+                    entries.remove(value)
+            
+            fields = {}
+            for key, value in changed.items():
+                if key in ('ports', 'source_ports'):
+                    value = dbus.Array([dbus.Struct(item, signature='ss') for item in value], signature='(ss)')
+                elif isinstance(value, list):
+                    value = dbus.Array(value, signature='s')
+                fields[key] = value
+            config_zone.update2(dbus.Dictionary(fields, signature='sv'))
+        
+        result = self._dbus(update)
+        if result is None:
+            return None
+        success, _, error = result
+        return success, error
+    
     def _complete_reload(self) -> CommandResponse:
         """Complete reload of firewalld - recreates all zones, interfaces, and rules."""
-        success, stdout, stderr = self._run_command(['firewall-cmd', '--complete-reload'])
+        result = self._dbus(lambda: self._fw.completeReload())
+        if result is not None:
+            success, _, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(['firewall-cmd', '--complete-reload'])
+        self._invalidate()
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1838,7 +2322,11 @@ class FirewalldModule(BaseModule):
     
     def _runtime_to_permanent(self) -> CommandResponse:
         """Save runtime configuration to permanent."""
-        success, stdout, stderr = self._run_command(['firewall-cmd', '--runtime-to-permanent'])
+        result = self._dbus(lambda: self._fw.runtimeToPermanent())
+        if result is not None:
+            success, _, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(['firewall-cmd', '--runtime-to-permanent'])
         if not success:
             return CommandResponse(success=False, error=stderr)
         
@@ -1854,38 +2342,39 @@ class FirewalldModule(BaseModule):
     
     def _service_status(self) -> CommandResponse:
         """Get detailed firewalld service status."""
-        # Get basic status
-        success, stdout, stderr = self._run_command(['systemctl', 'is-active', 'firewalld'])
-        is_active = stdout.strip() == 'active'
+        # Get basic and enabled status
+        result = self._systemd(self._unit_properties)
+        if result is not None and result[0]:
+            status = str(result[1]['ActiveState'])
+            enabled = str(result[1]['UnitFileState'])
+        else:
+            success, stdout, stderr = self._run_command(['systemctl', 'is-active', 'firewalld'])
+            status = stdout.strip()
+            success3, stdout3, stderr3 = self._run_command(['systemctl', 'is-enabled', 'firewalld'])
+            enabled = stdout3.strip()
         
         # Get detailed status
         success2, stdout2, stderr2 = self._run_command(['systemctl', 'status', 'firewalld'])
         
-        # Get enabled status
-        success3, stdout3, stderr3 = self._run_command(['systemctl', 'is-enabled', 'firewalld'])
-        is_enabled = stdout3.strip() == 'enabled'
-        
         return CommandResponse(
             success=True,
             data={
-                'active': is_active,
-                'enabled': is_enabled,
-                'status': stdout.strip(),
+                'active': status == 'active',
+                'enabled': enabled == 'enabled',
+                'status': status,
                 'detailed_status': stdout2 if success2 else stderr2
             }
         )
     
     def _start_service(self) -> CommandResponse:
         """Start firewalld service."""
-        success, stdout, stderr = self._run_command(['systemctl', 'start', 'firewalld'], timeout=30)
+        success, state, stderr = self._unit_job('StartUnit', 'start')
+        self._invalidate()
         if not success:
             return CommandResponse(success=False, error=f"Failed to start firewalld: {stderr}")
         
         # Verify it started
-        success2, stdout2, stderr2 = self._run_command(['systemctl', 'is-active', 'firewalld'])
-        is_active = stdout2.strip() == 'active'
-        
-        if not is_active:
+        if state != 'active':
             return CommandResponse(success=False, error="Service command executed but firewalld is not active")
         
         return CommandResponse(
@@ -1899,15 +2388,13 @@ class FirewalldModule(BaseModule):
     
     def _stop_service(self) -> CommandResponse:
         """Stop firewalld service."""
-        success, stdout, stderr = self._run_command(['systemctl', 'stop', 'firewalld'], timeout=30)
+        success, state, stderr = self._unit_job('StopUnit', 'stop')
+        self._invalidate()
         if not success:
             return CommandResponse(success=False, error=f"Failed to stop firewalld: {stderr}")
         
         # Verify it stopped
-        success2, stdout2, stderr2 = self._run_command(['systemctl', 'is-active', 'firewalld'])
-        is_active = stdout2.strip() == 'active'
-        
-        if is_active:
+        if state == 'active':
             return CommandResponse(success=False, error="Service command executed but firewalld is still active")
         
         return CommandResponse(
@@ -1921,15 +2408,13 @@ class FirewalldModule(BaseModule):
     
     def _restart_service(self) -> CommandResponse:
         """Restart firewalld service."""
-        success, stdout, stderr = self._run_command(['systemctl', 'restart', 'firewalld'], timeout=30)
+        success, state, stderr = self._unit_job('RestartUnit', 'restart')
+        self._invalidate()
         if not success:
             return CommandResponse(success=False, error=f"Failed to restart firewalld: {stderr}")
         
         # Verify it's active
-        success2, stdout2, stderr2 = self._run_command(['systemctl', 'is-active', 'firewalld'])
-        is_active = stdout2.strip() == 'active'
-        
-        if not is_active:
+        if state != 'active':
             return CommandResponse(success=False, error="Service command executed but firewalld is not active")
         
         return CommandResponse(
@@ -1943,10 +2428,15 @@ class FirewalldModule(BaseModule):
     
     def _query_panic(self) -> CommandResponse:
         """Check if panic mode is enabled."""
-        success, stdout, stderr = self._run_command(['firewall-cmd', '--query-panic'])
-        
-        # firewall-cmd returns 0 if panic mode is enabled, 1 if disabled
-        panic_enabled = success
+        result = self._dbus(lambda: bool(self._fw.queryPanicMode()))
+        if result is not None:
+            success, panic_enabled, stderr = result
+            if not success:
+                return CommandResponse(success=False, error=stderr)
+        else:
+            success, stdout, stderr = self._run_command(['firewall-cmd', '--query-panic'])
+            # firewall-cmd returns 0 if panic mode is enabled, 1 if disabled
+            panic_enabled = success
         
         return CommandResponse(
             success=True,
@@ -1958,14 +2448,20 @@ class FirewalldModule(BaseModule):
     
     def _panic_on(self) -> CommandResponse:
         """Enable panic mode - drops all incoming and outgoing packets."""
-        success, stdout, stderr = self._run_command(['firewall-cmd', '--panic-on'])
+        result = self._dbus(lambda: self._fw.enablePanicMode())
+        if result is not None:
+            success, _, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(['firewall-cmd', '--panic-on'])
+        self._invalidate('query_panic')
         if not success:
             return CommandResponse(success=False, error=f"Failed to enable panic mode: {stderr}")
         
-        # Verify panic mode is enabled
-        success2, stdout2, stderr2 = self._run_command(['firewall-cmd', '--query-panic'])
-        if not success2:
-            return CommandResponse(success=False, error="Panic mode command executed but verification failed")
+        if result is None:
+            # Verify panic mode is enabled
+            success2, stdout2, stderr2 = self._run_command(['firewall-cmd', '--query-panic'])
+            if not success2:
+                return CommandResponse(success=False, error="Panic mode command executed but verification failed")
         
         return CommandResponse(
             success=True,
@@ -1977,15 +2473,21 @@ class FirewalldModule(BaseModule):
     
     def _panic_off(self) -> CommandResponse:
         """Disable panic mode."""
-        success, stdout, stderr = self._run_command(['firewall-cmd', '--panic-off'])
+        result = self._dbus(lambda: self._fw.disablePanicMode())
+        if result is not None:
+            success, _, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(['firewall-cmd', '--panic-off'])
+        self._invalidate('query_panic')
         if not success:
             return CommandResponse(success=False, error=f"Failed to disable panic mode: {stderr}")
         
-        # Verify panic mode is disabled
-        success2, stdout2, stderr2 = self._run_command(['firewall-cmd', '--query-panic'])
-        # query-panic returns 1 (failure) when disabled, which is what we want
-        if success2:
-            return CommandResponse(success=False, error="Panic mode command executed but verification failed")
+        if result is None:
+            # Verify panic mode is disabled
+            success2, stdout2, stderr2 = self._run_command(['firewall-cmd', '--query-panic'])
+            # query-panic returns 1 (failure) when disabled, which is what we want
+            if success2:
+                return CommandResponse(success=False, error="Panic mode command executed but verification failed")
         
         return CommandResponse(
             success=True,
@@ -2027,6 +2529,7 @@ class FirewalldModule(BaseModule):
             )
         
         success, stdout, stderr = self._run_command(['firewall-cmd', f'--set-log-denied={value}'])
+        self._invalidate('get_log_denied')
         if not success:
             return CommandResponse(success=False, error=f"Failed to set log denied: {stderr}")
         
@@ -2040,11 +2543,15 @@ class FirewalldModule(BaseModule):
     
     def _list_services(self) -> CommandResponse:
         """List all available firewalld services."""
-        success, stdout, stderr = self._run_command(['firewall-cmd', '--get-services'])
+        result = self._dbus(lambda: [str(name) for name in self._fw.listServices()])
+        if result is not None:
+            success, services, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(['firewall-cmd', '--get-services'], binary=True)
+            services = _split_names(stdout)
         if not success:
             return CommandResponse(success=False, error=f"Failed to list services: {stderr}")
         
-        services = stdout.strip().split()
         return CommandResponse(
             success=True,
             data={
@@ -2055,9 +2562,6 @@ class FirewalldModule(BaseModule):
     
     def _get_service_info(self, service: str) -> CommandResponse:
         """Get detailed information about a specific service."""
-        if not service:
-            return CommandResponse(success=False, error="Service name is required")
-        
         # Get service info using --info-service
         success, stdout, stderr = self._run_command(['firewall-cmd', '--info-service', service, '--permanent'])
         if not success:
@@ -2089,12 +2593,10 @@ class FirewalldModule(BaseModule):
     
     def _new_service(self, service: str) -> CommandResponse:
         """Create a new custom service."""
-        if not service:
-            return CommandResponse(success=False, error="Service name is required")
-        
         success, stdout, stderr = self._run_command(['firewall-cmd', '--permanent', '--new-service', service])
         if not success:
             return CommandResponse(success=False, error=f"Failed to create service: {stderr}")
+        self._invalidate('list_services')
         
         return CommandResponse(
             success=True,
@@ -2106,12 +2608,10 @@ class FirewalldModule(BaseModule):
     
     def _delete_service(self, service: str) -> CommandResponse:
         """Delete a custom service."""
-        if not service:
-            return CommandResponse(success=False, error="Service name is required")
-        
         success, stdout, stderr = self._run_command(['firewall-cmd', '--permanent', '--delete-service', service])
         if not success:
             return CommandResponse(success=False, error=f"Failed to delete service: {stderr}")
+        self._invalidate('list_services')
         
         return CommandResponse(
             success=True,
@@ -2123,9 +2623,6 @@ class FirewalldModule(BaseModule):
     
     def _service_add_port(self, service: str, port: str, protocol: str) -> CommandResponse:
         """Add a port to a service definition."""
-        if not all([service, port, protocol]):
-            return CommandResponse(success=False, error="Service, port, and protocol are required")
-        
         if protocol not in ['tcp', 'udp']:
             return CommandResponse(success=False, error="Protocol must be tcp or udp")
         
@@ -2149,9 +2646,6 @@ class FirewalldModule(BaseModule):
     
     def _service_remove_port(self, service: str, port: str, protocol: str) -> CommandResponse:
         """Remove a port from a service definition."""
-        if not all([service, port, protocol]):
-            return CommandResponse(success=False, error="Service, port, and protocol are required")
-        
         if protocol not in ['tcp', 'udp']:
             return CommandResponse(success=False, error="Protocol must be tcp or udp")
         
@@ -2175,9 +2669,6 @@ class FirewalldModule(BaseModule):
     
     def _service_add_protocol(self, service: str, protocol: str) -> CommandResponse:
         """Add a protocol to a service definition."""
-        if not all([service, protocol]):
-            return CommandResponse(success=False, error="Service and protocol are required")
-        
         success, stdout, stderr = self._run_command([
             'firewall-cmd', '--permanent', '--service', service, '--add-protocol', protocol
         ])
@@ -2196,9 +2687,6 @@ class FirewalldModule(BaseModule):
     
     def _service_remove_protocol(self, service: str, protocol: str) -> CommandResponse:
         """Remove a protocol from a service definition."""
-        if not all([service, protocol]):
-            return CommandResponse(success=False, error="Service and protocol are required")
-        
         success, stdout, stderr = self._run_command([
             'firewall-cmd', '--permanent', '--service', service, '--remove-protocol', protocol
         ])
@@ -2219,11 +2707,11 @@ class FirewalldModule(BaseModule):
     
     def _list_ipsets(self) -> CommandResponse:
         """List all IPSets."""
-        success, stdout, stderr = self._run_command(['firewall-cmd', '--permanent', '--get-ipsets'])
+        success, stdout, stderr = self._run_command(['firewall-cmd', '--permanent', '--get-ipsets'], binary=True)
         if not success:
             return CommandResponse(success=False, error=f"Failed to list IPSets: {stderr}")
         
-        ipsets = stdout.strip().split() if stdout.strip() else []
+        ipsets = _split_names(stdout)
         return CommandResponse(
             success=True,
             data={
@@ -2234,9 +2722,6 @@ class FirewalldModule(BaseModule):
     
     def _get_ipset_info(self, ipset: str) -> CommandResponse:
         """Get detailed information about an IPSet."""
-        if not ipset:
-            return CommandResponse(success=False, error="IPSet name is required")
-        
         # Get IPSet info
         success, stdout, stderr = self._run_command(['firewall-cmd', '--permanent', '--info-ipset', ipset])
         if not success:
@@ -2258,9 +2743,6 @@ class FirewalldModule(BaseModule):
     
     def _new_ipset(self, ipset: str, ipset_type: str) -> CommandResponse:
         """Create a new IPSet."""
-        if not ipset or not ipset_type:
-            return CommandResponse(success=False, error="IPSet name and type are required")
-        
         # Valid IPSet types
         valid_types = ['hash:ip', 'hash:net', 'hash:mac', 'hash:ip,port', 'hash:net,port']
         if ipset_type not in valid_types:
@@ -2272,6 +2754,7 @@ class FirewalldModule(BaseModule):
         success, stdout, stderr = self._run_command([
             'firewall-cmd', '--permanent', '--new-ipset', ipset, '--type', ipset_type
         ])
+        self._invalidate('list_ipsets')
         
         if not success:
             return CommandResponse(success=False, error=f"Failed to create IPSet: {stderr}")
@@ -2287,10 +2770,8 @@ class FirewalldModule(BaseModule):
     
     def _delete_ipset(self, ipset: str) -> CommandResponse:
         """Delete an IPSet."""
-        if not ipset:
-            return CommandResponse(success=False, error="IPSet name is required")
-        
         success, stdout, stderr = self._run_command(['firewall-cmd', '--permanent', '--delete-ipset', ipset])
+        self._invalidate('list_ipsets')
         if not success:
             return CommandResponse(success=False, error=f"Failed to delete IPSet: {stderr}")
         
@@ -2304,9 +2785,6 @@ class FirewalldModule(BaseModule):
     
     def _ipset_add_entry(self, ipset: str, entry: str) -> CommandResponse:
         """Add entry to an IPSet."""
-        if not ipset or not entry:
-            return CommandResponse(success=False, error="IPSet name and entry are required")
-        
         success, stdout, stderr = self._run_command([
             'firewall-cmd', '--permanent', '--ipset', ipset, '--add-entry', entry
         ])
@@ -2325,9 +2803,6 @@ class FirewalldModule(BaseModule):
     
     def _ipset_remove_entry(self, ipset: str, entry: str) -> CommandResponse:
         """Remove entry from an IPSet."""
-        if not ipset or not entry:
-            return CommandResponse(success=False, error="IPSet name and entry are required")
-        
         success, stdout, stderr = self._run_command([
             'firewall-cmd', '--permanent', '--ipset', ipset, '--remove-entry', entry
         ])
@@ -2346,9 +2821,6 @@ class FirewalldModule(BaseModule):
     
     def _zone_add_source_ipset(self, zone: str, ipset: str, permanent: bool) -> CommandResponse:
         """Add IPSet as source to zone."""
-        if not zone or not ipset:
-            return CommandResponse(success=False, error="Zone and IPSet name are required")
-        
         cmd = ['firewall-cmd']
         if permanent:
             cmd.append('--permanent')
@@ -2370,9 +2842,6 @@ class FirewalldModule(BaseModule):
     
     def _zone_remove_source_ipset(self, zone: str, ipset: str, permanent: bool) -> CommandResponse:
         """Remove IPSet source from zone."""
-        if not zone or not ipset:
-            return CommandResponse(success=False, error="Zone and IPSet name are required")
-        
         cmd = ['firewall-cmd']
         if permanent:
             cmd.append('--permanent')
@@ -2396,12 +2865,12 @@ class FirewalldModule(BaseModule):
         """List all available helper modules."""
         cmd = ['firewall-cmd', '--get-helpers']
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stdout, stderr = self._run_command(cmd, binary=True)
         if not success:
             return CommandResponse(success=False, error=f"Failed to list helpers: {stderr}")
         
         # Parse helpers - typically space-separated list
-        helpers = [h.strip() for h in stdout.strip().split() if h.strip()]
+        helpers = _split_names(stdout)
         
         return CommandResponse(
             success=True,
@@ -2413,17 +2882,14 @@ class FirewalldModule(BaseModule):
     
     def _zone_list_helpers(self, zone: str) -> CommandResponse:
         """List helper modules enabled in a specific zone."""
-        if not zone:
-            return CommandResponse(success=False, error="Zone name is required")
-        
         cmd = ['firewall-cmd', '--zone', zone, '--list-helpers']
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stdout, stderr = self._run_command(cmd, binary=True)
         if not success:
             return CommandResponse(success=False, error=f"Failed to list helpers for zone: {stderr}")
         
         # Parse helpers - typically space-separated list
-        helpers = [h.strip() for h in stdout.strip().split() if h.strip()]
+        helpers = _split_names(stdout)
         
         return CommandResponse(
             success=True,
@@ -2436,9 +2902,6 @@ class FirewalldModule(BaseModule):
     
     def _zone_add_helper(self, zone: str, helper: str, permanent: bool) -> CommandResponse:
         """Add helper module to zone."""
-        if not zone or not helper:
-            return CommandResponse(success=False, error="Zone and helper name are required")
-        
         cmd = ['firewall-cmd']
         if permanent:
             cmd.append('--permanent')
@@ -2460,9 +2923,6 @@ class FirewalldModule(BaseModule):
     
     def _zone_remove_helper(self, zone: str, helper: str, permanent: bool) -> CommandResponse:
         """Remove helper module from zone."""
-        if not zone or not helper:
-            return CommandResponse(success=False, error="Zone and helper name are required")
-        
         cmd = ['firewall-cmd']
         if permanent:
             cmd.append('--permanent')
@@ -2486,12 +2946,12 @@ class FirewalldModule(BaseModule):
         """List all firewall policies."""
         cmd = ['firewall-cmd', '--get-policies']
         
-        success, stdout, stderr = self._run_command(cmd)
+        success, stdout, stderr = self._run_command(cmd, binary=True)
         if not success:
             return CommandResponse(success=False, error=f"Failed to list policies: {stderr}")
         
         # Parse policies - typically space-separated list
-        policies = [p.strip() for p in stdout.strip().split() if p.strip()]
+        policies = _split_names(stdout)
         
         return CommandResponse(
             success=True,
@@ -2503,9 +2963,6 @@ class FirewalldModule(BaseModule):
     
     def _policy_add(self, policy: str, permanent: bool) -> CommandResponse:
         """Add a new firewall policy."""
-        if not policy:
-            return CommandResponse(success=False, error="Policy name is required")
-        
         cmd = ['firewall-cmd']
         if permanent:
             cmd.append('--permanent')
@@ -2526,9 +2983,6 @@ class FirewalldModule(BaseModule):
     
     def _policy_delete(self, policy: str, permanent: bool) -> CommandResponse:
         """Delete a firewall policy."""
-        if not policy:
-            return CommandResponse(success=False, error="Policy name is required")
-        
         cmd = ['firewall-cmd']
         if permanent:
             cmd.append('--permanent')
@@ -2549,9 +3003,6 @@ class FirewalldModule(BaseModule):
     
     def _policy_get_info(self, policy: str) -> CommandResponse:
         """Get detailed information about a policy."""
-        if not policy:
-            return CommandResponse(success=False, error="Policy name is required")
-        
         cmd = ['firewall-cmd', '--info-policy', policy]
         
         success, stdout, stderr = self._run_command(cmd)
@@ -2579,9 +3030,6 @@ class FirewalldModule(BaseModule):
     
     def _policy_set_ingress_zone(self, policy: str, zone: str, permanent: bool) -> CommandResponse:
         """Set ingress zone for policy."""
-        if not policy or not zone:
-            return CommandResponse(success=False, error="Policy name and zone are required")
-        
         cmd = ['firewall-cmd']
         if permanent:
             cmd.append('--permanent')
@@ -2603,9 +3051,6 @@ class FirewalldModule(BaseModule):
     
     def _policy_set_egress_zone(self, policy: str, zone: str, permanent: bool) -> CommandResponse:
         """Set egress zone for policy."""
-        if not policy or not zone:
-            return CommandResponse(success=False, error="Policy name and zone are required")
-        
         cmd = ['firewall-cmd']
         if permanent:
             cmd.append('--permanent')
@@ -2627,9 +3072,6 @@ class FirewalldModule(BaseModule):
     
     def _policy_set_target(self, policy: str, target: str, permanent: bool) -> CommandResponse:
         """Set target action for policy."""
-        if not policy or not target:
-            return CommandResponse(success=False, error="Policy name and target are required")
-        
         # Validate target
         valid_targets = ['ACCEPT', 'REJECT', 'DROP', 'CONTINUE']
         if target not in valid_targets:
@@ -2658,9 +3100,6 @@ class FirewalldModule(BaseModule):
     
     def _direct_get_all_chains(self, ipv: str, table: str) -> CommandResponse:
         """Get all direct chains for a specific table."""
-        if not ipv or not table:
-            return CommandResponse(success=False, error="IP version and table are required")
-        
         # Validate ipv
         if ipv not in ['ipv4', 'ipv6']:
             return CommandResponse(success=False, error="IP version must be 'ipv4' or 'ipv6'")
@@ -2694,9 +3133,6 @@ class FirewalldModule(BaseModule):
     
     def _direct_add_chain(self, ipv: str, table: str, chain: str) -> CommandResponse:
         """Add a new direct chain."""
-        if not ipv or not table or not chain:
-            return CommandResponse(success=False, error="IP version, table, and chain name are required")
-        
         # Validate ipv
         if ipv not in ['ipv4', 'ipv6']:
             return CommandResponse(success=False, error="IP version must be 'ipv4' or 'ipv6'")
@@ -2723,9 +3159,6 @@ class FirewalldModule(BaseModule):
     
     def _direct_remove_chain(self, ipv: str, table: str, chain: str) -> CommandResponse:
         """Remove a direct chain."""
-        if not ipv or not table or not chain:
-            return CommandResponse(success=False, error="IP version, table, and chain name are required")
-        
         # Validate ipv
         if ipv not in ['ipv4', 'ipv6']:
             return CommandResponse(success=False, error="IP version must be 'ipv4' or 'ipv6'")
@@ -2778,9 +3211,6 @@ class FirewalldModule(BaseModule):
     
     def _direct_add_rule(self, ipv: str, table: str, chain: str, priority: int, args: list) -> CommandResponse:
         """Add a direct rule."""
-        if not ipv or not table or not chain or priority is None or not args:
-            return CommandResponse(success=False, error="All parameters are required: ipv, table, chain, priority, args")
-        
         # Validate ipv
         if ipv not in ['ipv4', 'ipv6']:
             return CommandResponse(success=False, error="IP version must be 'ipv4' or 'ipv6'")
@@ -2815,9 +3245,6 @@ class FirewalldModule(BaseModule):
     
     def _direct_remove_rule(self, ipv: str, table: str, chain: str, priority: int, args: list) -> CommandResponse:
         """Remove a direct rule."""
-        if not ipv or not table or not chain or priority is None or not args:
-            return CommandResponse(success=False, error="All parameters are required: ipv, table, chain, priority, args")
-        
         # Validate ipv
         if ipv not in ['ipv4', 'ipv6']:
             return CommandResponse(success=False, error="IP version must be 'ipv4' or 'ipv6'")
@@ -2848,9 +3275,6 @@ class FirewalldModule(BaseModule):
     
     def _direct_get_passthrough(self, ipv: str) -> CommandResponse:
         """Get all passthrough rules."""
-        if not ipv:
-            return CommandResponse(success=False, error="IP version is required")
-        
         # Validate ipv
         if ipv not in ['ipv4', 'ipv6']:
             return CommandResponse(success=False, error="IP version must be 'ipv4' or 'ipv6'")
@@ -2874,9 +3298,6 @@ class FirewalldModule(BaseModule):
     
     def _direct_add_passthrough(self, ipv: str, args: list) -> CommandResponse:
         """Add a passthrough rule."""
-        if not ipv or not args:
-            return CommandResponse(success=False, error="IP version and args are required")
-        
         # Validate ipv
         if ipv not in ['ipv4', 'ipv6']:
             return CommandResponse(success=False, error="IP version must be 'ipv4' or 'ipv6'")
@@ -2901,11 +3322,15 @@ class FirewalldModule(BaseModule):
     
     def _lockdown_get_status(self) -> CommandResponse:
         """Get lockdown mode status."""
-        cmd = ['firewall-cmd', '--query-lockdown']
-        success, stdout, stderr = self._run_command(cmd)
-        
-        # firewall-cmd --query-lockdown returns exit code 0 if enabled, 1 if disabled
-        is_enabled = success
+        result = self._dbus(lambda: bool(self._fw_policies.queryLockdown()))
+        if result is not None:
+            success, is_enabled, stderr = result
+            if not success:
+                return CommandResponse(success=False, error=stderr)
+        else:
+            success, stdout, stderr = self._run_command(['firewall-cmd', '--query-lockdown'])
+            # firewall-cmd --query-lockdown returns exit code 0 if enabled, 1 if disabled
+            is_enabled = success
         
         return CommandResponse(
             success=True,
@@ -2941,15 +3366,17 @@ class FirewalldModule(BaseModule):
     
     def _lockdown_list_commands(self) -> CommandResponse:
         """List whitelisted commands."""
-        cmd = ['firewall-cmd', '--permanent', '--list-lockdown-whitelist-commands']
-        success, stdout, stderr = self._run_command(cmd)
+        result = self._dbus(lambda: [str(item) for item in self._fw_config_policies.getLockdownWhitelistCommands()])
+        if result is not None:
+            success, commands, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(['firewall-cmd', '--permanent', '--list-lockdown-whitelist-commands'])
+            commands = []
+            if success and stdout.strip():
+                commands = stdout.strip().split('\n')
         if not success:
             return CommandResponse(success=False, error=f"Failed to list commands: {stderr}")
         
-        commands = []
-        if stdout.strip():
-            commands = stdout.strip().split('\n')
-        
         return CommandResponse(
             success=True,
             data={'commands': commands}
@@ -2957,11 +3384,13 @@ class FirewalldModule(BaseModule):
     
     def _lockdown_add_command(self, command: str) -> CommandResponse:
         """Add command to whitelist."""
-        if not command:
-            return CommandResponse(success=False, error="Command is required")
-        
-        cmd = ['firewall-cmd', '--permanent', '--add-lockdown-whitelist-command', command]
-        success, stdout, stderr = self._run_command(cmd)
+        result = self._dbus(lambda: self._fw_config_policies.addLockdownWhitelistCommand(command))
+        if result is not None:
+            success, _, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(
+                ['firewall-cmd', '--permanent', '--add-lockdown-whitelist-command', command]
+            )
         if not success:
             return CommandResponse(success=False, error=f"Failed to add command: {stderr}")
         
@@ -2975,11 +3404,13 @@ class FirewalldModule(BaseModule):
     
     def _lockdown_remove_command(self, command: str) -> CommandResponse:
         """Remove command from whitelist."""
-        if not command:
-            return CommandResponse(success=False, error="Command is required")
-        
-        cmd = ['firewall-cmd', '--permanent', '--remove-lockdown-whitelist-command', command]
-        success, stdout, stderr = self._run_command(cmd)
+        result = self._dbus(lambda: self._fw_config_policies.removeLockdownWhitelistCommand(command))
+        if result is not None:
+            success, _, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(
+                ['firewall-cmd', '--permanent', '--remove-lockdown-whitelist-command', command]
+            )
         if not success:
             return CommandResponse(success=False, error=f"Failed to remove command: {stderr}")
         
@@ -2993,15 +3424,17 @@ class FirewalldModule(BaseModule):
     
     def _lockdown_list_contexts(self) -> CommandResponse:
         """List whitelisted SELinux contexts."""
-        cmd = ['firewall-cmd', '--permanent', '--list-lockdown-whitelist-contexts']
-        success, stdout, stderr = self._run_command(cmd)
+        result = self._dbus(lambda: [str(item) for item in self._fw_config_policies.getLockdownWhitelistContexts()])
+        if result is not None:
+            success, contexts, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(['firewall-cmd', '--permanent', '--list-lockdown-whitelist-contexts'])
+            contexts = []
+            if success and stdout.strip():
+                contexts = stdout.strip().split('\n')
         if not success:
             return CommandResponse(success=False, error=f"Failed to list contexts: {stderr}")
         
-        contexts = []
-        if stdout.strip():
-            contexts = stdout.strip().split('\n')
-        
         return CommandResponse(
             success=True,
             data={'contexts': contexts}
@@ -3009,11 +3442,13 @@ class FirewalldModule(BaseModule):
     
     def _lockdown_add_context(self, context: str) -> CommandResponse:
         """Add SELinux context to whitelist."""
-        if not context:
-            return CommandResponse(success=False, error="Context is required")
-        
-        cmd = ['firewall-cmd', '--permanent', '--add-lockdown-whitelist-context', context]
-        success, stdout, stderr = self._run_command(cmd)
+        result = self._dbus(lambda: self._fw_config_policies.addLockdownWhitelistContext(context))
+        if result is not None:
+            success, _, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(
+                ['firewall-cmd', '--permanent', '--add-lockdown-whitelist-context', context]
+            )
         if not success:
             return CommandResponse(success=False, error=f"Failed to add context: {stderr}")
         
@@ -3027,11 +3462,13 @@ class FirewalldModule(BaseModule):
     
     def _lockdown_remove_context(self, context: str) -> CommandResponse:
         """Remove SELinux context from whitelist."""
-        if not context:
-            return CommandResponse(success=False, error="Context is required")
-        
-        cmd = ['firewall-cmd', '--permanent', '--remove-lockdown-whitelist-context', context]
-        success, stdout, stderr = self._run_command(cmd)
+        result = self._dbus(lambda: self._fw_config_policies.removeLockdownWhitelistContext(context))
+        if result is not None:
+            success, _, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(
+                ['firewall-cmd', '--permanent', '--remove-lockdown-whitelist-context', context]
+            )
         if not success:
             return CommandResponse(success=False, error=f"Failed to remove context: {stderr}")
         
@@ -3045,15 +3482,17 @@ class FirewalldModule(BaseModule):
     
     def _lockdown_list_users(self) -> CommandResponse:
         """List whitelisted users."""
-        cmd = ['firewall-cmd', '--permanent', '--list-lockdown-whitelist-users']
-        success, stdout, stderr = self._run_command(cmd)
+        result = self._dbus(lambda: [str(item) for item in self._fw_config_policies.getLockdownWhitelistUsers()])
+        if result is not None:
+            success, users, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(['firewall-cmd', '--permanent', '--list-lockdown-whitelist-users'])
+            users = []
+            if success and stdout.strip():
+                users = stdout.strip().split('\n')
         if not success:
             return CommandResponse(success=False, error=f"Failed to list users: {stderr}")
         
-        users = []
-        if stdout.strip():
-            users = stdout.strip().split('\n')
-        
         return CommandResponse(
             success=True,
             data={'users': users}
@@ -3061,11 +3500,13 @@ class FirewalldModule(BaseModule):
     
     def _lockdown_add_user(self, user: str) -> CommandResponse:
         """Add user to whitelist."""
-        if not user:
-            return CommandResponse(success=False, error="User is required")
-        
-        cmd = ['firewall-cmd', '--permanent', '--add-lockdown-whitelist-user', user]
-        success, stdout, stderr = self._run_command(cmd)
+        result = self._dbus(lambda: self._fw_config_policies.addLockdownWhitelistUser(user))
+        if result is not None:
+            success, _, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(
+                ['firewall-cmd', '--permanent', '--add-lockdown-whitelist-user', user]
+            )
         if not success:
             return CommandResponse(success=False, error=f"Failed to add user: {stderr}")
         
@@ -3079,11 +3520,13 @@ class FirewalldModule(BaseModule):
     
     def _lockdown_remove_user(self, user: str) -> CommandResponse:
         """Remove user from whitelist."""
-        if not user:
-            return CommandResponse(success=False, error="User is required")
-        
-        cmd = ['firewall-cmd', '--permanent', '--remove-lockdown-whitelist-user', user]
-        success, stdout, stderr = self._run_command(cmd)
+        result = self._dbus(lambda: self._fw_config_policies.removeLockdownWhitelistUser(user))
+        if result is not None:
+            success, _, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(
+                ['firewall-cmd', '--permanent', '--remove-lockdown-whitelist-user', user]
+            )
         if not success:
             return CommandResponse(success=False, error=f"Failed to remove user: {stderr}")
         
@@ -3097,15 +3540,17 @@ class FirewalldModule(BaseModule):
     
     def _lockdown_list_uids(self) -> CommandResponse:
         """List whitelisted UIDs."""
-        cmd = ['firewall-cmd', '--permanent', '--list-lockdown-whitelist-uids']
-        success, stdout, stderr = self._run_command(cmd)
+        result = self._dbus(lambda: [int(item) for item in self._fw_config_policies.getLockdownWhitelistUids()])
+        if result is not None:
+            success, uids, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(['firewall-cmd', '--permanent', '--list-lockdown-whitelist-uids'])
+            uids = []
+            if success and stdout.strip():
+                uids = [int(uid) for uid in stdout.strip().split('\n')]
         if not success:
             return CommandResponse(success=False, error=f"Failed to list UIDs: {stderr}")
         
-        uids = []
-        if stdout.strip():
-            uids = [int(uid) for uid in stdout.strip().split('\n')]
-        
         return CommandResponse(
             success=True,
             data={'uids': uids}
@@ -3113,11 +3558,13 @@ class FirewalldModule(BaseModule):
     
     def _lockdown_add_uid(self, uid: int) -> CommandResponse:
         """Add UID to whitelist."""
-        if uid is None:
-            return CommandResponse(success=False, error="UID is required")
-        
-        cmd = ['firewall-cmd', '--permanent', '--add-lockdown-whitelist-uid', str(uid)]
-        success, stdout, stderr = self._run_command(cmd)
+        result = self._dbus(lambda: self._fw_config_policies.addLockdownWhitelistUid(int(uid)))
+        if result is not None:
+            success, _, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(
+                ['firewall-cmd', '--permanent', '--add-lockdown-whitelist-uid', str(uid)]
+            )
         if not success:
             return CommandResponse(success=False, error=f"Failed to add UID: {stderr}")
         
@@ -3131,11 +3578,13 @@ class FirewalldModule(BaseModule):
     
     def _lockdown_remove_uid(self, uid: int) -> CommandResponse:
         """Remove UID from whitelist."""
-        if uid is None:
-            return CommandResponse(success=False, error="UID is required")
-        
-        cmd = ['firewall-cmd', '--permanent', '--remove-lockdown-whitelist-uid', str(uid)]
-        success, stdout, stderr = self._run_command(cmd)
+        result = self._dbus(lambda: self._fw_config_policies.removeLockdownWhitelistUid(int(uid)))
+        if result is not None:
+            success, _, stderr = result
+        else:
+            success, stdout, stderr = self._run_command(
+                ['firewall-cmd', '--permanent', '--remove-lockdown-whitelist-uid', str(uid)]
+            )
         if not success:
             return CommandResponse(success=False, error=f"Failed to remove UID: {stderr}")
         
@@ -3148,3 +3597,4 @@ class FirewalldModule(BaseModule):
         )
 
 
+MODULE_CLASS = FirewalldModule
@@ -253,3 +253,6 @@ class SystemInfoModule(BaseModule):
             success=True,
             data={'modules': modules}
         )
+
+
+MODULE_CLASS = SystemInfoModule
@@ -3,13 +3,66 @@
 Protocol definitions for communication between userspace and root components.
 
 This defines the wire protocol and message formats for the Unix socket communication.
-All communication is JSON-based with strict validation.
+All communication is JSON-based with strict validation. Each message is sent
+as a 4-byte big-endian length followed by that many bytes of UTF-8 JSON.
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
 import json
+import threading
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+
+# Size of the length prefix in front of every message
+HEADER_SIZE = 4
+
+# Largest message body either side will accept
+MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+
+# simdjson parsers keep their buffers between documents but must not be
+# shared between threads
+_parsers = threading.local()
+
+
+def _loads(json_data: Union[bytes, bytearray, str]) -> Any:
+    """Parse JSON with the fastest available parser."""
+    if simdjson is not None:
+        parser = getattr(_parsers, 'parser', None)
+        if parser is None:
+            parser = _parsers.parser = simdjson.Parser()
+        if not isinstance(json_data, (bytes, str)):
+            json_data = bytes(json_data)
+        try:
+            return parser.parse(json_data, recursive=True)
+        except ValueError as e:
+            doc = json_data if isinstance(json_data, str) else ''
+            raise json.JSONDecodeError(str(e), doc, 0) from e
+    if orjson is not None:
+        return orjson.loads(json_data)
+    return json.loads(json_data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 encoded JSON with the fastest available encoder."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def frame(payload: bytes) -> bytes:
+    """Prefix an encoded message with its length for sending."""
+    return len(payload).to_bytes(HEADER_SIZE, 'big') + payload
 
 
 class MessageType(str, Enum):
@@ -35,14 +88,36 @@ class Message:
     request_id: str
     data: Dict[str, Any]
     
-    def to_json(self) -> str:
-        """Serialize message to JSON."""
-        return json.dumps(asdict(self))
+    def to_json(self) -> bytes:
+        """Serialize message to UTF-8 encoded JSON."""
+        return _dumps({'type': self.type, 'request_id': self.request_id, 'data': self.data})
+    
+    @staticmethod
+    def encode(msg_type: str, request_id: str, encoded_data: bytes) -> bytes:
+        """
+        Serialize a message whose data is already JSON-encoded.
+        
+        Lets fixed responses be encoded once and reused for every request.
+        """
+        return b''.join((
+            b'{"type":', _dumps(msg_type),
+            b',"request_id":', _dumps(request_id),
+            b',"data":', encoded_data, b'}'
+        ))
+    
+    @staticmethod
+    def encode_data(data: Dict[str, Any]) -> bytes:
+        """Serialize message data for use with encode()."""
+        return _dumps(data)
     
     @classmethod
-    def from_json(cls, json_str: str) -> 'Message':
-        """Deserialize message from JSON."""
-        data = json.loads(json_str)
+    def from_json(cls, json_data: Union[bytes, bytearray, str]) -> 'Message':
+        """
+        Deserialize message from JSON.
+        
+        Raises json.JSONDecodeError on malformed input.
+        """
+        data = _loads(json_data)
         return cls(
             type=data['type'],
             request_id=data['request_id'],
@@ -122,6 +197,8 @@ class CommandResponse:
 @dataclass
 class ModuleCapability:
     """Describes a capability/action that a module provides."""
+    __slots__ = ('name', 'description', 'parameters')
+    
     name: str
     description: str
     parameters: List[Dict[str, str]]  # List of {name, type, description, required}
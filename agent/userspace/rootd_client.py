@@ -18,7 +18,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from rootd.protocol import (
     Message, MessageType, CommandRequest, CommandResponse,
-    ModuleInfo
+    ModuleInfo, HEADER_SIZE, MAX_MESSAGE_SIZE, frame
 )
 
 
@@ -28,6 +28,19 @@ class RootDaemonClient:
     def __init__(self, socket_path: str = "/var/run/tuxsec/rootd.sock"):
         self.socket_path = socket_path
     
+    @staticmethod
+    def _recv_exactly(client_socket: socket.socket, size: int) -> bytearray:
+        """Receive exactly size bytes into a preallocated buffer."""
+        buf = bytearray(size)
+        view = memoryview(buf)
+        received = 0
+        while received < size:
+            count = client_socket.recv_into(view[received:])
+            if not count:
+                raise Exception("No response from daemon")
+            received += count
+        return buf
+    
     def _send_request(self, message: Message) -> Message:
         """Send a request to the daemon and get response."""
         try:
@@ -36,27 +49,20 @@ class RootDaemonClient:
             client_socket.connect(self.socket_path)
             
             # Send message
-            client_socket.sendall((message.to_json() + '\n').encode('utf-8'))
+            client_socket.sendall(frame(message.to_json()))
             
             # Receive response
-            data = b""
-            while True:
-                chunk = client_socket.recv(4096)
-                if not chunk:
-                    break
-                data += chunk
-                
-                if b'\n' in data:
-                    break
-            
-            client_socket.close()
-            
-            if not data:
-                raise Exception("No response from daemon")
+            try:
+                header = self._recv_exactly(client_socket, HEADER_SIZE)
+                length = int.from_bytes(header, 'big')
+                if length > MAX_MESSAGE_SIZE:
+                    raise Exception(f"Response too large: {length} bytes")
+                data = self._recv_exactly(client_socket, length)
+            finally:
+                client_socket.close()
             
             # Parse response
-            response_str = data.decode('utf-8').strip()
-            response = Message.from_json(response_str)
+            response = Message.from_json(data)
             
             return response
             
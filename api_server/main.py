@@ -285,6 +285,30 @@ async def get_agent_commands(agent_id: str) -> Dict[str, Any]:
         )
 
 
+@app.post("/api/agents/{agent_id}/poll")
+async def agent_poll(
+    agent_id: str,
+    agent_info: AgentInfo
+) -> Dict[str, Any]:
+    """Record a heartbeat and return pending commands in one round trip."""
+    try:
+        await agent_manager.update_agent_heartbeat(agent_id, agent_info)
+        commands = await command_dispatcher.get_pending_commands(agent_id)
+        
+        return {
+            "success": True,
+            "commands": [cmd.dict() for cmd in commands]
+        }
+    
+    except Exception as e:
+        logger.error("Error processing agent poll", 
+                    agent_id=agent_id, error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
 @app.delete("/api/agents/{agent_id}")
 async def delete_agent(
     agent_id: str,
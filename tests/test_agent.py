@@ -0,0 +1,203 @@
+"""Tests for the pull-mode agent's server polling and command handling."""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+# agent.py imports its siblings as top-level modules, as when run as a script
+sys.path.append(str(Path(__file__).resolve().parent.parent / "agent"))
+
+from agent.agent import FirewalldAgent
+from shared.models import AgentCommand
+
+AGENT_ID = "test-agent"
+
+COMMAND = {
+    "command_id": "c1",
+    "agent_id": AGENT_ID,
+    "command_type": "get_status",
+    "parameters": {},
+}
+
+
+@pytest.fixture
+def make_agent(tmp_path):
+    """Build an agent whose HTTP requests are answered by handler(request)."""
+    config = tmp_path / "config.yaml"
+    config.write_text(
+        "server:\n"
+        "  url: http://server\n"
+        "  poll_interval: 30\n"
+        "agent:\n"
+        f"  agent_id: {AGENT_ID}\n"
+        "logging:\n"
+        f"  log_file: {tmp_path / 'agent.log'}\n"
+    )
+    
+    def make(handler):
+        agent = FirewalldAgent(str(config))
+        agent._http = httpx.AsyncClient(base_url="http://server", transport=httpx.MockTransport(handler))
+        return agent
+    
+    return make
+
+
+def test_poll_sends_heartbeat_and_returns_commands(make_agent):
+    paths = []
+    
+    def handler(request):
+        paths.append(request.url.path)
+        assert json.loads(request.content)["agent_id"] == AGENT_ID
+        return httpx.Response(200, json={"commands": [COMMAND]})
+    
+    commands = asyncio.run(make_agent(handler).poll())
+    
+    assert paths == [f"/api/agents/{AGENT_ID}/poll"]
+    assert [command.command_id for command in commands] == ["c1"]
+
+
+@pytest.mark.parametrize("status", [404, 405])
+def test_poll_falls_back_to_heartbeat_and_checkin(make_agent, status):
+    paths = []
+    
+    def handler(request):
+        paths.append(request.url.path)
+        if request.url.path.endswith("/poll"):
+            return httpx.Response(status)
+        if request.url.path.endswith("/checkin"):
+            return httpx.Response(200, json={"commands": [COMMAND]})
+        return httpx.Response(200, json={})
+    
+    agent = make_agent(handler)
+    
+    async def poll_twice():
+        return await agent.poll(), await agent.poll()
+    
+    first, second = asyncio.run(poll_twice())
+    
+    assert [command.command_id for command in first] == ["c1"]
+    assert [command.command_id for command in second] == ["c1"]
+    # /poll is only tried once
+    assert paths == [
+        f"/api/agents/{AGENT_ID}/poll",
+        f"/api/agents/{AGENT_ID}/heartbeat",
+        f"/api/agents/{AGENT_ID}/checkin",
+        f"/api/agents/{AGENT_ID}/heartbeat",
+        f"/api/agents/{AGENT_ID}/checkin",
+    ]
+
+
+def test_poll_raises_on_server_error(make_agent):
+    agent = make_agent(lambda request: httpx.Response(503))
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(agent.poll())
+
+
+def test_poll_ignores_rejected_request(make_agent):
+    agent = make_agent(lambda request: httpx.Response(403))
+    assert asyncio.run(agent.poll()) == []
+
+
+def _run_pull_loop(agent, monkeypatch, rounds):
+    """Run pull_mode_loop for a number of waits; returns the requested wait times."""
+    waits = []
+    
+    async def register_with_server():
+        return True
+    
+    async def wait_for_stop(timeout):
+        waits.append(timeout)
+        if len(waits) == rounds:
+            agent.stop()
+    
+    monkeypatch.setattr(agent, "register_with_server", register_with_server)
+    monkeypatch.setattr(agent, "_wait_for_stop", wait_for_stop)
+    # No jitter: each delay is exactly the current backoff
+    monkeypatch.setattr("agent.agent.random.random", lambda: 0.5)
+    asyncio.run(agent.pull_mode_loop())
+    return waits
+
+
+def test_pull_loop_backs_off_while_server_fails(make_agent, monkeypatch):
+    agent = make_agent(lambda request: httpx.Response(503))
+    assert _run_pull_loop(agent, monkeypatch, 7) == [1, 2, 4, 8, 16, 30, 30]
+
+
+def test_pull_loop_backs_off_on_transport_errors(make_agent, monkeypatch):
+    def handler(request):
+        raise httpx.ConnectError("connection refused", request=request)
+    
+    agent = make_agent(handler)
+    assert _run_pull_loop(agent, monkeypatch, 3) == [1, 2, 4]
+
+
+def test_pull_loop_resets_backoff_after_success(make_agent, monkeypatch):
+    responses = iter([503, 503, 200, 503])
+    
+    def handler(request):
+        status = next(responses)
+        return httpx.Response(status, json={"commands": []})
+    
+    agent = make_agent(handler)
+    assert _run_pull_loop(agent, monkeypatch, 4) == [1, 2, 30, 1]
+
+
+class FakeFirewalld:
+    """Counts reloads; each one takes a moment, like firewall-cmd --reload."""
+    
+    def __init__(self):
+        self.reloads = 0
+    
+    async def reload(self):
+        self.reloads += 1
+        await asyncio.sleep(0.01)
+        return True
+
+
+def _reload_command(command_id):
+    return AgentCommand(command_id=command_id, agent_id=AGENT_ID, command_type="reload", parameters={})
+
+
+def test_reloads_in_a_burst_share_one_reload(make_agent):
+    agent = make_agent(lambda request: httpx.Response(200))
+    agent.firewalld = FakeFirewalld()
+    
+    async def burst():
+        return await asyncio.gather(*(agent.execute_command(_reload_command(f"r{i}")) for i in range(5)))
+    
+    results = asyncio.run(burst())
+    
+    assert agent.firewalld.reloads == 1
+    assert all(result.success and result.result == {"reloaded": True} for result in results)
+
+
+def test_reload_after_the_window_runs_again(make_agent):
+    agent = make_agent(lambda request: httpx.Response(200))
+    agent.firewalld = FakeFirewalld()
+    
+    async def one_after_another():
+        await agent.execute_command(_reload_command("r1"))
+        await agent.execute_command(_reload_command("r2"))
+    
+    asyncio.run(one_after_another())
+    assert agent.firewalld.reloads == 2
+
+
+def test_cancelled_caller_does_not_cancel_shared_reload(make_agent):
+    agent = make_agent(lambda request: httpx.Response(200))
+    agent.firewalld = FakeFirewalld()
+    
+    async def cancel_one():
+        first = asyncio.ensure_future(agent.execute_command(_reload_command("r1")))
+        second = asyncio.ensure_future(agent.execute_command(_reload_command("r2")))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+    
+    result = asyncio.run(cancel_one())
+    assert result.success
+    assert agent.firewalld.reloads == 1
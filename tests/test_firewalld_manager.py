@@ -0,0 +1,163 @@
+"""Tests for FirewalldManager's parsing and zone file rendering."""
+
+import asyncio
+import xml.etree.ElementTree as StdET
+
+import pytest
+
+from agent.firewalld_manager import FirewalldManager, diff_rules
+from shared.models import (
+    FirewallAction, FirewallConfiguration, FirewallZone, FirewallZoneConfig, ForwardPortRule, PortRule
+)
+
+INFO_ZONE = """public (active)
+  target: default
+  icmp-block-inversion: no
+  interfaces: eth0 eth1
+  sources: 10.0.0.0/8
+  services: dhcpv6-client ssh
+  ports: 8080/tcp 53/udp
+  protocols: gre
+  forward: yes
+  masquerade: yes
+  forward-ports: 
+\tport=80:proto=tcp:toport=8080:toaddr=
+\tport=443:proto=tcp:toport=:toaddr=10.0.0.2
+  source-ports: 6000/udp
+  icmp-blocks: echo-request
+  rich rules: 
+\trule family="ipv4" source address="1.2.3.4" accept
+\trule service name="ftp" reject
+"""
+
+STOCK_PUBLIC = b"""<?xml version="1.0" encoding="utf-8"?>
+<zone>
+  <short>Public</short>
+  <description>For use in public areas.</description>
+  <service name="ssh"/>
+  <port port="22" protocol="tcp"/>
+  <interface name="eth0"/>
+  <forward-port port="80" protocol="tcp" to-port="8080"/>
+  <masquerade/>
+  <forward/>
+</zone>
+"""
+
+
+@pytest.fixture
+def manager(tmp_path):
+    (tmp_path / "etc").mkdir()
+    (tmp_path / "usr").mkdir()
+    return FirewalldManager(zones_dir=str(tmp_path / "etc"), default_zones_dir=str(tmp_path / "usr"))
+
+
+def test_parse_info_zone(manager):
+    config = manager._parse_info_zone("public", INFO_ZONE)
+    
+    assert config["target"] is None
+    assert config["interfaces"] == ["eth0", "eth1"]
+    assert config["sources"] == ["10.0.0.0/8"]
+    assert config["services"] == ["dhcpv6-client", "ssh"]
+    assert config["ports"] == [{"port": "8080", "protocol": "tcp"}, {"port": "53", "protocol": "udp"}]
+    assert config["protocols"] == ["gre"]
+    assert config["masquerade"] is True
+    assert [fp["port"] for fp in config["forward_ports"]] == ["80", "443"]
+    assert config["forward_ports"][1]["to_addr"] == "10.0.0.2"
+    assert config["source_ports"] == [{"port": "6000", "protocol": "udp"}]
+    assert config["icmp_blocks"] == ["echo-request"]
+    assert config["rich_rules"] == [
+        'rule family="ipv4" source address="1.2.3.4" accept',
+        'rule service name="ftp" reject',
+    ]
+
+
+def test_parse_info_zone_empty_fields(manager):
+    config = manager._parse_info_zone("block", "block\n  target: %%REJECT%%\n  services: \n  masquerade: no\n")
+    assert config["target"] == "%%REJECT%%"
+    assert config["services"] == []
+    assert config["masquerade"] is False
+    assert config["rich_rules"] == []
+
+
+def test_diff_rules_keeps_order():
+    assert diff_rules(["a", "b", "c"], ["c", "d", "a", "d"]) == (["d"], ["b"])
+
+
+def _children(xml):
+    root = StdET.fromstring(xml)
+    return root, [(child.tag, dict(child.attrib)) for child in root]
+
+
+def test_render_zone_xml_merges_existing_zone(manager, tmp_path):
+    (tmp_path / "usr" / "public.xml").write_bytes(STOCK_PUBLIC)
+    config = FirewallZoneConfig(
+        zone=FirewallZone.PUBLIC,
+        target=FirewallAction.DROP,
+        interfaces=["eth0", "eth1"],
+        services=["http"],
+        ports=[PortRule(port="443", protocol="tcp")],
+        forward_ports=[ForwardPortRule(port="8443", protocol="tcp", to_port="443")],
+    )
+    
+    root, children = _children(manager._render_zone_xml(config, manager._read_zone_file("public")))
+    
+    assert root.get("target") == "DROP"
+    # Unmodelled elements are kept
+    assert root.find("short").text == "Public"
+    assert root.find("description") is not None
+    assert ("forward", {}) in children
+    # Replaced: services, ports, masquerade
+    assert [attrs for tag, attrs in children if tag == "service"] == [{"name": "http"}]
+    assert [attrs for tag, attrs in children if tag == "port"] == [{"port": "443", "protocol": "tcp"}]
+    assert ("masquerade", {}) not in children
+    # Added to: interfaces, forward ports, without duplicates
+    assert [attrs["name"] for tag, attrs in children if tag == "interface"] == ["eth0", "eth1"]
+    assert [attrs["port"] for tag, attrs in children if tag == "forward-port"] == ["80", "8443"]
+
+
+def test_read_zone_file_prefers_local_zone_file(manager, tmp_path):
+    (tmp_path / "usr" / "public.xml").write_bytes(STOCK_PUBLIC)
+    (tmp_path / "etc" / "public.xml").write_bytes(b'<zone><short>Local</short></zone>')
+    assert manager._read_zone_file("public") == b'<zone><short>Local</short></zone>'
+
+
+def test_render_zone_xml_new_zone(manager):
+    config = FirewallZoneConfig(zone=FirewallZone.DMZ, services=["ssh"], masquerade=True)
+    assert manager._read_zone_file("dmz") is None
+    
+    root, children = _children(manager._render_zone_xml(config, None))
+    assert root.find("short").text == "dmz"
+    assert ("service", {"name": "ssh"}) in children
+    assert ("masquerade", {}) in children
+
+
+def test_apply_configuration_saves_runtime_before_reload(manager, tmp_path, monkeypatch):
+    zone_file = tmp_path / "etc" / "public.xml"
+    commands = []
+    
+    async def run_command(command, timeout=10):
+        commands.append((command[1:], zone_file.exists()))
+        return {"returncode": 0, "stdout": "", "stderr": "", "success": True}
+    
+    async def connect_dbus():
+        return False
+    
+    monkeypatch.setattr(manager, "run_command", run_command)
+    monkeypatch.setattr(manager, "_connect_dbus", connect_dbus)
+    config = FirewallConfiguration(
+        agent_id="a1",
+        zones=[FirewallZoneConfig(zone=FirewallZone.PUBLIC, services=["http"])],
+    )
+    
+    assert asyncio.run(manager.apply_configuration(config))
+    
+    # Runtime state is saved before the merged zone file is written, so
+    # the write is not overwritten and the reload keeps runtime changes
+    assert commands == [
+        (["--set-default-zone", "public"], False),
+        (["--runtime-to-permanent"], False),
+        (["--reload"], True),
+        (["--panic-off"], True),
+        (["--lockdown-off"], True),
+        (["--runtime-to-permanent"], True),
+    ]
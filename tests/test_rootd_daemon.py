@@ -0,0 +1,198 @@
+"""Tests for serving rootd clients over the Unix socket, from one or more processes."""
+
+import asyncio
+import logging
+import os
+import threading
+
+import pytest
+
+from agent.rootd.base_module import BaseModule
+from agent.rootd.daemon import RootDaemon
+from agent.rootd.protocol import (
+    HEADER_SIZE, CommandResponse, Message, MessageType, ModuleCapability, frame
+)
+
+
+class BarrierModule(BaseModule):
+    """A module whose 'wait' action blocks until `parties` calls are running at once."""
+    
+    name = "barrier"
+    version = "1.0"
+    description = "Test module"
+    
+    def __init__(self, parties: int = 1):
+        super().__init__()
+        self.barrier = threading.Barrier(parties, timeout=5)
+        self.shut_down = False
+        self.workers = 1
+        self.forked = False
+        # Written on shutdown, so a forked worker's shutdown can be seen
+        self.shutdown_marker = None
+    
+    def get_capabilities(self):
+        return [ModuleCapability(name="wait", description="Wait for the other callers", parameters=[])]
+    
+    def initialize(self):
+        return True, None
+    
+    def shutdown(self):
+        self.shut_down = True
+        if self.shutdown_marker is not None:
+            self.shutdown_marker.write_text(str(os.getpid()))
+    
+    def configure_workers(self, workers):
+        self.workers = workers
+    
+    def after_fork(self):
+        self.forked = True
+    
+    def execute_command(self, command):
+        self.barrier.wait()
+        return CommandResponse(success=True, data={"pid": os.getpid(), "forked": self.forked})
+
+
+async def request(socket_path, message_type, data, payload=None):
+    """Send one message and return the daemon's response."""
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    try:
+        if payload is None:
+            payload = Message(type=message_type, request_id="r1", data=data).to_json()
+        writer.write(frame(payload))
+        await writer.drain()
+        header = await asyncio.wait_for(reader.readexactly(HEADER_SIZE), 10)
+        body = await asyncio.wait_for(reader.readexactly(int.from_bytes(header, "big")), 10)
+        return Message.from_json(body)
+    finally:
+        writer.close()
+
+
+def execute(socket_path, action="wait"):
+    return request(socket_path, MessageType.EXECUTE_COMMAND.value,
+                   {"module": "barrier", "action": action, "parameters": {}})
+
+
+@pytest.fixture
+def make_daemon(tmp_path, monkeypatch):
+    """Build daemons listening under tmp_path, each with a BarrierModule loaded."""
+    file_handler = logging.FileHandler
+    monkeypatch.setattr(logging, "FileHandler",
+                        lambda path, delay=False: file_handler(tmp_path / "rootd.log", delay=delay))
+    daemons = []
+    
+    def make(parties=1, workers=1):
+        daemon = RootDaemon(socket_path=str(tmp_path / "rootd.sock"), workers=workers)
+        daemons.append(daemon)
+        daemon.module = BarrierModule(parties)
+        daemon.registry.register_module(daemon.module)
+        daemon._refresh_module_caches()
+        daemon._setup_socket()
+        return daemon
+    
+    yield make
+    for daemon in daemons:
+        daemon._log_listener.stop()
+
+
+def serve(daemon, client):
+    """Run the daemon's event loop until client(socket_path) returns, then stop it."""
+    async def scenario():
+        server = asyncio.ensure_future(daemon._serve())
+        while not daemon.running:
+            await asyncio.sleep(0.01)
+        try:
+            return await client(daemon.socket_path)
+        finally:
+            daemon.stop()
+            await server
+    
+    return asyncio.run(scenario())
+
+
+def test_answers_queries(make_daemon):
+    daemon = make_daemon()
+    
+    async def client(path):
+        return await asyncio.gather(
+            request(path, MessageType.PING.value, {}),
+            request(path, MessageType.LIST_MODULES.value, {}),
+            request(path, MessageType.MODULE_INFO.value, {"module": "barrier"}),
+            execute(path),
+        )
+    
+    ping, modules, info, result = serve(daemon, client)
+    
+    assert ping.data == {"pong": True}
+    assert modules.data == {"modules": ["barrier"]}
+    assert info.data["module_info"]["capabilities"][0]["name"] == "wait"
+    assert (result.type, result.data) == ("success", {"success": True, "data": {"pid": os.getpid(), "forked": False}})
+
+
+def test_blocking_commands_run_concurrently(make_daemon):
+    # Each command waits until all three are running; commands served one
+    # at a time would break the barrier instead
+    daemon = make_daemon(parties=3)
+    
+    async def client(path):
+        return await asyncio.gather(*(execute(path) for _ in range(3)))
+    
+    assert all(response.type == "success" for response in serve(daemon, client))
+
+
+def test_rejects_oversized_message(make_daemon, monkeypatch):
+    monkeypatch.setattr("agent.rootd.daemon.MAX_MESSAGE_SIZE", 16)
+    daemon = make_daemon()
+    
+    async def client(path):
+        return await request(path, None, None, payload=b'{"padding": "' + b"x" * 32 + b'"}')
+    
+    response = serve(daemon, client)
+    assert (response.type, response.data) == ("error", {"error": "Message too large"})
+
+
+def test_stop_shuts_down_modules_and_removes_socket(make_daemon):
+    daemon = make_daemon()
+    
+    async def client(path):
+        return await request(path, MessageType.PING.value, {})
+    
+    serve(daemon, client)
+    
+    assert daemon.module.shut_down
+    assert not os.path.exists(daemon.socket_path)
+
+
+def test_forked_worker_serves_the_shared_socket(make_daemon, tmp_path):
+    daemon = make_daemon(workers=2)
+    daemon.module.shutdown_marker = tmp_path / "worker-stopped"
+    daemon._fork_workers()
+    if daemon._is_worker:
+        # Serve until the parent stops this worker; never return into pytest
+        try:
+            asyncio.run(daemon._serve())
+        finally:
+            os._exit(0)
+    
+    assert daemon.module.workers == 2
+    assert not daemon.module.forked
+    workers = list(daemon._worker_pids)
+    assert len(workers) == 1
+    try:
+        # The parent does not accept here, so the worker answers
+        response = asyncio.run(execute(daemon.socket_path))
+    finally:
+        daemon._stop_workers()
+    
+    assert response.data["data"] == {"pid": workers[0], "forked": True}
+    assert daemon._worker_pids == []
+    # SIGTERM made the worker shut its modules down; only the parent
+    # removes the socket
+    assert (tmp_path / "worker-stopped").read_text() == str(workers[0])
+    assert os.path.exists(daemon.socket_path)
+
+
+def test_single_worker_does_not_fork(make_daemon):
+    daemon = make_daemon()
+    daemon._fork_workers()
+    assert daemon._worker_pids == []
+    assert daemon.module.workers == 1
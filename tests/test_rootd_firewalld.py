@@ -0,0 +1,398 @@
+"""Tests for the rootd firewalld module."""
+
+import types
+
+import pytest
+
+from agent.rootd.modules import firewalld
+from agent.rootd.protocol import CommandRequest
+
+
+class _Struct(tuple):
+    def __new__(cls, items, signature=None):
+        return super().__new__(cls, items)
+
+
+class _Array(list):
+    def __init__(self, items=(), signature=None):
+        super().__init__(items)
+
+
+class _Dictionary(dict):
+    def __init__(self, items=(), signature=None):
+        super().__init__(items)
+
+
+class _DBusException(Exception):
+    def __init__(self, message, name='org.fedoraproject.FirewallD1.Exception'):
+        super().__init__(message)
+        self.name = name
+    
+    def get_dbus_name(self):
+        return self.name
+    
+    def get_dbus_message(self):
+        return str(self)
+
+
+class FakeSystemBus:
+    """
+    Stands in for dbus-python's system bus and firewalld behind it.
+    
+    Every method call on an interface is appended to the shared `calls`
+    list as (interface, method, args, kwargs). The reply is taken from
+    `replies` by method name; an exception there is raised instead.
+    """
+    
+    def __init__(self, firewalld, private=False):
+        self.firewalld = firewalld
+        self.private = private
+        self.closed = False
+    
+    def get_object(self, bus_name, path):
+        return self, path
+    
+    def close(self):
+        self.closed = True
+
+
+class FakeInterface:
+    def __init__(self, obj, name):
+        self.bus, self.path = obj
+        self.name = name
+    
+    def __getattr__(self, method):
+        firewalld = self.bus.firewalld
+        
+        def call(*args, **kwargs):
+            firewalld.calls.append((self.name, method, args, kwargs))
+            reply = firewalld.replies.get(method)
+            if isinstance(reply, Exception):
+                raise reply
+            return reply
+        
+        return call
+
+
+def request(action, **parameters):
+    return CommandRequest(module='firewalld', action=action, parameters=parameters)
+
+
+@pytest.fixture
+def module(monkeypatch):
+    """A module whose firewall-cmd calls are recorded in module.calls and succeed."""
+    module = firewalld.FirewalldModule()
+    calls = []
+    
+    def run_command(cmd, timeout=30, binary=False):
+        calls.append(cmd)
+        return True, b'' if binary else '', ''
+    
+    monkeypatch.setattr(module, '_run_command', run_command)
+    module.calls = calls
+    yield module
+    module.shutdown()
+
+
+@pytest.fixture
+def fake_firewalld(monkeypatch):
+    """Route the module's D-Bus connections to a FakeSystemBus."""
+    fake = types.SimpleNamespace(calls=[], replies={}, buses=[])
+    
+    def system_bus(private=False):
+        bus = FakeSystemBus(fake, private)
+        fake.buses.append(bus)
+        return bus
+    
+    monkeypatch.setattr(firewalld, 'dbus', types.SimpleNamespace(
+        SystemBus=system_bus, Interface=FakeInterface, DBusException=_DBusException,
+        Struct=_Struct, Array=_Array, Dictionary=_Dictionary, Boolean=bool,
+    ))
+    return fake
+
+
+@pytest.fixture
+def no_dbus(module, monkeypatch):
+    """Make every call fall back to firewall-cmd."""
+    monkeypatch.setattr(module, '_connect_dbus', lambda: False)
+
+
+def test_several_workers_disable_query_cache(module, no_dbus):
+    module.configure_workers(4)
+    module.execute_command(request('list_zones'))
+    module.execute_command(request('list_zones'))
+    assert len(module.calls) == 2
+
+
+def test_several_workers_refuse_wait_false(module, no_dbus):
+    module.configure_workers(2)
+    
+    response = module.execute_command(request('add_service', zone='public', service='http', wait=False))
+    assert not response.success
+    assert 'wait=false' in response.error
+    assert module.calls == []
+    
+    assert module.execute_command(request('add_service', zone='public', service='http')).success
+
+
+def test_configure_workers_splits_and_replaces_pool(module):
+    old_pool = module._pool
+    module.configure_workers(4)
+    
+    assert module._pool_size == 2
+    assert module._pool is not old_pool
+    with pytest.raises(RuntimeError):
+        old_pool.submit(print)
+
+
+def test_after_fork_drops_inherited_state(module):
+    old_pool = module._pool
+    module._pending = 3
+    module.after_fork()
+    
+    assert module._pending == 0
+    assert module._pool is not old_pool
+    with pytest.raises(RuntimeError):
+        old_pool.submit(print)
+
+
+
+def test_zone_change_goes_over_dbus(module, fake_firewalld):
+    response = module.execute_command(request('add_service', zone='public', service='http'))
+    
+    assert response.success
+    assert fake_firewalld.calls == [
+        ('org.fedoraproject.FirewallD1.zone', 'addService', ('public', 'http', 0), {}),
+    ]
+    assert module.calls == []
+    # One private connection for this process
+    assert [bus.private for bus in fake_firewalld.buses] == [True]
+
+
+def test_permanent_change_goes_to_config_zone(module, fake_firewalld):
+    fake_firewalld.replies['getZoneByName'] = '/org/fedoraproject/FirewallD1/config/zone/0'
+    
+    assert module.execute_command(request('add_service', zone='public', service='http', permanent=True)).success
+    assert fake_firewalld.calls == [
+        ('org.fedoraproject.FirewallD1.config', 'getZoneByName', ('public',), {}),
+        ('org.fedoraproject.FirewallD1.config.zone', 'addService', ('http',), {}),
+    ]
+
+
+def test_firewalld_error_is_reported(module, fake_firewalld):
+    fake_firewalld.replies['addService'] = _DBusException('INVALID_SERVICE: nope')
+    
+    response = module.execute_command(request('add_service', zone='public', service='nope'))
+    assert (response.success, response.error) == (False, 'INVALID_SERVICE: nope')
+    assert module.calls == []
+
+
+def test_already_enabled_is_success(module, fake_firewalld):
+    fake_firewalld.replies['addService'] = _DBusException('ALREADY_ENABLED: http')
+    assert module.execute_command(request('add_service', zone='public', service='http')).success
+
+
+def test_bus_error_falls_back_and_reconnects(module, fake_firewalld):
+    fake_firewalld.replies['addService'] = _DBusException('no reply', name='org.freedesktop.DBus.Error.NoReply')
+    
+    assert module.execute_command(request('add_service', zone='public', service='http')).success
+    assert module.calls == [['firewall-cmd', '--zone=public', '--add-service=http']]
+    assert fake_firewalld.buses[0].closed
+    
+    del fake_firewalld.replies['addService']
+    assert module.execute_command(request('add_service', zone='public', service='ssh')).success
+    assert len(fake_firewalld.buses) == 2
+    assert len(module.calls) == 1
+
+
+def test_without_dbus_python_uses_firewall_cmd(module, monkeypatch):
+    monkeypatch.setattr(firewalld, 'dbus', None)
+    monkeypatch.setattr(firewalld, '_dbus_unavailable', True)
+    
+    assert module.execute_command(request('add_service', zone='public', service='http')).success
+    assert module.calls == [['firewall-cmd', '--zone=public', '--add-service=http']]
+
+
+def test_batch_rejects_unsupported_action(module):
+    response = module.execute_command(request('batch', operations=[{'action': 'reload'}]))
+    assert not response.success
+    assert module.calls == []
+
+
+def test_batch_validates_every_operation_first(module, no_dbus):
+    response = module.execute_command(request('batch', operations=[
+        {'action': 'add_service', 'parameters': {'zone': 'public', 'service': 'http', 'permanent': True}},
+        {'action': 'add_service', 'parameters': {'zone': 'public', 'service': 'ssh', 'permanent': True}},
+        {'action': 'add_port', 'parameters': {'zone': 'public', 'permanent': True}},
+    ]))
+    
+    assert not response.success
+    assert response.error == "Operation 2: Missing required parameter 'port' for action 'add_port'"
+    assert module.calls == []
+
+
+def test_wait_false_is_confirmed_by_sync(module, fake_firewalld):
+    fake_firewalld.replies['getDefaultZone'] = 'public'
+    
+    assert module.execute_command(request('add_service', zone='public', service='http', wait=False)).success
+    assert fake_firewalld.calls[-1] == (
+        'org.fedoraproject.FirewallD1.zone', 'addService', ('public', 'http', 0), {'ignore_reply': True},
+    )
+    
+    response = module.execute_command(request('sync'))
+    assert (response.success, response.data) == (True, {'synced': 1})
+    assert fake_firewalld.calls[-1][1] == 'getDefaultZone'
+
+
+def test_sync_without_pending_changes_makes_no_call(module, fake_firewalld):
+    response = module.execute_command(request('sync'))
+    assert (response.success, response.data) == (True, {'synced': 0})
+    assert fake_firewalld.calls == []
+
+
+def test_sync_reports_changes_lost_with_the_connection(module, fake_firewalld):
+    assert module.execute_command(request('add_service', zone='public', service='http', wait=False)).success
+    
+    # A later call finds the bus gone; the unconfirmed change went with it
+    fake_firewalld.replies['addPort'] = _DBusException('no reply', name='org.freedesktop.DBus.Error.NoReply')
+    assert module.execute_command(request('add_port', zone='public', port='443/tcp')).success
+    
+    response = module.execute_command(request('sync'))
+    assert not response.success
+    assert '1 unconfirmed change' in response.error
+    
+    # Reported once
+    assert module.execute_command(request('sync')).success
+
+
+@pytest.fixture
+def public_settings(fake_firewalld):
+    """Permanent settings of the public zone, as getSettings2 returns them."""
+    fake_firewalld.replies['getZoneByName'] = '/org/fedoraproject/FirewallD1/config/zone/0'
+    fake_firewalld.replies['getSettings2'] = {
+        'services': ['ssh'],
+        'ports': [_Struct(('22', 'tcp'))],
+        'masquerade': False,
+    }
+
+
+def _updates(fake_firewalld):
+    return [args[0] for _, method, args, _ in fake_firewalld.calls if method == 'update2']
+
+
+def test_batch_writes_permanent_zone_changes_with_one_update(module, fake_firewalld, public_settings):
+    response = module.execute_command(request('batch', operations=[
+        {'action': action, 'parameters': {'zone': 'public', 'permanent': True, **parameters}}
+        for action, parameters in [
+            ('add_service', {'service': 'http'}),
+            ('add_service', {'service': 'ssh'}),
+            ('remove_service', {'service': 'ssh'}),
+            ('add_port', {'port': '443/tcp'}),
+            ('remove_port', {'port': '22/tcp'}),
+            ('add_masquerade', {}),
+        ]
+    ]))
+    
+    assert response.success
+    assert response.data['applied'] == 6
+    assert _updates(fake_firewalld) == [{
+        'services': ['http'],
+        'ports': [('443', 'tcp')],
+        'masquerade': True,
+    }]
+    assert module.calls == []
+
+
+def test_settings_update_error_fails_the_group(module, fake_firewalld, public_settings):
+    fake_firewalld.replies['update2'] = _DBusException('INVALID_SERVICE: nope')
+    
+    outcome = module._update_zone_settings('public', [
+        request('add_service', zone='public', service='nope', permanent=True),
+        request('add_service', zone='public', service='http', permanent=True),
+    ])
+    assert outcome == (False, 'INVALID_SERVICE: nope')
+
+
+def test_settings_update_needs_dbus(module, no_dbus):
+    assert module._update_zone_settings('public', [
+        request('add_service', zone='public', service='http', permanent=True),
+    ]) is None
+
+
+def test_queries_are_cached_until_invalidated(module, no_dbus):
+    module.execute_command(request('list_zones'))
+    module.execute_command(request('list_zones'))
+    assert len(module.calls) == 1
+    
+    module.execute_command(request('new_zone', zone='lab', permanent=True))
+    module.execute_command(request('list_zones'))
+    assert module.calls[-1] == ['firewall-cmd', '--get-zones']
+    assert len(module.calls) == 3
+
+
+def test_failed_queries_are_not_cached(module, no_dbus, monkeypatch):
+    monkeypatch.setattr(module, '_run_command', lambda cmd, timeout=30, binary=False: (False, b'', 'not running'))
+    assert not module.execute_command(request('get_default_zone')).success
+    
+    monkeypatch.setattr(module, '_run_command', lambda cmd, timeout=30, binary=False: (True, 'public\n', ''))
+    assert module.execute_command(request('get_default_zone')).data == {'default_zone': 'public'}
+
+
+@pytest.mark.parametrize('action', ['start_service', 'stop_service', 'restart_service', 'reload'])
+def test_service_changes_clear_cached_queries(module, no_dbus, monkeypatch, action):
+    # Use systemctl even where dbus-python is installed
+    monkeypatch.setattr(module, '_systemd', lambda call: None)
+    module.execute_command(request('get_default_zone'))
+    module.execute_command(request(action))
+    calls = len(module.calls)
+    
+    module.execute_command(request('get_default_zone'))
+    assert len(module.calls) == calls + 1
+
+
+def test_settings_edits_maps_operations(module):
+    edits = module._settings_edits([
+        request('add_service', zone='public', service='http'),
+        request('remove_port', zone='public', port='8080/tcp'),
+        request('add_masquerade', zone='public'),
+    ])
+    assert edits == [
+        ('add_service', 'services', 'http', True),
+        ('remove_port', 'ports', '8080/tcp', False),
+        ('add_masquerade', 'masquerade', None, True),
+    ]
+
+
+@pytest.mark.parametrize('bad', [
+    request('add_port', zone='public', port='8080'),
+    request('add_service', zone='public'),
+    request('change_interface', zone='public', interface='eth0'),
+])
+def test_settings_edits_rejects_group(module, bad):
+    assert module._settings_edits([request('add_service', zone='public', service='http'), bad]) is None
+
+
+def test_batch_without_dbus_runs_one_firewall_cmd_per_group(module, no_dbus):
+    response = module.execute_command(request('batch', operations=[
+        {'action': 'add_service', 'parameters': {'zone': 'public', 'service': 'http'}},
+        {'action': 'add_port', 'parameters': {'zone': 'public', 'port': '8080/tcp'}},
+        {'action': 'add_service', 'parameters': {'zone': 'dmz', 'service': 'ssh', 'permanent': True}},
+    ]))
+    
+    assert response.success
+    assert sorted(module.calls) == sorted([
+        ['firewall-cmd', '--zone=public', '--add-service=http', '--add-port=8080/tcp'],
+        ['firewall-cmd', '--zone=dmz', '--add-service=ssh', '--permanent'],
+    ])
+
+
+def test_batch_group_failure_is_reported_per_operation(module, no_dbus, monkeypatch):
+    monkeypatch.setattr(module, '_run_command', lambda cmd, timeout=30, binary=False: (False, '', 'INVALID_PORT'))
+    response = module.execute_command(request('batch', operations=[
+        {'action': 'add_service', 'parameters': {'zone': 'public', 'service': 'http'}},
+        {'action': 'add_port', 'parameters': {'zone': 'public', 'port': '8080/tcp'}},
+    ]))
+    
+    assert not response.success
+    assert response.data['failed'] == 2
+    assert [result['error'] for result in response.data['results']] == ['INVALID_PORT', 'INVALID_PORT']
@@ -0,0 +1,41 @@
+"""Tests for the rootd wire protocol helpers."""
+
+import json
+
+import pytest
+
+from agent.rootd.protocol import HEADER_SIZE, Message, MessageType, _loads, frame
+
+
+def test_frame_prefixes_big_endian_length():
+    payload = b'{"type":"ping"}'
+    framed = frame(payload)
+    assert framed[:HEADER_SIZE] == len(payload).to_bytes(HEADER_SIZE, 'big')
+    assert framed[HEADER_SIZE:] == payload
+
+
+def test_frame_empty_payload():
+    assert frame(b'') == b'\x00' * HEADER_SIZE
+
+
+@pytest.mark.parametrize('data', [b'{"a": [1, 2]}', bytearray(b'{"a": [1, 2]}'), '{"a": [1, 2]}'])
+def test_loads_accepts_bytes_bytearray_and_str(data):
+    assert _loads(data) == {'a': [1, 2]}
+
+
+def test_loads_raises_json_decode_error():
+    with pytest.raises(json.JSONDecodeError):
+        _loads(b'{"a": ')
+
+
+def test_encode_matches_to_json():
+    data = {'pong': True, 'nested': {'x': 'y'}}
+    message = Message(type=MessageType.SUCCESS.value, request_id='r1', data=data)
+    encoded = Message.encode(MessageType.SUCCESS.value, 'r1', Message.encode_data(data))
+    assert _loads(encoded) == _loads(message.to_json())
+
+
+def test_message_round_trip():
+    message = Message(type=MessageType.PING.value, request_id='abc', data={'k': 'v'})
+    decoded = Message.from_json(message.to_json())
+    assert (decoded.type, decoded.request_id, decoded.data) == ('ping', 'abc', {'k': 'v'})